@@ -1,4 +1,20 @@
 from .plot_widget import SignalPlotWidget
 from .plot_controler import PlotController
 from .datapool_viewer import DataPoolViewerWidget, DataPoolNotifier
-from .datapool_visualizer import DatapoolVisualizer
\ No newline at end of file
+from .datapool_visualizer import DatapoolVisualizer
+from .lod_cache import LodCache, MinMaxPyramid
+from .signal_source import SignalSource
+from .render_worker import DecimationTask, DecimationResult
+from .render_scheduler import RenderScheduler
+from .tile_cache import TileCache
+from .limit_curves import LimitCurveCache
+from .waterfall import WaterfallBuffer
+from .fft_playback import FFTSequence, PlaybackClock
+from .scope import ScopeTrace
+from .pool_events import PoolEvent
+from .datapool_model import DataPoolTreeModel
+from .registry_index import RegistryIndex
+from .data_resolver import DataObjectResolver
+from .search_index import SearchIndex
+from .instrumentation import RenderStats, enable_instrumentation, span
+from .legend_model import CurveLegendModel
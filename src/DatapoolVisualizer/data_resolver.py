@@ -0,0 +1,89 @@
+from src.DatapoolVisualizer.pool_events import PoolEvent
+
+
+class DataHandle:
+    """
+    Data object of a pool entry, with its immutable type and name.
+
+    The sample count and X axis are read from the data object itself: a signal being acquired grows without any
+    pool event (see the scope mode), so a cached copy would go stale.
+    """
+
+    def __init__(self, data_object):
+        self.data_object = data_object
+        self.data_type = data_object.data_type
+        self.data_name = data_object.data_name
+
+
+class DataObjectResolver:
+    """
+    Cache of ``data_id -> DataHandle`` in front of ``DataPool.get_data_info``.
+
+    The pool keeps the same data object for the whole life of a data, so a data is looked up in the registry only
+    once. ``apply_events`` keeps the cache in line with the pool: removed data is dropped, stored data is looked up
+    again, and locked data raises ``PermissionError`` like ``get_data_info`` until it is unlocked.
+    """
+
+    def __init__(self, data_pool):
+        self.data_pool = data_pool
+        self.handles = {}
+        self.locked = set()
+        self.hits = 0
+        self.misses = 0
+
+    def handle(self, data_id):
+        if data_id in self.locked:
+            raise PermissionError(f"Data {data_id} is locked and cannot be read.")
+        handle = self.handles.get(data_id)
+        if handle is not None:
+            self.hits += 1
+            return handle
+        self.misses += 1
+        handle = DataHandle(self.data_pool.get_data_info(data_id)['data_object'].iloc[0])
+        self.handles[data_id] = handle
+        return handle
+
+    def handle_many(self, data_ids):
+        """
+        Return ``{data_id: DataHandle}`` for ``data_ids``, looking up all the uncached data in one registry scan.
+
+        :raises PermissionError: If one of the data is locked.
+        """
+        loaded = {}
+        missing = [data_id for data_id in data_ids if data_id not in self.handles and data_id not in self.locked]
+        if missing:
+            pool = self.data_pool
+            sources = pool.source_to_data[pool.source_to_data['data_id'].isin(missing)]
+            locked = set(sources.loc[sources['locked'].astype(bool), 'data_id'])
+            rows = pool.data_registry[pool.data_registry['data_id'].isin(missing)]
+            for data_id, data_object in zip(rows['data_id'], rows['data_object']):
+                if data_id not in locked:
+                    loaded[data_id] = self.handles[data_id] = DataHandle(data_object)
+            self.misses += len(loaded)
+        # Données en cache, verrouillées ou absentes du registre : handle() compte le succès ou lève la même erreur
+        # que get_data_info
+        return {data_id: loaded[data_id] if data_id in loaded else self.handle(data_id) for data_id in data_ids}
+
+    def data_object(self, data_id):
+        return self.handle(data_id).data_object
+
+    def invalidate(self, data_id=None):
+        """Forget ``data_id``, or every data when it is None."""
+        if data_id is None:
+            self.handles.clear()
+            self.locked.clear()
+        else:
+            self.handles.pop(data_id, None)
+            self.locked.discard(data_id)
+
+    def apply_events(self, events):
+        """Update the cache from the ``PoolEvent`` flushed by a ``DataPoolNotifier``."""
+        for event in events:
+            if event.kind in (PoolEvent.REGISTERED, PoolEvent.REMOVED):
+                self.invalidate(event.data_id)
+            elif event.kind == PoolEvent.LOCKED:
+                self.locked.add(event.data_id)
+            elif event.kind in (PoolEvent.UNLOCKED, PoolEvent.STORED):
+                # Nouveau contenu : donnée relue dans le registre
+                self.locked.discard(event.data_id)
+                self.handles.pop(event.data_id, None)
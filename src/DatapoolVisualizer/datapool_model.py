@@ -0,0 +1,278 @@
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+
+def source_text(source_id):
+    return f"Source ID: {source_id}"
+
+
+def data_text(data_name, data_id, data_type, storage_type, locked, protected):
+    return f"Data Name: {data_name} (ID: {data_id},Type: {data_type}, Storage: {storage_type}, " \
+           f"Locked: {locked}, Protected: {protected})"
+
+
+def subscriber_text(subscriber_id, acquitted):
+    acquitted_status = "✔" if acquitted else "✘"
+    return f"Subscriber ID: {subscriber_id} - Ack: {acquitted_status}"
+
+
+def data_entry(index, data_id):
+    """
+    Describe one data of a ``RegistryIndex`` as ``(source_id, data text, {(subscriber_id, n): subscriber text})``,
+    with one subscriber row per subscription: ``n`` numbers the subscriptions of a same subscriber.
+    """
+    row = index.data_rows[data_id]
+    source = index.source_rows.get(data_id, {'source_id': None, 'locked': False, 'protected': False})
+    subscribers = {(subscriber_id, n): subscriber_text(subscriber_id, acquitted)
+                   for subscriber_id, acks in index.subscribers.get(data_id, {}).items()
+                   for n, acquitted in enumerate(acks)}
+    return source['source_id'], data_text(row['data_name'], data_id, row['data_type'], row['storage_type'],
+                                          source['locked'], source['protected']), subscribers
+
+
+def registry_snapshot(index):
+    """
+    Describe the whole pool as ``{data_id: (source_id, data text, {(subscriber_id, n): subscriber text})}``.
+
+    :param index: ``RegistryIndex`` of the pool.
+    """
+    return {data_id: data_entry(index, data_id) for data_id in index.data_rows}
+
+
+class TreeNode:
+    """One row of ``DataPoolTreeModel``: the root, a source, a data or a subscriber."""
+
+    def __init__(self, key, text, parent=None, data_id=None):
+        self.key = key
+        self.text = text
+        self.parent = parent
+        self.data_id = data_id
+        self.children = []
+        self.rows = {}  # clé de l'enfant -> ligne
+        self.fetched = 0  # nombre d'enfants déjà exposés aux vues (fetchMore)
+        self.opened = False  # fetchMore déjà appelé : les vues suivent ce noeud
+        # Enfants pas encore créés, jusqu'au premier fetchMore : {data_id: (texte, abonnés)} sous une source,
+        # {clé: texte} sous une donnée
+        self.pending = None
+
+    def child(self, key):
+        row = self.rows.get(key)
+        return None if row is None else self.children[row]
+
+
+class DataPoolTreeModel(QAbstractItemModel):
+    """
+    Source -> data -> subscribers tree of a DataPool.
+
+    Nodes are indexed by key at every level (and data nodes by data_id), so a single changed entity is located in
+    O(1) and reported with fine-grained ``rowsInserted``/``rowsRemoved``/``dataChanged`` signals: the view keeps its
+    expansion state and selection instead of being reset.
+
+    Children are created and exposed lazily, ``page_size`` rows at a time, through ``canFetchMore``/``fetchMore``:
+    the data rows of a source and the subscriber rows of a data are only kept as entries until it is expanded, and
+    changes to rows not fetched yet emit nothing. ``data_nodes`` only holds the data rows created so far.
+    """
+    DataIdRole = Qt.UserRole + 1
+    PAGE_SIZE = 500
+
+    def __init__(self, parent=None, page_size=PAGE_SIZE):
+        super().__init__(parent)
+        self.page_size = max(1, page_size)
+        self.root = TreeNode(None, None)
+        self.data_nodes = {}  # data_id -> TreeNode
+        self.entries = {}  # data_id -> (source_id, texte, abonnés) appliqués en dernier
+
+    # --- QAbstractItemModel ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        parent_node = parent.internalPointer() if parent.isValid() else self.root
+        if column != 0 or not 0 <= row < parent_node.fetched:
+            return QModelIndex()
+        return self.createIndex(row, 0, parent_node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.node_index(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = parent.internalPointer() if parent.isValid() else self.root
+        return node.fetched
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return False
+        node = parent.internalPointer() if parent.isValid() else self.root
+        return bool(node.children or node.pending)
+
+    def canFetchMore(self, parent):
+        if parent.column() > 0:
+            return False
+        node = parent.internalPointer() if parent.isValid() else self.root
+        return node.fetched < len(node.children) or bool(node.pending)
+
+    def fetchMore(self, parent):
+        """Expose the next ``page_size`` children of ``parent``."""
+        node = parent.internalPointer() if parent.isValid() else self.root
+        if not node.opened:
+            node.opened = True
+            for key, value in (node.pending or {}).items():
+                if node.parent is self.root:
+                    # Source dépliée : création de ses données, dont les abonnés restent en attente
+                    text, subscribers = value
+                    child = TreeNode(key, text, node, data_id=key)
+                    child.pending = subscribers
+                    self.data_nodes[key] = child
+                else:
+                    child = TreeNode(key, value, node)
+                node.rows[key] = len(node.children)
+                node.children.append(child)
+            node.pending = None
+        count = min(self.page_size, len(node.children) - node.fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, node.fetched, node.fetched + count - 1)
+        node.fetched += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.text
+        if role == self.DataIdRole:
+            return node.data_id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return 'Source -> Data -> Subscribers'
+        return None
+
+    # --- Mises à jour ---
+
+    def node_index(self, node):
+        if node is None or node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.parent.rows[node.key], 0, node)
+
+    def is_fetched(self, node):
+        """True when ``node`` and all its ancestors are exposed to the views."""
+        while node is not self.root:
+            if node.parent.rows[node.key] >= node.parent.fetched:
+                return False
+            node = node.parent
+        return True
+
+    def _set_child(self, parent_node, key, text, data_id=None):
+        node = parent_node.child(key)
+        if node is not None:
+            if node.text != text:
+                node.text = text
+                if self.is_fetched(node):
+                    index = self.node_index(node)
+                    self.dataChanged.emit(index, index, [Qt.DisplayRole])
+            return node
+        row = len(parent_node.children)
+        # Une ligne n'est annoncée que sous un parent déjà ouvert dont toutes les lignes sont exposées, sinon elle
+        # attend le prochain fetchMore
+        visible = parent_node.opened and parent_node.fetched == row and self.is_fetched(parent_node)
+        if visible:
+            self.beginInsertRows(self.node_index(parent_node), row, row)
+        node = TreeNode(key, text, parent_node, data_id)
+        parent_node.children.append(node)
+        parent_node.rows[key] = row
+        if visible:
+            parent_node.fetched += 1
+            self.endInsertRows()
+        return node
+
+    def _remove_child(self, parent_node, key):
+        row = parent_node.rows.get(key)
+        if row is None:
+            return
+        fetched = row < parent_node.fetched
+        visible = fetched and self.is_fetched(parent_node)
+        if visible:
+            self.beginRemoveRows(self.node_index(parent_node), row, row)
+        del parent_node.children[row]
+        del parent_node.rows[key]
+        for shifted in parent_node.children[row:]:
+            parent_node.rows[shifted.key] -= 1
+        if fetched:
+            parent_node.fetched -= 1
+        if visible:
+            self.endRemoveRows()
+
+    def set_data_entry(self, data_id, source_id, text, subscribers):
+        """
+        Insert or update one data row and its subscribers.
+
+        :param subscribers: ``{(subscriber_id, n): subscriber text}``, see ``data_entry``
+        """
+        entry = (source_id, text, subscribers)
+        if self.entries.get(data_id) == entry:
+            return
+        previous = self.entries.get(data_id)
+        if previous is not None and previous[0] != source_id:
+            self.remove_data_entry(data_id)
+        self.entries[data_id] = entry
+        source_node = self._set_child(self.root, source_id, source_text(source_id))
+        if not source_node.opened:
+            # Donnée créée seulement quand sa source est dépliée
+            if source_node.pending is None:
+                source_node.pending = {}
+            source_node.pending[data_id] = (text, subscribers)
+            return
+        node = self._set_child(source_node, data_id, text, data_id)
+        self.data_nodes[data_id] = node
+        if not node.opened:
+            # Abonnés créés seulement quand la donnée est dépliée
+            node.pending = subscribers
+            return
+        for key in [child.key for child in node.children if child.key not in subscribers]:
+            self._remove_child(node, key)
+        for key, subscriber_label in subscribers.items():
+            self._set_child(node, key, subscriber_label)
+
+    def remove_data_entry(self, data_id):
+        """Remove one data row, and its source row once it has no data left."""
+        entry = self.entries.pop(data_id, None)
+        node = self.data_nodes.pop(data_id, None)
+        if node is not None:
+            source_node = node.parent
+            self._remove_child(source_node, data_id)
+        elif entry is not None:
+            # Donnée d'une source jamais dépliée
+            source_node = self.root.child(entry[0])
+            if source_node is None or not source_node.pending:
+                return
+            source_node.pending.pop(data_id, None)
+        else:
+            return
+        if not source_node.children and not source_node.pending:
+            self._remove_child(self.root, source_node.key)
+
+    def reset(self, snapshot):
+        """Replace the whole tree by ``snapshot`` with a single model reset, cheaper than a diff touching most rows."""
+        self.beginResetModel()
+        self.root = TreeNode(None, None)
+        self.data_nodes = {}
+        self.entries = {}
+        for data_id, entry in snapshot.items():
+            self.set_data_entry(data_id, *entry)
+        self.endResetModel()
+
+    def refresh(self, snapshot):
+        """Bring the tree to ``snapshot`` (see ``registry_snapshot``), emitting signals for the changed rows only."""
+        for data_id in [data_id for data_id in self.entries if data_id not in snapshot]:
+            self.remove_data_entry(data_id)
+        for data_id, entry in snapshot.items():
+            if self.entries.get(data_id) != entry:
+                self.set_data_entry(data_id, *entry)
+
@@ -1,136 +1,197 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTreeView
-from PySide6.QtGui import QStandardItem, QStandardItemModel
-from PySide6.QtCore import QObject, Signal
+import inspect
+import time
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QLineEdit, QCheckBox, QLabel
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src.DatapoolVisualizer.datapool_model import DataPoolTreeModel, data_entry, registry_snapshot
+from src.DatapoolVisualizer.pool_events import PoolEvent
+from src.DatapoolVisualizer.registry_index import RegistryIndex
+from src.DatapoolVisualizer.search_index import SearchIndex
+from src.DatapoolVisualizer.instrumentation import span
 
 
 class DataPoolViewerWidget(QWidget):
-    def __init__(self, data_registry, source_to_data, subscriber_to_data, parent=None):
+    # Nombre maximal de résultats de recherche affichés, et de sources dépliées automatiquement
+    RESULT_LIMIT = 1000
+    EXPAND_LIMIT = 20
+
+    def __init__(self, data_registry, source_to_data, subscriber_to_data, parent=None,
+                 page_size=DataPoolTreeModel.PAGE_SIZE):
         super().__init__(parent)
 
         # Création du layout principal
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
+        # Recherche par nom, ID, type ou source
+        search_layout = QHBoxLayout()
+        self.layout.addLayout(search_layout)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search name, ID, type or source")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.apply_search)
+        search_layout.addWidget(self.search_edit)
+        self.prefix_check = QCheckBox("Prefix")
+        self.prefix_check.toggled.connect(lambda _: self.apply_search())
+        search_layout.addWidget(self.prefix_check)
+        self.search_label = QLabel()
+        search_layout.addWidget(self.search_label)
+
         # Création du TreeView pour afficher les données du DataPool
         self.tree_view = QTreeView()
         self.layout.addWidget(self.tree_view)
 
-        # Création du modèle pour le TreeView
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(['Source -> Data -> Subscribers'])
+        # Modèle incrémental : seules les lignes modifiées sont signalées à la vue, les enfants sont chargés par pages
+        # à l'ouverture de leur parent
+        self.model = DataPoolTreeModel(page_size=page_size)
+        self.registry_index = RegistryIndex()
+        self.search_index = SearchIndex()
+        # Arbre des résultats de recherche, mis à jour par différence à chaque frappe
+        self.results_model = DataPoolTreeModel(page_size=page_size)
         self.tree_view.setHeaderHidden(True)
+        # Lignes d'une seule ligne de texte : la vue n'a pas à mesurer chaque ligne
+        self.tree_view.setUniformRowHeights(True)
 
         # Appel à la méthode pour remplir le TreeView avec les registres
         self.populate_tree_view(data_registry, source_to_data, subscriber_to_data)
 
-        # Associer le modèle au TreeView
+        # Associer le modèle au TreeView (remplacé par l'arbre des résultats pendant une recherche)
         self.tree_view.setModel(self.model)
-        self.tree_view.expandAll()
 
     def populate_tree_view(self, data_registry, source_to_data, subscriber_to_data):
         """
-        Remplit le TreeView avec toutes les colonnes des registres.
+        Met à jour le TreeView à partir des registres, sans reconstruire les lignes inchangées.
         """
-        # vider le modèle
-        self.model.clear()
-        # Parcourir les sources
-        source_item = None
-        for _, source_row in source_to_data.iterrows():
-            source_id = source_row['source_id']
-            locked = source_row['locked']
-            protected = source_row['protected']
-            source_item = QStandardItem(f"Source ID: {source_id} (Locked: {locked}, Protected: {protected})")
-
-            # Trouver les données associées à cette source
-            data_rows = data_registry[data_registry['data_id'].isin(
-                source_to_data[source_to_data['source_id'] == source_id]['data_id'].values
-            )]
-
-            for _, data_row in data_rows.iterrows():
-                data_name = data_row['data_name']
-                data_id = data_row['data_id']
-                data_type = data_row['data_type']
-                storage_type = data_row['storage_type']
-                data_item = QStandardItem(f"Data Name: {data_name} (ID: {data_id},Type: {data_type}, Storage: {storage_type})")
-
-                # Ajouter les abonnés pour cette donnée
-                subscriber_rows = subscriber_to_data[subscriber_to_data['data_id'] == data_id]
-                for _, subscriber_row in subscriber_rows.iterrows():
-                    subscriber_id = subscriber_row['subscriber_id']
-                    acquitted = subscriber_row['acquitements']
-                    acquitted_status = "✔" if acquitted else "✘"
-                    subscriber_item = QStandardItem(f"Subscriber ID: {subscriber_id} - Ack: {acquitted_status}")
-                    data_item.appendRow(subscriber_item)
-
-                # Ajouter la donnée comme sous-élément de la source
-                source_item.appendRow(data_item)
-
-            # Ajouter la source à l'arborescence principale si son ID n'est pas déjà présent
-            if source_item is not None:
-                #contracter le treeview
-                self.tree_view.collapseAll()
-                if self.model.rowCount() == 0:
-                    self.model.appendRow(source_item)
-                else:
-                    sources = []
-                    #recuperer les la liste des sources dans le model
-
-                    for row in range(self.model.rowCount()):
-                        item = self.model.item(row)
-
-                    sources.append(item)
-                    # itterate over all sources and check if the source_id is in the text of any source
-                    for source in sources:
-                        if source is not None:
-                            if source_id not in source.text():
-                                print(f"source_id: {source_id} NOT in source.text(): {source.text()}")
-                                self.model.appendRow(source_item)
-                            else:
-                                print(f"source_id: {source_id} IS in source.text(): {source.text()}")
-                                # La source existe déjà, il faut la remplacer
-
-                                for row in range(self.model.rowCount()):
-                                    item :QStandardItem = self.model.item(row)
-                                    if item is not None:
-                                        if source_id in item.text():
-                                            print(f"removing item: {item.text()}")
-                                            #supprimer l'élément existant
-                                            self.model.removeRow(row)
-
-                                    #ajouter le nouvel élément
-                                    self.model.appendRow(source_item)
+        with span('tree.refresh', data=len(data_registry)):
+            self.registry_index.rebuild(data_registry, source_to_data, subscriber_to_data)
+            self.search_index.rebuild(self.registry_index)
+            self.model.refresh(registry_snapshot(self.registry_index))
+        self.apply_search()
+
+    def apply_events(self, pool, events):
+        """
+        Apply the ``PoolEvent`` flushed by a ``DataPoolNotifier`` to the tree, touching only the changed data rows.
+        """
+        with span('tree.events', events=len(events)):
+            data_ids = list(dict.fromkeys(event.data_id for event in events))
+            rebuilt = self.registry_index.apply_events(pool, events) is None
+            # Recherche mise à jour par donnée, même quand l'index des registres a été reconstruit
+            self.search_index.update(self.registry_index, data_ids)
+            if rebuilt:
+                # Index reconstruit : réconciliation complète de l'arbre
+                self.model.refresh(registry_snapshot(self.registry_index))
+            else:
+                for data_id in data_ids:
+                    if data_id in self.registry_index.data_rows:
+                        self.model.set_data_entry(data_id, *data_entry(self.registry_index, data_id))
+                    else:
+                        self.model.remove_data_entry(data_id)
+        if self.search_edit.text().strip():
+            self.apply_search(keep_rows=True)
+
+    def apply_search(self, text=None, keep_rows=False):
+        """
+        Show the data matching the search box, at most ``RESULT_LIMIT`` of them, instead of the whole tree.
+
+        :param keep_rows: Update the previous results in place (pool change) instead of replacing them (new query).
+        """
+        query = self.search_edit.text() if text is None else text
+        if not query.strip():
+            self.search_label.clear()
+            if self.tree_view.model() is not self.model:
+                self.tree_view.setModel(self.model)
+            return
+        with span('tree.search', query=query) as timing:
+            matches = self.search_index.search(query, prefix=self.prefix_check.isChecked())
+            snapshot = {data_id: data_entry(self.registry_index, data_id) for data_id in matches[:self.RESULT_LIMIT]}
+            if keep_rows:
+                self.results_model.refresh(snapshot)
+            else:
+                self.results_model.reset(snapshot)
+            timing.add(matches=len(matches))
+        if len(matches) > self.RESULT_LIMIT:
+            self.search_label.setText(f"{len(matches)} results, first {self.RESULT_LIMIT} shown")
+        else:
+            self.search_label.setText(f"{len(matches)} result(s)")
+        if self.tree_view.model() is not self.results_model:
+            self.tree_view.setModel(self.results_model)
+        if self.results_model.rowCount() <= self.EXPAND_LIMIT:
+            for row in range(self.results_model.rowCount()):
+                self.tree_view.expand(self.results_model.index(row, 0))
 
 
 class DataPoolNotifier(QObject):
-    data_changed = Signal()
+    """
+    Report the changes made to a DataPool as typed ``PoolEvent``, coalesced and flushed at a bounded rate.
 
-    def __init__(self):
-        super().__init__()
+    Events are accumulated in a dirty set (identical events are merged at the position of the latest one, so that
+    applying them in order yields the final state) and flushed at most ``max_rate_hz`` times per second: the first
+    change after an idle period is flushed on the next event loop iteration, a burst of changes is delivered in a
+    single flush. ``events_flushed`` carries the events in arrival order, ``data_changed`` is still emitted once per
+    flush for consumers that simply refresh.
+
+    The pool is expected to be modified from the GUI thread.
+    """
+    data_changed = Signal()
+    events_flushed = Signal(list)  # [PoolEvent]
+
+    # Méthode du DataPool -> type d'événement produit
+    WRAPPED_METHODS = {
+        'register_data': PoolEvent.REGISTERED,
+        'store_data': PoolEvent.STORED,
+        'add_subscriber': PoolEvent.SUBSCRIBED,
+        'acknowledge_data': PoolEvent.ACKNOWLEDGED,
+        'lock_data': PoolEvent.LOCKED,
+        'unlock_data': PoolEvent.UNLOCKED,
+        'delete_data': PoolEvent.REMOVED,
+        '_release_data': PoolEvent.REMOVED,
+    }
+
+    def __init__(self, max_rate_hz=20, parent=None):
+        super().__init__(parent)
+        self.min_interval_ms = 1000 / max_rate_hz
+        self.pending = {}  # PoolEvent -> None, dict pour garder l'ordre d'arrivée
+        self.last_flush = 0.0
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush)
 
     def attach_to_pool(self, pool):
         """
         Injecte le comportement de signal dans les méthodes du DataPool.
         """
-        original_register_data = pool.register_data
-        original_store_data = pool.store_data
-        original_add_subscriber = pool.add_subscriber
-
-        def wrapped_register_data(*args, **kwargs):
-            result = original_register_data(*args, **kwargs)
-            self.data_changed.emit()
+        for method_name, kind in self.WRAPPED_METHODS.items():
+            setattr(pool, method_name, self._wrap(pool, getattr(pool, method_name), kind))
+
+    def _wrap(self, pool, method, kind):
+        signature = inspect.signature(method)
+
+        def wrapped(*args, **kwargs):
+            result = method(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs).arguments
+            data_id = result if kind == PoolEvent.REGISTERED else arguments['data_id']
+            if kind == PoolEvent.REMOVED and data_id in pool.data_registry['data_id'].values:
+                # Donnée protégée : delete_data ne l'a pas supprimée
+                return result
+            self.post(PoolEvent(kind, data_id, arguments.get('source_id'), arguments.get('subscriber_id')))
             return result
 
-        def wrapped_store_data(*args, **kwargs):
-            result = original_store_data(*args, **kwargs)
+        return wrapped
+
+    def post(self, event):
+        """Add ``event`` to the dirty set and schedule a flush within the rate limit."""
+        self.pending.pop(event, None)
+        self.pending[event] = None
+        if not self.flush_timer.isActive():
+            elapsed_ms = (time.perf_counter() - self.last_flush) * 1000
+            self.flush_timer.start(max(0, int(self.min_interval_ms - elapsed_ms)))
+
+    def flush(self):
+        """Deliver the pending events right away."""
+        self.flush_timer.stop()
+        events, self.pending = list(self.pending), {}
+        self.last_flush = time.perf_counter()
+        if events:
+            self.events_flushed.emit(events)
             self.data_changed.emit()
-            return result
-
-        def wrapped_add_subscriber(*args, **kwargs):
-            result = original_add_subscriber(*args, **kwargs)
-            self.data_changed.emit()
-            return result
-
-        # Redéfinir les méthodes du DataPool (monkey patching)
-        pool.register_data = wrapped_register_data
-        pool.store_data = wrapped_store_data
-        pool.add_subscriber = wrapped_add_subscriber
@@ -2,10 +2,11 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QSplitter
 from PyDataCore import Data_Type
 from src.DatapoolVisualizer.plot_controler import PlotController
 from src.DatapoolVisualizer.datapool_viewer import DataPoolViewerWidget
+from src.DatapoolVisualizer.datapool_model import DataPoolTreeModel
 
 
 class DatapoolVisualizer(QWidget):
-    def __init__(self, data_pool, parent=None):
+    def __init__(self, data_pool, parent=None, notifier=None):
         super().__init__(parent)
         self.data_pool = data_pool
 
@@ -34,21 +35,26 @@ class DatapoolVisualizer(QWidget):
         # Connecter l'événement de sélection d'une donnée dans le DataPoolViewerWidget
         self.data_pool_viewer.tree_view.clicked.connect(self.handle_data_selection)
 
+        # Suivre les modifications du pool (DataPoolNotifier déjà attaché au pool)
+        if notifier is not None:
+            notifier.events_flushed.connect(self.handle_pool_events)
+
+    def handle_pool_events(self, events):
+        """
+        Apply the ``PoolEvent`` flushed by the notifier to the tree and to the data caches of the plots.
+        """
+        self.plot_controller.apply_pool_events(events)
+        self.data_pool_viewer.apply_events(self.data_pool, events)
+
     def handle_data_selection(self, index):
         """
         Handle data selection in DataPoolViewerWidget.
         Trigger playback for FFT data if selected.
         """
-        item = self.data_pool_viewer.tree_view.model().itemFromIndex(index)
-        if item is None:
-            return
-
-        # Extract data ID from selected item
-        item_text = item.text()
-        if "Data Name:" in item_text:
-            data_id = self.extract_data_id_from_text(item_text)
-            data_info = self.data_pool.get_data_info(data_id)
-            data_type = data_info['data_object'].iloc[0].data_type
+        # Les lignes de données portent leur data_id, les sources et les abonnés n'en ont pas
+        data_id = index.data(DataPoolTreeModel.DataIdRole)
+        if data_id is not None:
+            data_type = self.plot_controller.data_resolver.handle(data_id).data_type
 
             # Route temporal, frequency, or FFT data types to PlotController
             if data_type in [Data_Type.TEMPORAL_SIGNAL, Data_Type.FREQ_SIGNAL, Data_Type.FFTS, Data_Type.FREQ_LIMIT,data_type.TEMP_LIMIT]:
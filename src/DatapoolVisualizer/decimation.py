@@ -0,0 +1,142 @@
+import numpy as np
+
+
+def reduce_min_max(samples, block_size):
+    """
+    Reduce ``samples`` to the minimum and maximum of consecutive blocks of ``block_size`` samples.
+
+    The reduction is done with a single reshape over the full blocks; the ragged tail, if any, forms a last shorter
+    block.
+
+    :return: (block minimums, block maximums)
+    """
+    samples = np.asarray(samples)
+    block_size = max(1, int(block_size))
+    full = (len(samples) // block_size) * block_size
+    blocks = samples[:full].reshape(-1, block_size)
+    mins, maxs = blocks.min(axis=1), blocks.max(axis=1)
+    if full < len(samples):
+        tail = samples[full:]
+        mins = np.append(mins, tail.min())
+        maxs = np.append(maxs, tail.max())
+    return mins, maxs
+
+
+def interleave_min_max(x_values, mins, maxs):
+    """Interleave block minimums and maximums into a single polyline, each x value being used twice."""
+    x_data = np.repeat(np.asarray(x_values, dtype=np.float64), 2)
+    y_data = np.empty(len(x_data), dtype=np.result_type(mins, maxs, np.float32))
+    y_data[0::2], y_data[1::2] = mins, maxs
+    return x_data, y_data
+
+
+def decimate_range(samples, start_index, end_index, max_points):
+    """
+    Reduce the samples ``[start_index, end_index)`` of a signal to at most ``max_points`` min/max columns.
+
+    :param samples: Sample span already read for ``[start_index, end_index)``.
+    :return: (interleaved sample indices, interleaved min/max values)
+    """
+    visible_samples = end_index - start_index
+    block_size = max(1, visible_samples // max(1, max_points))
+    mins, maxs = reduce_min_max(samples, block_size)
+    block_starts = start_index + np.arange(len(mins), dtype=np.int64) * block_size
+    return interleave_min_max(block_starts, mins, maxs)
+
+
+def lttb(x_values, y_values, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of the polyline ``(x_values, y_values)`` to ``n_out`` points.
+
+    The first and last points are always kept; in each bucket the point forming the largest triangle with the
+    previously kept point and the average of the next bucket is selected.
+    """
+    x_values, y_values = np.asarray(x_values, dtype=np.float64), np.asarray(y_values)
+    n = len(x_values)
+    if n_out >= n or n_out < 3:
+        return x_values, y_values
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+        else:
+            next_lo, next_hi = n - 1, n
+        avg_x = x_values[next_lo:next_hi].mean()
+        avg_y = y_values[next_lo:next_hi].mean()
+        areas = np.abs((x_values[a] - avg_x) * (y_values[lo:hi] - y_values[a])
+                       - (x_values[a] - x_values[lo:hi]) * (avg_y - y_values[a]))
+        a = lo + int(np.argmax(areas))
+        kept[i + 1] = a
+    return x_values[kept], y_values[kept]
+
+
+class DecimationStrategy:
+    """
+    Turn the min/max columns of a LOD level into the polyline drawn for one curve.
+
+    :param x0: Abscissa of sample 0 of the signal.
+    :param step: Resolution of the signal (dt or df).
+    :param block_starts: Index of the first sample of each column.
+    :param block_size: Number of samples per column.
+    :param mins: Minimum of each column.
+    :param maxs: Maximum of each column.
+    :param samples: Full sample array of the signal (a memmap view for file-backed signals), used by strategies
+        that need individual samples.
+    :param columns: Number of pixel columns of the plot.
+    :return: (x_data, y_data)
+    """
+    name = None
+
+    def reduce_columns(self, x0, step, block_starts, block_size, mins, maxs, samples, columns):
+        raise NotImplementedError
+
+
+class MinMaxDecimation(DecimationStrategy):
+    """Two points per column: the minimum and the maximum, drawn at the start of the column."""
+    name = 'minmax'
+
+    def reduce_columns(self, x0, step, block_starts, block_size, mins, maxs, samples, columns):
+        return interleave_min_max(x0 + block_starts * step, mins, maxs)
+
+
+class M4Decimation(DecimationStrategy):
+    """
+    M4 aggregation: first, minimum, maximum and last sample of each column.
+
+    With one column per pixel the rasterized line is identical to the one drawn from every sample, including the
+    segments joining consecutive columns.
+    """
+    name = 'm4'
+
+    def reduce_columns(self, x0, step, block_starts, block_size, mins, maxs, samples, columns):
+        if len(block_starts) == 0:
+            return np.empty(0), np.empty(0)
+        block_ends = np.minimum(block_starts + block_size, len(samples)) - 1
+        x_indices = np.empty(4 * len(block_starts), dtype=np.float64)
+        x_indices[0::4] = block_starts
+        x_indices[1::4] = x_indices[2::4] = (block_starts + block_ends) / 2
+        x_indices[3::4] = block_ends
+        y_data = np.empty(len(x_indices), dtype=np.result_type(mins, maxs, np.float32))
+        y_data[0::4] = samples[block_starts]
+        y_data[1::4], y_data[2::4] = mins, maxs
+        y_data[3::4] = samples[block_ends]
+        return x0 + x_indices * step, y_data
+
+
+class LTTBDecimation(DecimationStrategy):
+    """Largest-Triangle-Three-Buckets over the M4 points, one point per pixel column."""
+    name = 'lttb'
+
+    def reduce_columns(self, x0, step, block_starts, block_size, mins, maxs, samples, columns):
+        x_data, y_data = M4Decimation().reduce_columns(x0, step, block_starts, block_size, mins, maxs, samples,
+                                                       columns)
+        return lttb(x_data, y_data, columns)
+
+
+DECIMATION_STRATEGIES = {strategy.name: strategy for strategy in
+                         (MinMaxDecimation(), M4Decimation(), LTTBDecimation())}
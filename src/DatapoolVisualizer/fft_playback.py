@@ -0,0 +1,284 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QTimer
+
+from src.DatapoolVisualizer.decimation import reduce_min_max
+
+logger = logging.getLogger(__name__)
+
+
+class FFTSequence:
+    """
+    Frames of an FFTS resolved once from the pool, with their timestamps and the frequency axis they share.
+
+    Frames without usable timestamps (all left at 0, or not increasing) are spaced by ``DEFAULT_FRAME_PERIOD``.
+    """
+
+    DEFAULT_FRAME_PERIOD = 0.1  # s, la période de l'ancienne animation à 100 ms
+
+    def __init__(self, fft_data, data_pool, signal_source):
+        self.fft_data = fft_data
+        self.data_pool = data_pool
+        self.signal_source = signal_source
+        self.frames = []
+        self.timestamps = np.empty(0)
+        self.fmin, self.df = fft_data.fmin, fft_data.df
+        self.num_bins = 0
+        self.freq_axis = np.empty(0)
+        self.axis_cache = {}  # (start, samples, block_size) -> abscisses entrelacées
+        self.sync()
+
+    def __len__(self):
+        return len(self.frames)
+
+    def sync(self):
+        """
+        Resolve the frames added to the FFTS since the last call.
+
+        :return: Number of new frames.
+        """
+        frame_ids = self.fft_data.data
+        if len(frame_ids) < len(self.frames):
+            self.frames = []
+        new_frames = [self.data_pool.get_data_info(data_id)['data_object'].iloc[0]
+                      for data_id in frame_ids[len(self.frames):]]
+        if not new_frames:
+            return 0
+        self.frames.extend(new_frames)
+
+        timestamps = np.array([frame.timestamp or 0.0 for frame in self.frames], dtype=np.float64)
+        if len(timestamps) > 1 and not np.all(np.diff(timestamps) > 0):
+            timestamps = np.arange(len(self.frames)) * self.DEFAULT_FRAME_PERIOD
+        self.timestamps = timestamps
+
+        first_frame = self.frames[0]
+        num_bins = max(frame.num_samples or 0 for frame in self.frames)
+        if (first_frame.fmin, first_frame.df, num_bins) != (self.fmin, self.df, self.num_bins):
+            # Axe fréquentiel commun à toutes les frames, calculé une seule fois
+            self.fmin, self.df, self.num_bins = first_frame.fmin, first_frame.df, num_bins
+            self.freq_axis = self.fmin + np.arange(num_bins) * self.df
+            self.axis_cache = {}
+        return len(new_frames)
+
+    @property
+    def start_time(self):
+        return float(self.timestamps[0]) if len(self.timestamps) else 0.0
+
+    @property
+    def end_time(self):
+        return float(self.timestamps[-1]) if len(self.timestamps) else 0.0
+
+    def frame_at(self, position):
+        """Index of the last frame whose timestamp is not after ``position`` (binary search)."""
+        index = int(np.searchsorted(self.timestamps, position, side='right')) - 1
+        return min(max(index, 0), len(self.frames) - 1)
+
+    def frame_arrays(self, frame_index, start_index, end_index, max_points):
+        """
+        Return the bins ``[start_index, end_index)`` of a frame, reduced to ``max_points`` min/max columns when
+        there are more bins than pixel columns.
+
+        :return: (frequencies, levels)
+        """
+        samples = self.signal_source.read_range(self.frames[frame_index], start_index, end_index)
+        if len(samples) <= 2 * max_points:
+            return self.freq_axis[start_index:start_index + len(samples)], samples
+        block_size = len(samples) // max(1, max_points)
+        mins, maxs = reduce_min_max(samples, block_size)
+        key = (start_index, len(samples), block_size)
+        x_data = self.axis_cache.get(key)
+        if x_data is None:
+            x_data = np.repeat(self.freq_axis[start_index::block_size][:len(mins)], 2)
+            if len(self.axis_cache) >= 8:
+                self.axis_cache.clear()
+            self.axis_cache[key] = x_data
+        y_data = np.empty(len(x_data), dtype=np.result_type(mins, maxs, np.float32))
+        y_data[0::2], y_data[1::2] = mins, maxs
+        return x_data, y_data
+
+
+class PlaybackClock(QObject):
+    """
+    Playback position driven by the wall clock, shared by every FFTS sequence of one or several plots.
+
+    The position advances by ``speed`` seconds of sequence time per real second, whatever the time spent drawing:
+    when a redraw falls behind, the next tick simply lands on a later frame and the frames in between are skipped.
+
+    A single clock (and a single timer) can be shared by X-linked plots (see ``PlotController.sync_x_axes``): each
+    tick asks every attached widget to show the frames due at the current position, in one pass.
+    """
+
+    def __init__(self, frame_interval_ms=16, parent=None):
+        super().__init__(parent)
+        self.widgets = []
+        self.speed = 1.0
+        self.start_time = 0.0
+        self.end_time = 0.0
+        self.anchor_position = 0.0
+        self.anchor_wall = time.perf_counter()
+        self.playing = False
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(frame_interval_ms)
+        self.timer.timeout.connect(self.on_timeout)
+
+    def attach(self, widget):
+        if widget not in self.widgets:
+            self.widgets.append(widget)
+        self.update_range()
+
+    def detach(self, widget):
+        if widget in self.widgets:
+            self.widgets.remove(widget)
+        if not self.widgets:
+            self.pause()
+        self.update_range()
+
+    def update_range(self):
+        """Span the playback over the time ranges of every sequence of the attached widgets."""
+        ranges = [widget.playback_range() for widget in self.widgets]
+        ranges = [time_range for time_range in ranges if time_range is not None]
+        if ranges:
+            self.set_range(min(start for start, _ in ranges), max(end for _, end in ranges))
+
+    @property
+    def position(self):
+        if not self.playing:
+            return self.anchor_position
+        return self.anchor_position + (time.perf_counter() - self.anchor_wall) * self.speed
+
+    def set_range(self, start_time, end_time):
+        self.start_time, self.end_time = start_time, end_time
+        self.anchor_position = min(max(self.position, start_time), end_time)
+        self.anchor_wall = time.perf_counter()
+
+    def play(self):
+        if self.position >= self.end_time:
+            self.anchor_position = self.start_time
+        self.anchor_wall = time.perf_counter()
+        self.playing = True
+        self.timer.start()
+
+    def pause(self):
+        self.anchor_position = self.position
+        self.playing = False
+        self.timer.stop()
+
+    def stop(self):
+        """Stop and rewind every attached widget to the start of the playback."""
+        self.pause()
+        self.seek(self.start_time)
+
+    def seek(self, position):
+        """Move to ``position`` and show the frames due there on every attached widget."""
+        self.anchor_position = min(max(position, self.start_time), self.end_time)
+        self.anchor_wall = time.perf_counter()
+        self.show_position(self.anchor_position)
+
+    def set_speed(self, speed):
+        """Change the speed multiplier without moving the current position."""
+        self.anchor_position = self.position
+        self.anchor_wall = time.perf_counter()
+        self.speed = speed
+
+    def show_position(self, position):
+        for widget in self.widgets:
+            widget.show_position(position)
+
+    def on_timeout(self):
+        position = self.position
+        if position >= self.end_time:
+            # Fin de la lecture : retour au début, comme l'ancienne animation
+            self.stop()
+            return
+        self.show_position(position)
+
+
+class FramePrefetchTask(QRunnable):
+    """Compute the arrays of one upcoming frame on a ``QThreadPool`` worker and store them in the prefetcher."""
+
+    def __init__(self, prefetcher, key, compute):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.key = key
+        self.compute = compute
+
+    def run(self):
+        try:
+            arrays = self.compute()
+        except Exception:
+            logger.exception("Frame prefetch failed for %s", self.key)
+            arrays = None
+        self.prefetcher.store(self.key, arrays, prefetched=True)
+
+
+class FramePrefetcher:
+    """
+    Small LRU cache of decimated FFT frames, filled ahead of the playback position by pool workers.
+
+    Entries are keyed by the data_id of the FFTS, the frame and the visible bin window, so a zoom simply stops
+    hitting the old entries. The entries of an FFTS removed from the plot are dropped with ``clear(data_id)``.
+    """
+
+    def __init__(self, thread_pool, capacity=32):
+        self.thread_pool = thread_pool
+        self.capacity = capacity
+        self.frames = OrderedDict()  # (data_id, frame, start, end, max_points) -> (x_data, y_data)
+        self.pending = set()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(sequence, frame_index, start_index, end_index, max_points):
+        return sequence.fft_data.data_id, frame_index, start_index, end_index, max_points
+
+    def get(self, sequence, frame_index, start_index, end_index, max_points):
+        """Return the arrays of a frame, computing them on the calling thread if they were not prefetched."""
+        key = self.key(sequence, frame_index, start_index, end_index, max_points)
+        with self.lock:
+            arrays = self.frames.get(key)
+            if arrays is not None:
+                self.frames.move_to_end(key)
+                return arrays
+        arrays = sequence.frame_arrays(frame_index, start_index, end_index, max_points)
+        self.store(key, arrays)
+        return arrays
+
+    def prefetch(self, sequence, frame_indices, start_index, end_index, max_points):
+        """Queue the computation of the frames not cached nor already queued."""
+        for frame_index in frame_indices:
+            key = self.key(sequence, frame_index, start_index, end_index, max_points)
+            with self.lock:
+                if key in self.frames or key in self.pending:
+                    continue
+                self.pending.add(key)
+            compute = lambda frame_index=frame_index: sequence.frame_arrays(frame_index, start_index, end_index,
+                                                                            max_points)
+            self.thread_pool.start(FramePrefetchTask(self, key, compute))
+
+    def store(self, key, arrays, prefetched=False):
+        with self.lock:
+            if prefetched and key not in self.pending:
+                # FFTS retirée (clear) pendant le calcul
+                return
+            self.pending.discard(key)
+            if arrays is None:
+                return
+            self.frames[key] = arrays
+            self.frames.move_to_end(key)
+            while len(self.frames) > self.capacity:
+                self.frames.popitem(last=False)
+
+    def clear(self, data_id=None):
+        """Drop the frames of the FFTS ``data_id``, or every frame when no data_id is given."""
+        with self.lock:
+            if data_id is None:
+                self.frames.clear()
+                self.pending.clear()
+            else:
+                for key in [key for key in self.frames if key[0] == data_id]:
+                    del self.frames[key]
+                self.pending = {key for key in self.pending if key[0] != data_id}
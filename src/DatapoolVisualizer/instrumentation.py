@@ -0,0 +1,103 @@
+import logging
+import time
+from collections import deque
+
+# Spans émis au niveau DEBUG : logging.getLogger('src.DatapoolVisualizer.instrumentation').setLevel(logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """Timed section of code, logged with its duration and fields when it ends."""
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.start = 0.0
+        self.elapsed_ms = 0.0
+
+    def add(self, **fields):
+        """Attach fields known only inside the span (points produced, samples read...)."""
+        self.fields.update(fields)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.elapsed_ms = (time.perf_counter() - self.start) * 1000
+        logger.debug("%s %.3f ms %s", self.name, self.elapsed_ms, self.fields)
+        return False
+
+
+class NullSpan:
+    """Span returned while instrumentation is off: entering, leaving and ``add`` do nothing."""
+    elapsed_ms = 0.0
+
+    def add(self, **fields):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+def span(name, **fields):
+    """
+    Time a section of code with ``with span('decimate', data_id=...):``.
+
+    Off by default: unless the instrumentation logger is enabled for DEBUG, a shared no-op span is returned and
+    nothing is measured nor formatted.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return NULL_SPAN
+    return Span(name, fields)
+
+
+def enable_instrumentation(enabled=True, handler=None):
+    """
+    Switch the spans on or off.
+
+    :param handler: Optional ``logging.Handler`` receiving the spans, e.g. ``logging.StreamHandler()``.
+    """
+    logger.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+    if handler is not None and handler not in logger.handlers:
+        logger.addHandler(handler)
+
+
+class RenderStats:
+    """
+    Rendering figures of one plot for the performance overlay: last render time, points drawn, samples read, cache
+    hit ratio and frames actually displayed per second.
+    """
+
+    def __init__(self, window_seconds=1.0):
+        self.window_seconds = window_seconds
+        self.frame_times = deque()
+        self.last_render_ms = 0.0
+        self.points = 0
+        self.samples_read = 0
+        self.hit_ratio = None
+
+    def frame(self):
+        """Record that a new frame reached the screen."""
+        now = time.perf_counter()
+        self.frame_times.append(now)
+        while self.frame_times and now - self.frame_times[0] > self.window_seconds:
+            self.frame_times.popleft()
+
+    @property
+    def fps(self):
+        now = time.perf_counter()
+        while self.frame_times and now - self.frame_times[0] > self.window_seconds:
+            self.frame_times.popleft()
+        return len(self.frame_times) / self.window_seconds
+
+    def text(self):
+        hit_ratio = '-' if self.hit_ratio is None else f"{self.hit_ratio:.0%}"
+        return f"render {self.last_render_ms:.1f} ms | {self.points} pts | read {self.samples_read} | " \
+               f"cache {hit_ratio} | {self.fps:.0f} fps"
@@ -0,0 +1,108 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QColor
+
+
+class LegendEntry:
+    __slots__ = ('data_id', 'name', 'color', 'visible')
+
+    def __init__(self, data_id, name, color, visible=True):
+        self.data_id = data_id
+        self.name = name
+        self.color = color
+        self.visible = visible
+
+
+class CurveLegendModel(QAbstractListModel):
+    """
+    Legend of the curves of a plot, one row per data_id: name, color (decoration) and visibility (check box).
+
+    Entries are indexed by data_id, so reading or changing the color or visibility of a curve is O(1) whatever the
+    number of curves, and a batch of changes is reported with a single ``dataChanged``. Displayed through a
+    ``QListView``, only the visible rows are painted and no widget is created per curve.
+    """
+    DataIdRole = Qt.UserRole + 1
+    visibility_changed = Signal(str, bool)  # data_id, visible
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []
+        self.rows = {}  # data_id -> ligne
+
+    # --- QAbstractListModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return entry.name
+        if role == Qt.DecorationRole:
+            return entry.color
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if entry.visible else Qt.Unchecked
+        if role == self.DataIdRole:
+            return entry.data_id
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        entry = self.entries[index.row()]
+        self.set_visible(entry.data_id, Qt.CheckState(value) == Qt.Checked)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    # --- Courbes ---
+
+    def __contains__(self, data_id):
+        return data_id in self.rows
+
+    def add(self, data_id, name, color):
+        row = len(self.entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.entries.append(LegendEntry(data_id, name, QColor(color)))
+        self.rows[data_id] = row
+        self.endInsertRows()
+
+    def remove(self, data_id):
+        row = self.rows.pop(data_id, None)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.entries[row]
+        for following in self.entries[row:]:
+            self.rows[following.data_id] -= 1
+        self.endRemoveRows()
+
+    def color(self, data_id):
+        return self.entries[self.rows[data_id]].color
+
+    def is_visible(self, data_id):
+        row = self.rows.get(data_id)
+        return row is None or self.entries[row].visible
+
+    def set_colors(self, colors):
+        """Recolor several curves from ``{data_id: color}``, with one ``dataChanged`` for all of them."""
+        changed = []
+        for data_id, color in colors.items():
+            row = self.rows[data_id]
+            self.entries[row].color = QColor(color)
+            changed.append(row)
+        if changed:
+            self.dataChanged.emit(self.index(min(changed)), self.index(max(changed)), [Qt.DecorationRole])
+
+    def set_visible(self, data_id, visible):
+        row = self.rows[data_id]
+        entry = self.entries[row]
+        if entry.visible == visible:
+            return
+        entry.visible = visible
+        self.dataChanged.emit(self.index(row), self.index(row), [Qt.CheckStateRole])
+        self.visibility_changed.emit(data_id, visible)
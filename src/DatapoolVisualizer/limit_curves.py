@@ -0,0 +1,77 @@
+import numpy as np
+
+
+def freq_limit_polyline(data_object, points_per_segment=32):
+    """
+    Build the polyline of a frequency limit from its breakpoints.
+
+    With linear interpolation the breakpoints are the exact curve. With log interpolation every segment is sampled
+    with ``points_per_segment`` points evenly spaced in log-frequency, all segments at once.
+
+    :return: (frequencies, levels) sorted by frequency
+    """
+    if not data_object.data:
+        return np.empty(0), np.empty(0)
+    breakpoints = np.asarray(data_object.data, dtype=np.float64)
+    breakpoints = breakpoints[np.argsort(breakpoints[:, 0], kind='stable')]
+    frequencies, levels = breakpoints[:, 0], breakpoints[:, 1]
+    if data_object.interpolation_type != 'log' or len(frequencies) < 2:
+        return frequencies, levels
+    if np.any(frequencies <= 0):
+        raise ValueError("Frequencies must be positive for logarithmic interpolation.")
+
+    f0, f1 = frequencies[:-1, None], frequencies[1:, None]
+    l0, l1 = levels[:-1, None], levels[1:, None]
+    t = np.linspace(0.0, 1.0, points_per_segment, endpoint=False)[None, :]
+    # Interpolation linéaire du niveau en fonction de log(f) : f = f0 * (f1 / f0) ** t
+    x_data = np.append((f0 * (f1 / f0) ** t).ravel(), frequencies[-1])
+    y_data = np.append((l0 + (l1 - l0) * t).ravel(), levels[-1])
+    return x_data, y_data
+
+
+def clip_polyline(x_values, y_values, x_min, x_max):
+    """
+    Restrict a polyline sorted by x to ``[x_min, x_max]``.
+
+    The end levels are extended flat up to the view edges, as ``FreqLimitsData.interpolate`` does outside of the
+    breakpoints.
+    """
+    if len(x_values) == 0 or x_min is None or x_max is None:
+        return np.empty(0), np.empty(0)
+    lo = np.searchsorted(x_values, x_min, side='right')
+    hi = np.searchsorted(x_values, x_max, side='left')
+    edge_levels = np.interp([x_min, x_max], x_values, y_values)
+    x_data = np.concatenate(([x_min], x_values[lo:hi], [x_max]))
+    y_data = np.concatenate(([edge_levels[0]], y_values[lo:hi], [edge_levels[1]]))
+    return x_data, y_data
+
+
+class LimitCurveCache:
+    """
+    Per data_id cache of limit polylines.
+
+    A polyline is rebuilt only when the breakpoints or the interpolation type of the limit change; zooming only
+    re-clips it to the view.
+    """
+
+    def __init__(self):
+        self.polylines = {}  # data_id -> (signature, x_values, y_values)
+
+    def get(self, data_object):
+        signature = (tuple(data_object.data), getattr(data_object, 'interpolation_type', None))
+        cached = self.polylines.get(data_object.data_id)
+        if cached is None or cached[0] != signature:
+            cached = (signature, *freq_limit_polyline(data_object))
+            self.polylines[data_object.data_id] = cached
+        return cached[1], cached[2]
+
+    def clipped(self, data_object, x_min, x_max):
+        """Return the polyline of a frequency limit restricted to ``[x_min, x_max]``."""
+        x_values, y_values = self.get(data_object)
+        return clip_polyline(x_values, y_values, x_min, x_max)
+
+    def invalidate(self, data_id=None):
+        if data_id is None:
+            self.polylines.clear()
+        else:
+            self.polylines.pop(data_id, None)
@@ -0,0 +1,148 @@
+import threading
+
+import numpy as np
+
+from src.DatapoolVisualizer.decimation import reduce_min_max
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max pyramid of a signal.
+
+    Level ``k`` groups the samples in blocks of ``2 ** k`` and keeps the minimum and maximum of each block.
+    Only levels starting at ``base_level`` are stored: below that, a visible window holding ``max_points`` columns
+    is small enough to be reduced on demand from the raw samples (see ``TileCache``).
+    """
+
+    def __init__(self, num_samples, base_level=10):
+        self.num_samples = num_samples
+        self.base_level = base_level
+        self.levels = {}  # level -> (mins, maxs)
+
+    @classmethod
+    def from_chunks(cls, chunks, num_samples, base_level=10):
+        """
+        Build the pyramid from an iterable of consecutive sample chunks.
+
+        Every chunk except the last one must hold a multiple of ``2 ** base_level`` samples so that no block
+        straddles two chunks.
+        """
+        pyramid = cls(num_samples, base_level)
+        block_size = 1 << base_level
+        mins, maxs = [], []
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            chunk_mins, chunk_maxs = reduce_min_max(chunk, block_size)
+            mins.append(chunk_mins)
+            maxs.append(chunk_maxs)
+
+        if not mins:
+            return pyramid
+
+        level_mins, level_maxs = np.concatenate(mins), np.concatenate(maxs)
+        level = base_level
+        pyramid.levels[level] = (level_mins, level_maxs)
+        # Chaque niveau supérieur fusionne les blocs deux à deux
+        while len(level_mins) > 1:
+            level_mins = cls._pair_reduce(level_mins, np.minimum)
+            level_maxs = cls._pair_reduce(level_maxs, np.maximum)
+            level += 1
+            pyramid.levels[level] = (level_mins, level_maxs)
+        return pyramid
+
+    @classmethod
+    def from_samples(cls, samples, base_level=10, chunk_size=1 << 22):
+        """Build the pyramid from an in-memory array of samples."""
+        samples = np.asarray(samples)
+        chunks = (samples[start:start + chunk_size] for start in range(0, len(samples), chunk_size))
+        return cls.from_chunks(chunks, len(samples), base_level)
+
+    @staticmethod
+    def _pair_reduce(values, reducer):
+        paired = reducer(values[0:len(values) - 1:2], values[1::2])
+        if len(values) % 2:
+            paired = np.append(paired, values[-1])
+        return paired
+
+    @property
+    def max_level(self):
+        return max(self.levels) if self.levels else None
+
+    def select_level(self, visible_samples, max_points):
+        """
+        Return the coarsest stored level that still yields at least ``max_points`` columns over
+        ``visible_samples`` samples, or None when the raw samples must be reduced directly.
+        """
+        if not self.levels or max_points <= 0:
+            return None
+        samples_per_column = visible_samples // max_points
+        if samples_per_column < 1:
+            return None
+        level = int(samples_per_column).bit_length() - 1
+        if level < self.base_level:
+            return None
+        return min(level, self.max_level)
+
+    def get_range(self, level, start_index, end_index):
+        """
+        Return the blocks of ``level`` covering the samples ``[start_index, end_index)``.
+
+        :return: (index of the first sample of each block, block minimums, block maximums)
+        """
+        mins, maxs = self.levels[level]
+        first_block = max(0, start_index >> level)
+        last_block = min(len(mins), -(-end_index >> level))
+        if last_block <= first_block:
+            empty = np.empty(0)
+            return empty, empty, empty
+        block_starts = np.arange(first_block, last_block, dtype=np.int64) << level
+        return block_starts, mins[first_block:last_block], maxs[first_block:last_block]
+
+
+class LodCache:
+    """
+    Per data_id cache of min/max pyramids.
+
+    A pyramid is built once per signal and rebuilt only when the number of samples of the signal changes. The cache
+    can be shared by several plots displaying data from the same pool, and queried from decimation worker threads:
+    a pyramid is built outside the cache-wide lock, under a lock of its own data_id, so a long build only blocks the
+    workers waiting for that same signal.
+    """
+
+    def __init__(self, base_level=10):
+        self.base_level = base_level
+        self.pyramids = {}
+        self.build_locks = {}  # data_id -> verrou de construction
+        self.lock = threading.Lock()
+
+    def get(self, data_id, num_samples, chunks_factory):
+        """
+        Return the pyramid of ``data_id``, building it if needed.
+
+        :param num_samples: Current number of samples of the signal, used to detect stale pyramids.
+        :param chunks_factory: Callable returning an iterable of consecutive sample chunks of the signal.
+        """
+        with self.lock:
+            pyramid = self.pyramids.get(data_id)
+            if pyramid is not None and pyramid.num_samples == num_samples:
+                return pyramid
+            build_lock = self.build_locks.setdefault(data_id, threading.Lock())
+        with build_lock:
+            with self.lock:
+                # Construite par un autre worker pendant l'attente
+                pyramid = self.pyramids.get(data_id)
+                if pyramid is not None and pyramid.num_samples == num_samples:
+                    return pyramid
+            pyramid = MinMaxPyramid.from_chunks(chunks_factory(), num_samples, self.base_level)
+            with self.lock:
+                self.pyramids[data_id] = pyramid
+            return pyramid
+
+    def invalidate(self, data_id=None):
+        """Drop the pyramid of ``data_id``, or every pyramid when no data_id is given."""
+        with self.lock:
+            if data_id is None:
+                self.pyramids.clear()
+            else:
+                self.pyramids.pop(data_id, None)
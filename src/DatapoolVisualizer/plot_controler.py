@@ -1,6 +1,13 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton
 from PyDataCore import Data_Type
 from src.DatapoolVisualizer.plot_widget import SignalPlotWidget
+from src.DatapoolVisualizer.lod_cache import LodCache
+from src.DatapoolVisualizer.signal_source import SignalSource
+from src.DatapoolVisualizer.tile_cache import TileCache
+from src.DatapoolVisualizer.render_scheduler import RenderScheduler
+from src.DatapoolVisualizer.fft_playback import PlaybackClock
+from src.DatapoolVisualizer.data_resolver import DataObjectResolver
+from src.DatapoolVisualizer.pool_events import PoolEvent
 
 
 class PlotController(QWidget):
@@ -10,6 +17,10 @@ class PlotController(QWidget):
         self.plots = []  # Liste des objets SignalPlotWidget
         self.groups = []  # Liste des groupes de plots
         self.selected_plot = None  # Le plot actuellement sélectionné
+        self.lod_cache = LodCache()  # Pyramides min/max partagées par tous les plots
+        self.signal_source = SignalSource()  # Vues memmap partagées des signaux stockés en fichier
+        self.tile_cache = TileCache()  # Tuiles décimées partagées, voir tile_cache.stats() pour dimensionner le budget
+        self.data_resolver = DataObjectResolver(data_pool)  # data_id -> objet de donnée, partagé par tous les plots
 
         # Layout pour organiser les plots et les contrôles
         self.layout = QVBoxLayout()
@@ -41,6 +52,16 @@ class PlotController(QWidget):
         toggle_y_axes_button.clicked.connect(self.toggle_y_axis_grouping)
         control_layout.addWidget(toggle_y_axes_button)
 
+        # bouton pour faire défiler les signaux en cours d'acquisition (mode scope)
+        toggle_scope_button = QPushButton("Mode scope")
+        toggle_scope_button.clicked.connect(self.toggle_scope_mode)
+        control_layout.addWidget(toggle_scope_button)
+
+        # bouton pour afficher les statistiques de rendu sur les plots sélectionnés
+        toggle_stats_button = QPushButton("Stats")
+        toggle_stats_button.clicked.connect(self.toggle_stats_overlay)
+        control_layout.addWidget(toggle_stats_button)
+
     def toggle_y_axis_grouping(self):
         """
         Active ou désactive le regroupement des axes Y pour le plot sélectionné.
@@ -54,11 +75,57 @@ class PlotController(QWidget):
         else:
             print("No plot selected to toggle Y-axis grouping.")
 
+    def toggle_scope_mode(self):
+        """
+        Active ou désactive le mode scope pour les plots sélectionnés.
+        """
+        selected_plots = [plot for plot in self.plots if plot.selected]
+        for plot in selected_plots:
+            plot.set_scope_mode(not plot.scope_mode)
+        if not selected_plots:
+            print("No plot selected to toggle scope mode.")
+
+    def toggle_stats_overlay(self):
+        """
+        Affiche ou masque les statistiques de rendu des plots sélectionnés.
+        """
+        selected_plots = [plot for plot in self.plots if plot.selected]
+        for plot in selected_plots:
+            plot.set_stats_overlay(not plot.stats_timer.isActive())
+        if not selected_plots:
+            print("No plot selected to toggle the stats overlay.")
+
+    def apply_pool_events(self, events):
+        """
+        Apply the ``PoolEvent`` flushed by the notifier to every per-data cache behind the plots, then redraw the
+        curves of the data stored again.
+
+        The data object cache follows all the events. Sample views, pyramids, tiles and limit polylines are dropped
+        when a data is stored again or removed: they are only recomputed by themselves when the number of samples
+        changes, not when a signal is stored again with the same length.
+        """
+        self.data_resolver.apply_events(events)
+        stored, removed = set(), set()
+        for event in events:
+            if event.kind not in (PoolEvent.STORED, PoolEvent.REMOVED):
+                continue
+            self.signal_source.close(event.data_id)
+            self.lod_cache.invalidate(event.data_id)
+            self.tile_cache.invalidate(event.data_id)
+            for plot in self.plots:
+                plot.limit_curves.invalidate(event.data_id)
+            (stored if event.kind == PoolEvent.STORED else removed).add(event.data_id)
+        stored -= removed
+        for plot in self.plots:
+            for data_id in stored & plot.curves.keys():
+                plot.display_signal(data_id, plot.curves[data_id])
+
     def add_plot(self):
         """
         Ajoute un nouveau plot dans la fenêtre.
         """
-        plot = SignalPlotWidget(self.data_pool)
+        plot = SignalPlotWidget(self.data_pool, lod_cache=self.lod_cache, signal_source=self.signal_source,
+                                tile_cache=self.tile_cache, data_resolver=self.data_resolver)
         self.plots.append(plot)
 
         # Ajouter le nouveau plot au layout
@@ -97,12 +164,18 @@ class PlotController(QWidget):
                     # Désynchroniser tous les plots du groupe
                     for p in group:
                         p.plot_widget.setXLink(None)
+                    # Le plot retrouve son propre ordonnanceur de rendu et sa propre horloge de lecture
+                    plot.set_render_scheduler(None)
+                    plot.set_playback_clock(None)
                     # Retirer le plot du groupe
                     group.remove(plot)
                     print(f"Plot {plot} ungrouped.")
 
                     # Si le groupe devient vide ou contient moins de 2 éléments, supprimer le groupe
                     if len(group) <= 1:
+                        for p in group:
+                            p.set_render_scheduler(None)
+                            p.set_playback_clock(None)
                         self.groups.remove(group)
                         print("Group removed due to insufficient plots.")
 
@@ -114,6 +187,14 @@ class PlotController(QWidget):
         for plot in plots[1:]:
             plot.plot_widget.setXLink(first_plot)
 
+        # Un seul ordonnanceur pour le groupe : un glissement redessine tout le groupe une fois par frame
+        group_scheduler = RenderScheduler(parent=self)
+        # Une seule horloge de lecture : les FFTS de tout le groupe avancent ensemble, sur un seul timer
+        group_clock = PlaybackClock(parent=self)
+        for plot in plots:
+            plot.set_render_scheduler(group_scheduler)
+            plot.set_playback_clock(group_clock)
+
     def remove_selected_plots(self):
         """
         Supprime les plots sélectionnés de la fenêtre et les retire de la liste des plots.
@@ -122,6 +203,8 @@ class PlotController(QWidget):
         for plot in selected_plots:
             # Retirer du layout et de la liste des plots
             self.layout.removeWidget(plot)
+            plot.render_scheduler.detach(plot)
+            plot.playback_clock.detach(plot)
             plot.deleteLater()  # Supprime le widget de manière propre
             self.plots.remove(plot)
             print(f"Plot {plot} removed.")
@@ -133,9 +216,7 @@ class PlotController(QWidget):
         selected_plot = next((plot for plot in self.plots if plot.selected), None)
 
         if selected_plot:
-            data_info = self.data_pool.get_data_info(data_id)
-            data_object = data_info['data_object'].iloc[0]
-            data_type = data_object.data_type
+            data_type = self.data_resolver.handle(data_id).data_type
             selected_plot: SignalPlotWidget
             if data_type in [Data_Type.TEMPORAL_SIGNAL, Data_Type.FREQ_SIGNAL]:
                 # Regular temporal or frequency data addition
@@ -155,3 +236,28 @@ class PlotController(QWidget):
                 print(f"Data type {data_type} not supported for ploting.")
         else:
             print("No plot selected to add data to.")
+
+    def add_data_many_to_selected_plot(self, data_ids):
+        """
+        Adds several data to the currently selected plot in one pass: metadata resolved in bulk, a single recoloring
+        and one rendering request per curve.
+        """
+        selected_plot = next((plot for plot in self.plots if plot.selected), None)
+        if not selected_plot:
+            print("No plot selected to add data to.")
+            return
+
+        handles = self.data_resolver.handle_many(data_ids)
+        plottable = []
+        for data_id, handle in handles.items():
+            if handle.data_type in [Data_Type.TEMPORAL_SIGNAL, Data_Type.FREQ_SIGNAL]:
+                if selected_plot.is_compatible(data_id):
+                    plottable.append(data_id)
+                else:
+                    print(f"Incompatible data {data_id} for selected plot.")
+            elif handle.data_type in [Data_Type.FFTS, Data_Type.FREQ_LIMIT, Data_Type.TEMP_LIMIT]:
+                plottable.append(data_id)
+            else:
+                print(f"Data type {handle.data_type} not supported for ploting.")
+        selected_plot.add_data_many(plottable, 'b')
+        print(f"{len(plottable)} data added to selected plot.")
@@ -1,31 +1,118 @@
+import contextlib
+import logging
+
 import PyDataCore
 import numpy as np
 from PyDataCore import Data_Type, FreqSignalData, FFTSData, TemporalSignalData
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, QThreadPool, QCoreApplication
 from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QVBoxLayout, QWidget, QLabel, QSlider, QPushButton, QHBoxLayout, QColorDialog
+from PySide6.QtWidgets import QVBoxLayout, QWidget, QLabel, QSlider, QPushButton, QHBoxLayout, QColorDialog, \
+    QComboBox, QListView
 import pyqtgraph as pg
 from pyqtgraph import mkColor, mkPen, PlotItem, PlotCurveItem
 
 import colorsys
 
+from src.DatapoolVisualizer.decimation import DECIMATION_STRATEGIES, reduce_min_max
+from src.DatapoolVisualizer.lod_cache import LodCache
+from src.DatapoolVisualizer.tile_cache import TileCache
+from src.DatapoolVisualizer.viewport import map_viewport, signal_axis
+from src.DatapoolVisualizer.limit_curves import LimitCurveCache
+from src.DatapoolVisualizer.waterfall import WaterfallBuffer
+from src.DatapoolVisualizer.fft_playback import FFTSequence, FramePrefetcher, PlaybackClock
+from src.DatapoolVisualizer.scope import ScopeTrace
+from src.DatapoolVisualizer.signal_source import SignalSource
+from src.DatapoolVisualizer.data_resolver import DataObjectResolver
+from src.DatapoolVisualizer.legend_model import CurveLegendModel
+from src.DatapoolVisualizer.render_worker import DecimationSignals, DecimationTask
+from src.DatapoolVisualizer.render_scheduler import RenderScheduler
+from src.DatapoolVisualizer.instrumentation import RenderStats, span
+
+logger = logging.getLogger(__name__)
+
 
 class SignalPlotWidget(QWidget):
-    def __init__(self, data_pool, parent=None):
+    def __init__(self, data_pool, parent=None, lod_cache=None, signal_source=None, tile_cache=None,
+                 data_resolver=None):
         super().__init__(parent)
         self.selected = False
         self.data_pool = data_pool
+        # Objets des données résolus une fois dans le registre du pool, partageables entre plusieurs plots
+        self.data_resolver = data_resolver if data_resolver is not None else DataObjectResolver(data_pool)
         self.curves = {}
-        self.extra_axes = []
+        # Un ViewBox et un axe Y par unité (par FFTS pour les FFTS), partagés par les courbes de cette unité
+        self.extra_axes = []  # (axe, ViewBox) dans l'ordre des colonnes du layout
+        self.unit_axes = {}  # clé d'axe -> (axe, ViewBox)
+        self.curve_axes = {}  # data_id -> clé d'axe
         self.max_points = 500
+        # Pyramides min/max par data_id, partageables entre plusieurs plots
+        self.lod_cache = lod_cache if lod_cache is not None else LodCache()
+        # Accès sans copie aux samples (memmap pour les signaux stockés en fichier)
+        self.signal_source = signal_source if signal_source is not None else SignalSource()
+        # Tuiles LRU des niveaux fins, plus une marge préchargée de part et d'autre de la vue (fraction de la vue)
+        self.tile_cache = tile_cache if tile_cache is not None else TileCache()
+        self.prefetch_margin = 0.25  # overscan lu de chaque côté de la vue
+        # Stratégie de décimation par courbe ('minmax', 'm4' ou 'lttb'), M4 par défaut
+        self.default_decimation = 'm4'
+        self.decimation_strategies = {}
+        # Polylignes des limites calculées une fois depuis leurs points de cassure, seulement recadrées au zoom
+        self.limit_curves = LimitCurveCache()
+        self.limit_pen = pg.mkPen('r', style=pg.QtCore.Qt.DashLine)
+        # Décimation en tâche de fond : seul le dernier numéro de génération de chaque courbe est affiché
+        self.async_rendering = True
+        self.render_generation = {}
+        self.thread_pool = QThreadPool.globalInstance()
+        self.decimation_signals = DecimationSignals(self)
+        self.decimation_signals.finished.connect(self.apply_decimation_result)
+        self.last_render_ms = 0.0
+        # Plage X changée par programme (ajout de courbes, défilement du scope) : pas une interaction, voir
+        # silent_range_change
+        self.silent_range = False
+        # Ordonnanceur de rendu propre au widget, remplacé par celui du groupe quand les axes X sont liés
+        self.own_render_scheduler = RenderScheduler(parent=self)
+        self.render_scheduler = None
+        self.set_render_scheduler(None)
         self.data_type = None
         self.x_min = None
         self.x_max = None
-        self.fft_timer = QTimer(self)  # Timer for FFT animation
-        self.fft_timer.timeout.connect(self.update_animation_frame)
-        self.current_frame = 0  # Current frame in the FFT sequence
-        self.is_animating = False  # Animation state
+        # Lecture des FFTS cadencée par les timestamps réels, les frames en retard sont sautées
+        self.fft_sequences = {}  # data_id -> FFTSequence
+        self.current_frames = {}  # data_id -> frame affichée
+        self.frame_prefetcher = FramePrefetcher(self.thread_pool)
+        self.prefetch_frames = 4  # frames calculées d'avance pendant la lecture
+        self.dropped_frames = 0
+        # Horloge propre au widget, remplacée par celle du groupe quand les axes X sont liés
+        self.own_playback_clock = PlaybackClock(parent=self)
+        self.playback_clock = None
+        # Vue waterfall des FFTS : toutes les frames empilées dans une seule image
+        self.fft_data = None
+        self.fft_curve = None
+        self.fft_axis = None
+        self.waterfall = None
+        self.waterfall_axis = None  # (fmin, df) des frames empilées
+        self.waterfall_image = None
+        self.waterfall_mode = False
+        # Frames ajoutées à la FFTS (add_fft_signal) pendant la vue waterfall : empilées au fil de l'eau
+        self.waterfall_timer = QTimer(self)
+        self.waterfall_timer.setInterval(200)
+        self.waterfall_timer.timeout.connect(self.update_waterfall)
         self.y_axis_grouped = False  # Y-axis grouping state
+        # Mode scope : les signaux temporels en cours d'acquisition défilent sur les window_seconds dernières secondes
+        self.scope_mode = False
+        self.scope_window = 10.0
+        self.scope_traces = {}  # data_id -> ScopeTrace
+        self.scope_limits = None  # limites X (étendue des données) remises en sortie du mode scope
+        self.scope_timer = QTimer(self)
+        self.scope_timer.setInterval(50)
+        self.scope_timer.timeout.connect(self.update_scope)
+        # Statistiques de rendu, affichées en surimpression à la demande (set_stats_overlay)
+        self.render_stats = RenderStats()
+        self.stats_overlay = None
+        self.stats_samples_read = 0  # compteur de la source au dernier rafraîchissement de la surimpression
+        self.stats_cache_counts = (0, 0)
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(500)
+        self.stats_timer.timeout.connect(self.update_stats_overlay)
 
         # Layout principal
         main_layout = QVBoxLayout(self)
@@ -45,11 +132,22 @@ class SignalPlotWidget(QWidget):
         self.animation_controls.setVisible(False)  # Start hidden
         self.init_animation_controls(self.animation_controls)
         main_layout.addWidget(self.animation_controls)
-
-        # Widget de légende en dessous
-        self.legend_widget = QWidget()
-        self.legend_layout = QHBoxLayout(self.legend_widget)
-        main_layout.addWidget(self.legend_widget)
+        self.set_playback_clock(None)
+
+        # Légende en dessous : modèle indexé par data_id, affiché par une liste virtualisée (case à cocher pour
+        # masquer la courbe, double-clic pour changer sa couleur)
+        self.legend_model = CurveLegendModel(self)
+        self.legend_model.visibility_changed.connect(self.on_curve_visibility_changed)
+        self.legend_view = QListView()
+        self.legend_view.setModel(self.legend_model)
+        self.legend_view.setFlow(QListView.LeftToRight)
+        self.legend_view.setWrapping(True)
+        self.legend_view.setResizeMode(QListView.Adjust)
+        self.legend_view.setUniformItemSizes(True)
+        self.legend_view.setMaximumHeight(60)
+        self.legend_view.doubleClicked.connect(
+            lambda index: self.change_curve_color(index.data(CurveLegendModel.DataIdRole)))
+        main_layout.addWidget(self.legend_view)
 
         # Legend and plot setup
         # self.legend = self.plot_widget.addLegend(offset=(10, 10))
@@ -68,251 +166,330 @@ class SignalPlotWidget(QWidget):
     def add_data(self, data_id, color='b'):
         """ Ajouter une courbe au graphique et lui assigner un axe Y si nécessaire. """
         """Add data to the plot and handle FFTS data specifically for animation."""
+        self.add_data_many([data_id], color)
 
-        if data_id in self.curves:
-            print(f"Data {data_id} already displayed.")
+    def add_data_many(self, data_ids, color='b'):
+        """
+        Add several curves at once: one registry lookup for all their metadata, one geometry update of the viewboxes,
+        one recoloring pass and a single decimation pass per curve (the range change does not go through the
+        interactive render scheduler).
+
+        Data already displayed is skipped.
+        """
+        data_ids = list(dict.fromkeys(data_ids))
+        for data_id in self.curves.keys() & set(data_ids):
+            logger.debug("Data %s already displayed.", data_id)
+        data_ids = [data_id for data_id in data_ids if data_id not in self.curves]
+        if not data_ids:
             return
+        handles = self.data_resolver.handle_many(data_ids)
 
-        # Récupération des informations de la donnée
-        data_info = self.data_pool.get_data_info(data_id)
-        data_object = data_info['data_object'].iloc[0]
-        is_limit = False
+        if len(self.curves) == 0:
+            #cacher les axes Y
+            self.plot_widget.plotItem.hideAxis('left')
+            self.plot_widget.plotItem.hideAxis('right')
+        previous_range = (self.x_min, self.x_max)
+        for data_id in data_ids:
+            self.extend_x_range(handles[data_id].data_object)
+        x_min, x_max = self.x_min, self.x_max
+        # Pas de rendu interactif ni d'affinage planifiés par handle_zoom : un seul rendu, à la fin
+        with self.silent_range_change():
+            self.plot_widget.plotItem.setXRange(x_min, x_max)
+            self.plot_widget.setLimits(xMin=x_min, xMax=x_max)
+        # Courbes existantes redessinées seulement si la plage a changé
+        redraw = list(self.curves) if (self.x_min, self.x_max) != previous_range else []
+
+        for data_id in data_ids:
+            self.add_curve(data_id, handles[data_id].data_object, color)
 
-        # Déterminer si la donnée est une limite
-        if data_object.data_type in (Data_Type.TEMP_LIMIT, Data_Type.FREQ_LIMIT):
-            is_limit = True
+        # Synchroniser les ViewBox avec le graphique principal
+        self.update_viewbox_geometry()
 
+        # redefinir une couleur qui change en fonction du nombre de courbes pour toutes les courbes
+        self.recolor_curves()
+
+        # Afficher les données des nouveaux signaux
+        for data_id in redraw + data_ids:
+            self.display_signal(data_id, self.curves[data_id])
+
+    @contextlib.contextmanager
+    def silent_range_change(self):
+        """ Changer la plage X par programme : handle_zoom la mémorise sans demander de rendu à l'ordonnanceur. """
+        self.silent_range = True
+        try:
+            yield
+        finally:
+            self.silent_range = False
+
+    def extend_x_range(self, data_object):
+        """ Étendre x_min et x_max du graphique à l'étendue de la donnée. """
         # Initialisation des x_min et x_max pour le graphique selon le type de signal
-
         if data_object.data_type == Data_Type.TEMPORAL_SIGNAL:
-            if self.x_min is None or self.x_max is None:
-                self.x_min = data_object.tmin
-                self.x_max = data_object.tmin + data_object.dt * data_object.num_samples
-            else:
-                self.x_min = min(self.x_min, data_object.tmin)
-                self.x_max = max(self.x_max, data_object.tmin + data_object.dt * data_object.num_samples)
-            # print(f'temp x_min: {self.x_min} - x_max: {self.x_max}')
+            x_min, x_max = data_object.tmin, data_object.tmin + data_object.dt * data_object.num_samples
         elif data_object.data_type == Data_Type.FREQ_SIGNAL:
-            if self.x_min is None or self.x_max is None:
-                self.x_min = data_object.fmin
-                self.x_max = data_object.fmin + data_object.df * data_object.num_samples
-            else:
-                self.x_min = min(self.x_min, data_object.fmin)
-                self.x_max = max(self.x_max, data_object.fmin + data_object.df * data_object.num_samples)
-                # print(f'Freq x_min: {self.x_min} - x_max: {self.x_max}')
+            x_min, x_max = data_object.fmin, data_object.fmin + data_object.df * data_object.num_samples
         elif data_object.data_type == Data_Type.FFTS:
-            if self.x_min is None or self.x_max is None:
-                # recuperer la premiere FFT des FFTS
-                fft_data_object = data_object.fft_signals[0]
-                self.x_min = fft_data_object.fmin
-                self.x_max = fft_data_object.fmin + fft_data_object.df * fft_data_object.num_samples
-            else:
-                # recuperer la premiere FFT des FFTS
-                fft_data_object = data_object.fft_signals[0]
-                self.x_min = min(self.x_min, fft_data_object.fmin)
-                self.x_max = max(self.x_max, fft_data_object.fmin + fft_data_object.df * fft_data_object.num_samples)
-                # print(f'FFT x_min: {self.x_min} - x_max: {self.x_max}')
+            # recuperer la premiere FFT des FFTS
+            fft_data_object = data_object.fft_signals[0]
+            x_min, x_max = fft_data_object.fmin, fft_data_object.fmin + fft_data_object.df * fft_data_object.num_samples
         elif data_object.data_type == Data_Type.FREQ_LIMIT:
-            if self.x_min is None or self.x_max is None:
-                self.x_min = data_object.freq_min
-                self.x_max = data_object.freq_max
-            else:
-                self.x_min = min(self.x_min, data_object.freq_min)
-                self.x_max = max(self.x_max, data_object.freq_max)
-            # print(f'Freq limit x_min: {self.x_min} - x_max: {self.x_max}')
+            x_min, x_max = data_object.freq_min, data_object.freq_max
         elif data_object.data_type == Data_Type.TEMP_LIMIT:
             if self.x_min is None or self.x_max is None:
                 # recupérer le xmin et xmax du plot
-                self.x_min = self.plot_widget.plotItem.vb.viewRange()[0][0]
-                self.x_max = self.plot_widget.plotItem.vb.viewRange()[0][1]
-            # print(f'Temp limit x_min: {self.x_min} - x_max: {self.x_max}')
+                self.x_min, self.x_max = self.plot_widget.plotItem.vb.viewRange()[0]
+            return
+        else:
+            return
 
-        if len(self.curves) == 0:
-            #cacher les axes Y
-            self.plot_widget.plotItem.hideAxis('left')
-            self.plot_widget.plotItem.hideAxis('right')
-        # Ajouter un axe Y supplémentaire à droite pour les courbes suivantes
-        viewbox = pg.ViewBox()
-        self.plot_widget.scene().addItem(viewbox)
-        viewbox.setXLink(self.plot_widget.plotItem.vb)  # Lier l'axe X avec le ViewBox principal
-
-        # Créer un nouvel axe Y à droite pour la courbe supplémentaire
-        axis = pg.AxisItem('right')
-        # axis.showLabel()
-        self.plot_widget.plotItem.layout.addItem(axis, 2, 3 + len(self.extra_axes))  # Ajouter l'axe à droite
-        axis.linkToView(viewbox)  # Lier l'axe Y au ViewBox
-        axis.setLabel(data_object.data_name, color=color)
-        self.plot_widget.plotItem.setXRange(self.x_min, self.x_max)
-
-        # Ajouter la courbe au nouveau ViewBox
-        curve = pg.PlotCurveItem(pen=pg.mkPen(color))
-        # Check if this is FFT data
+        if self.x_min is None or self.x_max is None:
+            self.x_min, self.x_max = x_min, x_max
+        else:
+            self.x_min = min(self.x_min, x_min)
+            self.x_max = max(self.x_max, x_max)
+
+    @staticmethod
+    def axis_key(data_object):
+        """
+        Clé de l'axe Y d'une donnée : son unité, ou la FFTS elle-même car la vue waterfall remplace son axe par les
+        frames.
+        """
         if data_object.data_type == Data_Type.FFTS:
-            print(f"FFT data detected: {data_object.data_name}")
-            curve, axis = self.setup_fft_animation(data_object, color)
-            axis.setLabel(data_object.data_name, color=color)
-            axis.linkToView(viewbox)  # Lier l'axe Y au ViewBox
+            return 'ffts', data_object.data_id
+        return 'unit', getattr(data_object, 'unit', None)
+
+    def add_curve(self, data_id, data_object, color):
+        """
+        Créer la courbe et son élément de légende, sans l'afficher. La courbe rejoint le ViewBox de son unité, créé
+        avec son axe Y à droite pour la première courbe de l'unité.
+        """
+        key = self.axis_key(data_object)
+        if key not in self.unit_axes:
+            viewbox = pg.ViewBox()
+            self.plot_widget.scene().addItem(viewbox)
+            viewbox.setXLink(self.plot_widget.plotItem.vb)  # Lier l'axe X avec le ViewBox principal
+
+            # Créer un nouvel axe Y à droite pour la nouvelle unité
             axis = pg.AxisItem('right')
-        viewbox.addItem(curve)
+            self.plot_widget.plotItem.layout.addItem(axis, 2, 3 + len(self.extra_axes))  # Ajouter l'axe à droite
+            axis.linkToView(viewbox)  # Lier l'axe Y au ViewBox
+            if self.y_axis_grouped:
+                axis.hide()
+            self.extra_axes.append((axis, viewbox))
+            self.unit_axes[key] = (axis, viewbox)
+        axis, viewbox = self.unit_axes[key]
 
-        # Stocker l'axe et le ViewBox pour les courbes supplémentaires
-        self.extra_axes.append((axis, viewbox))
+        # Ajouter la courbe au ViewBox de son unité, ou au ViewBox principal quand les axes Y sont groupés
+        curve = pg.PlotCurveItem(pen=pg.mkPen(color))
+        (self.plot_widget.plotItem.vb if self.y_axis_grouped else viewbox).addItem(curve)
+        self.curve_axes[data_id] = key
+        # Check if this is FFT data
+        if data_object.data_type == Data_Type.FFTS:
+            logger.debug("FFT data detected: %s", data_object.data_name)
+            # Chaque FFTS a sa courbe, son ViewBox et son axe
+            self.setup_fft_animation(data_object, curve, axis)
 
-        # return # FFT data handled, no further processing
         # Ajouter la courbe à la liste des courbes tracées
-
         self.curves[data_id] = curve
-        # self.legend.addItem(curve, name=data_object.data_name)
-
-        self.plot_widget.setLimits(xMin=self.x_min, xMax=self.x_max)
-
-        # Afficher les données du signal
-        self.display_signal(data_id, curve)
-
-        # Synchroniser les ViewBox avec le graphique principal
-        self.update_viewbox_geometry()
+        self.update_axis_label(key, color)
 
         # Ajouter un élément de légende en dessous
         self.add_legend_item(data_id, data_object.data_name, color=color)
 
-        # redefinir une couleur qui change en fonction du nombre de courbes pour toutes les courbes
-        for i, dataid in enumerate(self.curves.keys()):
-            print(f"Data id: {dataid}")
+    def update_axis_label(self, key, color='b'):
+        """ Nom de la donnée sur l'axe d'une seule courbe, unité sur l'axe partagé par plusieurs courbes. """
+        axis, _ = self.unit_axes[key]
+        data_ids = [data_id for data_id, curve_key in self.curve_axes.items() if curve_key == key]
+        if len(data_ids) == 1:
+            axis.setLabel(self.data_resolver.handle(data_ids[0]).data_name, color=color)
+        else:
+            axis.setLabel(f"{key[1]} ({len(data_ids)} curves)", color=color)
 
+    def recolor_curves(self):
+        """ Répartir les teintes entre toutes les courbes, les limites restant en rouge. """
+        colors = {}
+        for i, dataid in enumerate(self.curves.keys()):
             # recuperer le type de la data
-            datacurve = self.data_pool.get_data_info(dataid)['data_object'].iloc[0]
-            data_type = datacurve.data_type
-            print(f"Data type: {data_type}")
+            data_type = self.data_resolver.handle(dataid).data_type
             #si la data est une limite, on met du rouge sinon on met couleur en fonction de l'index de la courbe
-            if data_type == Data_Type.FREQ_LIMIT or datacurve.data_type == Data_Type.TEMP_LIMIT:
-                print("Data is a limit")
-                color: QColor = QColor('red')
+            if data_type == Data_Type.FREQ_LIMIT or data_type == Data_Type.TEMP_LIMIT:
+                colors[dataid] = QColor('red')
             else:
-                color: QColor = self.generate_color(i, len(self.curves))
-            if color.isValid():
-                # recuperer le label de la courbe
-                print(f"Data name: {datacurve.data_name}")
-                color_button: QColorDialog = None
-                label: QLabel = None
-                label , color_button = self.find_label_and_color_button_by_data_name(datacurve.data_name)
-
-                print(f"Label: {label.text()}, Color button: {color_button}")
-                # changer la couleur de la courbe
-                self.change_curve_color(dataid, label, color_button, rgb_color=color)
-
-    def display_signal(self, data_id, curve=None):
+                colors[dataid] = self.generate_color(i, len(self.curves))
+            self.curves[dataid].setPen(pg.mkPen(colors[dataid]))
+        # Une seule notification de la légende pour toutes les courbes
+        self.legend_model.set_colors(colors)
+
+    def display_signal(self, data_id, curve=None, max_points=None):
         """ Afficher les données pour un data_id spécifique """
-        data_object = self.data_pool.get_data_info(data_id)['data_object'].iloc[0]
+        if not self.legend_model.is_visible(data_id):
+            # Courbe masquée : aucune lecture ni décimation
+            return
+        data_object = self.data_resolver.data_object(data_id)
 
         if data_object.data_type == Data_Type.FFTS:
-            self.curves[data_id] = self.fft_curve
-            self.display_fft_frame(0)
+            sequence = self.fft_sequences[data_id]
+            if sequence.sync():
+                self.playback_clock.update_range()
+            if self.waterfall_mode and data_id == self.fft_data.data_id:
+                self.update_waterfall()
+            elif len(sequence):
+                frame_index = sequence.frame_at(self.playback_clock.position)
+                self.current_frames[data_id] = frame_index
+                self.display_fft_frame(data_id, frame_index)
             return
-        elif data_object.data_type == Data_Type.FREQ_LIMIT:
-            # Special handling for frequency limits
-            x_data = np.linspace(self.x_min, self.x_max, self.max_points)
-            y_data = [data_object.interpolate(freq) for freq in x_data]  # Interpolate limit level at each frequency
-
-            # Use a dashed line or specific color for frequency limits
-            if curve:
-                curve.setData(x_data, y_data, pen=pg.mkPen('r', style=pg.QtCore.Qt.DashLine))
+        elif data_object.data_type in (Data_Type.FREQ_LIMIT, Data_Type.TEMP_LIMIT):
+            if data_object.data_type == Data_Type.FREQ_LIMIT:
+                # Polyligne issue des points de cassure, simplement recadrée sur la vue
+                x_data, y_data = self.limit_curves.clipped(data_object, self.x_min, self.x_max)
+            elif data_object.data:
+                # Limite temporelle : le premier niveau, constant sur toute la vue
+                level = data_object.data[0][0]
+                x_data, y_data = np.array([self.x_min, self.x_max]), np.array([level, level])
             else:
-                limit_curve = pg.PlotCurveItem(x_data, y_data, pen=pg.mkPen('r', style=pg.QtCore.Qt.DashLine))
-                self.curves[data_id] = limit_curve
-                self.plot_widget.addItem(limit_curve)
-            return
-        elif data_object.data_type == Data_Type.TEMP_LIMIT:
-            # Special handling for temporal limits
-            x_data = np.linspace(self.x_min, self.x_max, self.max_points)
-            level = [level for level, transparency_time, release_time in data_object.data][0]
-            y_data = [level for t in x_data]  # Interpolate limit level at each frequency
-            # print(f"x_data: {x_data} - y_data: {y_data}")
+                x_data, y_data = np.empty(0), np.empty(0)
+
+            # Use a dashed line or specific color for limits
             if curve:
-                curve.setData(x_data, y_data, pen=pg.mkPen('r', style=pg.QtCore.Qt.DashLine))
+                curve.setData(x_data, y_data, pen=self.limit_pen)
             else:
-                limit_curve = pg.PlotCurveItem(x_data, y_data, pen=pg.mkPen('r', style=pg.QtCore.Qt.DashLine))
+                limit_curve = pg.PlotCurveItem(x_data, y_data, pen=self.limit_pen)
                 self.curves[data_id] = limit_curve
                 self.plot_widget.addItem(limit_curve)
             return
 
-        data_x_min = data_object.tmin if data_object.data_type is Data_Type.TEMPORAL_SIGNAL else data_object.fmin
-        data_x_max = data_x_min + data_object.dt * data_object.num_samples if data_object.data_type is Data_Type.TEMPORAL_SIGNAL else data_x_min + data_object.df * data_object.num_samples
-        plot_x_min, plot_x_max = curve.getViewBox().viewRange()[0][0], curve.getViewBox().viewRange()[0][1]
-        # Calculate chunk size based on the zoomed range to limit to `max_points`
-        visible_range = plot_x_max - plot_x_min
-        curve: PlotCurveItem
-        print(
-            f"Displaying data for {data_object.data_name}, type: {data_object.data_type},data_id: {data_id},data_object: {data_object}")
-
-        num_samples = data_object.num_samples
-        resolution = data_object.dt if data_object.data_type == Data_Type.TEMPORAL_SIGNAL else data_object.df
-
-        # visible_range = self.x_max - self.x_min
-        chunk_size = max(1, int(visible_range / resolution) // self.max_points)
-
-        print(f"Visible range: {visible_range}, Chunk size: {chunk_size}, Max points: {self.max_points}")
-
-        # Determine start and end chunk indices based on x_min and x_max
-        start_index = max(0, int(self.x_min / resolution))
-        end_index = min(num_samples, int(self.x_max / resolution))
-        visible_samples = end_index - start_index
-
-        # Adjust chunk size if visible_samples is less than max_points
-        if visible_samples < self.max_points:
-            chunk_size = 1
-
-        # Prepare arrays to store simplified x and y values
-        x_data, y_data_min, y_data_max = [], [], []
-
-        # Loop through data in chunks and simplify each chunk
-        for chunk_start in range(start_index, end_index, chunk_size):
-            chunk = self.data_pool.get_data_chunk(data_id, chunk_start // chunk_size, chunk_size=chunk_size)
+        if curve is None:
+            curve = self.curves[data_id]
+        x_min, x_max = self.x_min, self.x_max
+        max_points = max_points or self.pixel_columns()
+        if data_id in self.scope_traces:
+            # Mode scope : colonnes déjà réduites au fil de l'acquisition, aucun accès au signal complet
+            self.render_generation[data_id] = self.render_generation.get(data_id, 0) + 1
+            curve.setData(*self.scope_traces[data_id].arrays(x_min, x_max, max_points))
+            return
+        strategy = DECIMATION_STRATEGIES[self.decimation_strategies.get(data_id, self.default_decimation)]
+
+        def compute():
+            with span('decimate', data_id=data_id, strategy=strategy.name, max_points=max_points) as timing:
+                x_data, y_data = self.compute_signal_arrays(data_object, x_min, x_max, max_points, strategy)
+                timing.add(points=len(x_data))
+            return x_data, y_data
+
+        generation = self.render_generation.get(data_id, 0) + 1
+        self.render_generation[data_id] = generation
+        if self.async_rendering:
+            task = DecimationTask(data_id, generation, compute, self.decimation_signals, self.is_current_generation)
+            self.thread_pool.start(task)
+        else:
+            x_data, y_data = compute()
+            with span('set_data', data_id=data_id, points=len(x_data)):
+                curve.setData(x_data, y_data)
 
-            if len(chunk) == 0:
-                continue
+    def compute_signal_arrays(self, data_object, x_min, x_max, max_points, strategy):
+        """
+        Decimate a temporal or frequency signal over ``[x_min, x_max]`` to about ``max_points`` columns with the given
+        ``DecimationStrategy``.
 
-            # Min and max values within the chunk for simplification
-            min_value = np.min(chunk)
-            max_value = np.max(chunk)
+        Runs on a worker thread: it only reads the LOD cache and the signal source and never touches Qt items.
 
-            # x_value for each chunk based on start index and resolution
-            x_value = chunk_start * resolution
-            x_data.append(x_value)
-            y_data_min.append(min_value)
-            y_data_max.append(max_value)
+        :return: (x_data, y_data) ready for ``setData``
+        """
+        num_samples = data_object.num_samples
+        x0, step = signal_axis(data_object)
+
+        # Seuls les samples visibles (plus l'overscan) de ce signal sont lus, en tenant compte de son tmin/fmin
+        window = map_viewport(x_min, x_max, x0, step, num_samples, self.prefetch_margin)
+        if window.is_empty:
+            return np.empty(0), np.empty(0)
+        start_index, end_index, view_samples = window.start_index, window.end_index, window.view_samples
+        # Nombre de colonnes de pixels couvertes par la fenêtre lue (vue + overscan)
+        window_columns = max(1, int(max_points * (end_index - start_index) / max(1, view_samples)))
+
+        with span('io.lod', data_id=data_object.data_id):
+            pyramid = self.lod_cache.get(data_object.data_id, num_samples,
+                                         lambda: self.signal_source.iter_chunks(data_object))
+        level = pyramid.select_level(view_samples, max_points)
+
+        if level is not None:
+            # Lecture du niveau de la pyramide le plus grossier donnant encore max_points colonnes
+            block_starts, y_data_min, y_data_max = pyramid.get_range(level, start_index, end_index)
+            return strategy.reduce_columns(x0, step, block_starts, 1 << level, y_data_min, y_data_max,
+                                           self.signal_source.samples(data_object), window_columns)
+
+        if view_samples < 2 * max_points:
+            # Assez peu de samples visibles pour les tracer tels quels
+            with span('io.raw', data_id=data_object.data_id, samples=end_index - start_index):
+                samples = self.signal_source.read_range(data_object, start_index, end_index)
+            return x0 + np.arange(start_index, start_index + len(samples)) * step, samples
+
+        # Niveaux fins : colonnes min/max servies par le cache de tuiles, seules les tuiles manquantes sont calculées
+        level = int(view_samples // max_points).bit_length() - 1
+        first_column, last_column = start_index >> level, -(-end_index >> level)
+        y_data_min, y_data_max = self.tile_cache.get_columns(
+            data_object.data_id, num_samples, level, first_column, last_column,
+            lambda tile_index: self.compute_tile(data_object, level, tile_index))
+        block_starts = np.arange(first_column, first_column + len(y_data_min), dtype=np.int64) << level
+        return strategy.reduce_columns(x0, step, block_starts, 1 << level, y_data_min, y_data_max,
+                                       self.signal_source.samples(data_object), window_columns)
+
+    def compute_tile(self, data_object, level, tile_index):
+        """Reduce the raw samples covered by one tile of ``level`` into its min/max columns."""
+        block_size = 1 << level
+        tile_samples = self.tile_cache.tile_columns * block_size
+        start = tile_index * tile_samples
+        with span('io.tile', data_id=data_object.data_id, level=level, tile=tile_index):
+            samples = self.signal_source.read_range(data_object, start, start + tile_samples)
+            return reduce_min_max(samples, block_size)
+
+    def pixel_columns(self):
+        """Number of device pixel columns of the plot area, used as the decimation bucket count."""
+        width = self.plot_widget.plotItem.vb.width() * self.devicePixelRatioF()
+        return int(width) if width >= 16 else self.max_points
+
+    def set_decimation_strategy(self, data_id, name):
+        """Select the decimation strategy ('minmax', 'm4' or 'lttb') of one curve and redraw it."""
+        if name not in DECIMATION_STRATEGIES:
+            raise ValueError(f"Unknown decimation strategy {name}, expected one of {list(DECIMATION_STRATEGIES)}")
+        self.decimation_strategies[data_id] = name
+        if data_id in self.curves:
+            self.display_signal(data_id, self.curves[data_id])
 
-        # Combine min and max for line drawing
-        x_data = np.repeat(x_data, 2)
-        y_data = np.empty_like(x_data)
-        y_data[0::2], y_data[1::2] = y_data_min, y_data_max
+    def is_current_generation(self, data_id, generation):
+        """Return True if ``generation`` is still the latest render request of ``data_id``."""
+        return self.render_generation.get(data_id) == generation
 
-        # Update plot data
-        if curve:
-            curve.setData(x_data, y_data)
-        else:
-            self.curves[data_id].setData(x_data, y_data)
-
-    def setup_fft_animation(self, fft_data, color):
-        """Setup the plot and slider for FFT animation."""
-        self.fft_data = fft_data  # Store FFT data for playback
-        self.timestamp_slider.setMaximum(len(fft_data.fft_signals) - 1)
-        self.timestamp_slider.setValue(0)
-        self.current_frame = 0
-        self.is_animating = False
-
-        # Create a curve for FFT data
-        self.fft_curve = self.plot_widget.plot(pen=pg.mkPen(color))
-        # recuperer l'axe Y
-        axis = self.plot_widget.getAxis('right')
-        # self.fft_curve = pg.PlotCurveItem(pen=pg.mkPen(color))
-        self.curves[fft_data.data_id] = self.fft_curve
+    def apply_decimation_result(self, result):
+        """Push a decimated curve computed by a worker, unless a newer request has been made since."""
+        if not self.is_current_generation(result.data_id, result.generation) or result.data_id not in self.curves:
+            return
+        with span('set_data', data_id=result.data_id, points=len(result.x_data)):
+            self.curves[result.data_id].setData(result.x_data, result.y_data)
+        self.last_render_ms = result.elapsed_ms
+
+    def wait_for_rendering(self, timeout_ms=-1):
+        """Block until the scheduled redraws and pending decimation tasks are done and their results applied."""
+        self.render_scheduler.flush()
+        self.thread_pool.waitForDone(timeout_ms)
+        QCoreApplication.processEvents()
+
+    def setup_fft_animation(self, fft_data, curve, axis):
+        """Setup the slider for FFT animation; several FFTS can be played together on one plot."""
+        self.fft_data = fft_data  # dernière FFTS ajoutée, celle de la vue waterfall
+        self.fft_curve = curve
+        self.fft_axis = axis
+        self.fft_sequences[fft_data.data_id] = FFTSequence(fft_data, self.data_pool, self.signal_source)
+        self.current_frames[fft_data.data_id] = None
+        self.curves[fft_data.data_id] = curve
+        self.waterfall = None
 
         # afficher le player controler
         self.animation_controls.setVisible(True)
 
-        # Display the first frame
-        self.display_fft_frame(0)
-        return self.fft_curve, axis
+        # Display the frame due at the current playback position
+        self.playback_clock.update_range()
+        self.show_position(self.playback_clock.position)
+        if self.waterfall_mode:
+            self.set_waterfall_mode(True)
 
     def init_animation_controls(self, parent_widget):
         """ Initialize animation playback controls for FFT data. """
@@ -333,86 +510,302 @@ class SignalPlotWidget(QWidget):
         self.stop_button.clicked.connect(self.stop_animation)
         control_layout.addWidget(self.stop_button)
 
+        # Waterfall toggle
+        self.waterfall_button = QPushButton("Waterfall")
+        self.waterfall_button.setCheckable(True)
+        self.waterfall_button.toggled.connect(self.set_waterfall_mode)
+        control_layout.addWidget(self.waterfall_button)
+
+        # Playback speed multiplier
+        self.speed_selector = QComboBox()
+        self.speed_selector.addItems(["0.25x", "0.5x", "1x", "2x", "4x", "10x"])
+        self.speed_selector.setCurrentText("1x")
+        self.speed_selector.currentTextChanged.connect(lambda text: self.playback_clock.set_speed(float(text[:-1])))
+        control_layout.addWidget(self.speed_selector)
+
         # Timestamp slider
         self.timestamp_slider = QSlider()
         self.timestamp_slider.setOrientation(pg.QtCore.Qt.Horizontal)
-        self.timestamp_slider.valueChanged.connect(self.seek_frame)
+        self.timestamp_slider.valueChanged.connect(self.seek_position)
         control_layout.addWidget(self.timestamp_slider)
 
         # Current frame label
-        self.frame_label = QLabel("Frame: 0")
+        self.frame_label = QLabel("t = 0.000 s")
         control_layout.addWidget(self.frame_label)
 
-    def display_fft_frame(self, frame_index):
-        """Display a single FFT frame (frequency domain data) by index."""
-        fft_signal: FreqSignalData = self.fft_data.fft_signals[frame_index]
-        freq_range = np.linspace(fft_signal.fmin, fft_signal.fmin + fft_signal.df * fft_signal.num_samples,
-                                 fft_signal.num_samples)
-        self.fft_curve.setData(freq_range, fft_signal.data)
-        self.frame_label.setText(f"Frame: {frame_index}")
+    def display_fft_frame(self, data_id, frame_index):
+        """Display one frame of an FFTS by index, reduced to the pixel width of the plot."""
+        sequence = self.fft_sequences[data_id]
+        # Seuls les bins visibles (plus l'overscan) sont lus, puis réduits à la largeur en pixels
+        window = map_viewport(self.x_min, self.x_max, sequence.fmin, sequence.df, sequence.num_bins,
+                              self.prefetch_margin)
+        max_points = self.pixel_columns()
+        x_data, y_data = self.frame_prefetcher.get(sequence, frame_index, window.start_index, window.end_index,
+                                                   max_points)
+        self.curves[data_id].setData(x_data, y_data)
+        if self.playback_clock.playing:
+            upcoming = range(frame_index + 1, min(frame_index + 1 + self.prefetch_frames, len(sequence)))
+            self.frame_prefetcher.prefetch(sequence, upcoming, window.start_index, window.end_index, max_points)
+
+    def playback_range(self):
+        """Return the ``(start, end)`` timestamps spanned by the FFTS of the plot, or None without any frame."""
+        ranges = [(sequence.start_time, sequence.end_time) for sequence in self.fft_sequences.values() if len(sequence)]
+        if not ranges:
+            return None
+        return min(start for start, _ in ranges), max(end for _, end in ranges)
+
+    def show_position(self, position):
+        """
+        Show, for every FFTS of the plot, the frame due at ``position`` in a single pass.
+
+        Only the curves whose frame changed are redrawn; frames skipped while playing are counted as dropped.
+        """
+        for data_id, sequence in self.fft_sequences.items():
+            if not len(sequence) or not self.legend_model.is_visible(data_id):
+                continue
+            frame_index = sequence.frame_at(position)
+            previous = self.current_frames.get(data_id)
+            if frame_index == previous:
+                continue
+            if self.playback_clock.playing and previous is not None and frame_index > previous + 1:
+                self.dropped_frames += frame_index - previous - 1
+            self.current_frames[data_id] = frame_index
+            self.display_fft_frame(data_id, frame_index)
+
+        # Le slider est en millisecondes depuis le début de la lecture ; bloqué pour ne pas relancer seek_position
+        clock = self.playback_clock
+        self.timestamp_slider.blockSignals(True)
+        self.timestamp_slider.setMaximum(round((clock.end_time - clock.start_time) * 1000))
+        self.timestamp_slider.setValue(round((position - clock.start_time) * 1000))
+        self.timestamp_slider.blockSignals(False)
+        self.frame_label.setText(f"t = {position:.3f} s")
+        self.render_stats.frame()
+
+    def set_waterfall_mode(self, enabled):
+        """Show the FFTS sequence as a frames x bins image instead of the single-frame animation."""
+        self.waterfall_mode = enabled
+        if self.fft_curve is None:
+            # Aucune FFTS sur le graphique
+            self.waterfall_timer.stop()
+            return
+        if enabled:
+            viewbox = self.fft_curve.getViewBox()
+            if self.waterfall_image is None:
+                self.waterfall_image = pg.ImageItem(axisOrder='row-major')
+                self.waterfall_image.setColorMap(pg.colormap.get('viridis'))
+            # L'image suit la dernière FFTS ajoutée, dans son propre ViewBox
+            self.move_waterfall_image()
+            self.update_waterfall()
+            self.fft_axis.setLabel("Frame")
+            viewbox.enableAutoRange(axis='y')
+            self.waterfall_timer.start()
+        else:
+            self.waterfall_timer.stop()
+            if self.fft_data is not None:
+                self.fft_axis.setLabel(self.fft_data.data_name)
+        if self.waterfall_image is not None:
+            self.waterfall_image.setVisible(enabled)
+        self.fft_curve.setVisible(not enabled)
+
+    def move_waterfall_image(self):
+        """ Garder l'image waterfall dans le ViewBox de la courbe de sa FFTS (groupement des axes Y). """
+        if self.waterfall_image is None or self.fft_curve is None:
+            return
+        viewbox = self.fft_curve.getViewBox()
+        if self.waterfall_image.getViewBox() is not viewbox:
+            if self.waterfall_image.getViewBox() is not None:
+                self.waterfall_image.getViewBox().removeItem(self.waterfall_image)
+            viewbox.addItem(self.waterfall_image)
+
+    def update_waterfall(self):
+        """
+        Stack the frames added to the FFTS since the last update and upload the image once.
+
+        Polled every ``waterfall_timer`` interval while the waterfall is shown; nothing is read when no frame arrived.
+        """
+        frame_ids = self.fft_data.data
+        if not frame_ids:
+            return
+        if self.waterfall is None:
+            first_frame = self.data_resolver.data_object(frame_ids[0])
+            self.waterfall = WaterfallBuffer(first_frame.num_samples, initial_frames=len(frame_ids))
+            self.waterfall_axis = (first_frame.fmin, first_frame.df)
+        load_frame = lambda data_id: self.signal_source.samples(self.data_resolver.data_object(data_id))
+        if not self.waterfall.sync(frame_ids, load_frame) and self.waterfall_image.image is not None:
+            return
+        fmin, df = self.waterfall_axis
+        self.waterfall_image.setImage(self.waterfall.image, autoLevels=False, levels=self.waterfall.levels)
+        self.waterfall_image.setRect(pg.QtCore.QRectF(fmin, 0, df * self.waterfall.num_bins, self.waterfall.num_frames))
 
     def play_animation(self):
-        """Start or resume the FFT animation."""
-        if not self.is_animating:
-            self.fft_timer.start(100)  # Update every 100 ms
-            self.is_animating = True
+        """Start or resume the FFT animation of every plot sharing the playback clock."""
+        if not self.playback_clock.playing:
+            self.playback_clock.play()
 
     def pause_animation(self):
         """Pause the FFT animation."""
-        self.fft_timer.stop()
-        self.is_animating = False
+        self.playback_clock.pause()
 
     def stop_animation(self):
         """Stop the FFT animation and reset to the first frame."""
-        self.fft_timer.stop()
-        self.is_animating = False
-        self.current_frame = 0
-        self.timestamp_slider.setValue(0)
-        self.display_fft_frame(0)
-
-    def update_animation_frame(self):
-        """Advance the animation to the next frame."""
-        if self.current_frame < len(self.fft_data.fft_signals) - 1:
-            self.current_frame += 1
-            self.timestamp_slider.setValue(self.current_frame)
-            self.display_fft_frame(self.current_frame)
-        else:
-            self.stop_animation()  # End animation when reaching the last frame
+        self.playback_clock.stop()
+
+    def seek_position(self, slider_value):
+        """Seek the playback to the slider position, in milliseconds from the first frame."""
+        self.playback_clock.seek(self.playback_clock.start_time + slider_value / 1000)
 
-    def seek_frame(self, frame_index):
-        """Seek to a specific frame in the FFT animation."""
-        self.current_frame = frame_index
-        self.display_fft_frame(frame_index)
+    def set_playback_clock(self, clock):
+        """Use a shared playback clock (X-linked group), or the widget's own one when ``clock`` is None."""
+        clock = clock if clock is not None else self.own_playback_clock
+        if self.playback_clock is not None:
+            self.playback_clock.detach(self)
+        self.playback_clock = clock
+        clock.attach(self)
+        self.show_position(clock.position)
 
     def add_legend_item(self, data_id, name, color):
-        """ Crée un élément de légende cliquable pour changer la couleur de la courbe. """
-        label = QLabel(name)
-        label.setStyleSheet(f"font-weight: bold;")
+        """ Ajoute la courbe à la légende, visible, avec sa couleur. """
+        self.legend_model.add(data_id, name, color)
 
-        # Bouton pour changer la couleur
-        color_button = QPushButton("")
-        color_button.setStyleSheet(f"background-color: {color};")
-        color_button.clicked.connect(lambda: self.change_curve_color(data_id, label, color_button))
+    def set_curve_visible(self, data_id, visible):
+        """
+        Show or hide a curve. A hidden curve is neither decimated nor redrawn until it is shown again, when it is
+        rendered for the current range.
+        """
+        self.legend_model.set_visible(data_id, visible)
 
-        # Ajouter au layout de la légende
-        self.legend_layout.addWidget(label)
-        self.legend_layout.addWidget(color_button)
+    def on_curve_visibility_changed(self, data_id, visible):
+        """ Appliquer la visibilité cochée dans la légende à la courbe. """
+        curve = self.curves.get(data_id)
+        if curve is None:
+            return
+        curve.setVisible(visible)
+        if visible:
+            self.display_signal(data_id, curve)
+        else:
+            # Résultat de décimation en cours ignoré
+            self.render_generation[data_id] = self.render_generation.get(data_id, 0) + 1
+
+    def set_scope_mode(self, enabled, window_seconds=None):
+        """
+        Switch the temporal signals of the plot to a rolling display of their last ``window_seconds``.
+
+        New samples are polled every ``scope_timer`` interval; only the appended samples are read.
+        """
+        if window_seconds is not None:
+            self.scope_window = window_seconds
+        viewbox = self.plot_widget.plotItem.vb
+        if enabled and not self.scope_mode:
+            self.scope_limits = tuple(viewbox.state['limits']['xLimits'])
+        self.scope_mode = enabled
+        self.scope_traces.clear()
+        if enabled:
+            # La vue suit la fin du signal, au-delà de l'étendue connue à l'ajout
+            self.plot_widget.setLimits(xMin=None, xMax=None)
+            self.update_scope()
+            self.scope_timer.start()
+        else:
+            self.scope_timer.stop()
+            if self.scope_limits is not None:
+                x_min, x_max = self.scope_limits
+                self.plot_widget.setLimits(xMin=x_min, xMax=x_max)
+                self.scope_limits = None
+            self.render_curves()
+
+    def update_scope(self):
+        """
+        Ingest the samples appended to the temporal signals, scroll the view to the newest one and redraw at full
+        resolution.
+
+        Scrolling is not a user interaction: it bypasses the render scheduler, whose coarse frames and postponed
+        refine pass would otherwise keep the trace at reduced resolution for the whole acquisition.
+        """
+        end_time = None
+        changed = False
+        for data_id in list(self.curves):
+            try:
+                data_object = self.data_resolver.data_object(data_id)
+            except PermissionError:
+                # Donnée en cours d'écriture : elle sera lue au prochain tick
+                continue
+            if data_object.data_type != Data_Type.TEMPORAL_SIGNAL:
+                continue
+            trace = self.scope_traces.get(data_id)
+            if trace is None:
+                trace = ScopeTrace(data_object.tmin, data_object.dt, self.scope_window)
+                self.scope_traces[data_id] = trace
+            changed = trace.ingest(data_object, self.signal_source) > 0 or changed
+            end_time = trace.end_time if end_time is None else max(end_time, trace.end_time)
+        if end_time is None:
+            return
+        x_range = (end_time - self.scope_window, end_time)
+        if (self.x_min, self.x_max) != x_range:
+            # handle_zoom met à jour la plage sans demander de rendu à l'ordonnanceur ; les ViewBox liés suivent
+            with self.silent_range_change():
+                self.plot_widget.setXRange(*x_range, padding=0)
+            self.x_min, self.x_max = x_range
+            changed = True
+        if changed:
+            # Colonnes déjà réduites par les traces : rendu pleine largeur peu coûteux
+            self.render_curves()
+
+    def set_stats_overlay(self, enabled):
+        """Show or hide the render statistics (time, points, samples read, cache hit ratio, FPS) over the plot."""
+        if enabled and self.stats_overlay is None:
+            self.stats_overlay = pg.TextItem(color='k', fill=pg.mkBrush(255, 255, 255, 200), anchor=(0, 0))
+            # Enfant du ViewBox et non de la scène des données : reste dans le coin quel que soit le zoom
+            self.stats_overlay.setParentItem(self.plot_widget.plotItem.vb)
+            self.stats_overlay.setPos(4, 4)
+        if self.stats_overlay is not None:
+            self.stats_overlay.setVisible(enabled)
+        if enabled:
+            self.update_stats_overlay()
+            self.stats_timer.start()
+        else:
+            self.stats_timer.stop()
+
+    def update_stats_overlay(self):
+        stats = self.render_stats
+        stats.last_render_ms = self.last_render_ms
+        stats.points = sum(len(curve.getData()[0] if curve.getData()[0] is not None else ())
+                           for curve in self.curves.values())
+        # Samples lus et efficacité du cache depuis le dernier rafraîchissement
+        samples_read = self.signal_source.samples_read
+        stats.samples_read = samples_read - self.stats_samples_read
+        self.stats_samples_read = samples_read
+        counts = (self.tile_cache.hits, self.tile_cache.misses)
+        hits, misses = counts[0] - self.stats_cache_counts[0], counts[1] - self.stats_cache_counts[1]
+        self.stats_cache_counts = counts
+        stats.hit_ratio = hits / (hits + misses) if hits + misses else None
+        self.stats_overlay.setText(stats.text())
 
     def handle_zoom(self, _, range):
         """Adjust display based on the zoom range, dynamically changing x_min and x_max."""
         x_min, x_max = range
 
-        # Restrict x_min and x_max within the signal range
-        # self.x_min = max(self.x_min, x_min)
-        # self.x_max = min(self.x_max, x_max)
-
         # Update x_min and x_max for all curves
         self.x_min = x_min
         self.x_max = x_max
+        if self.silent_range:
+            # Changement fait par programme, suivi de son propre rendu
+            return
 
-        # Trigger a full display refresh for all data curves
-        for data_id, curve in self.curves.items():
-            self.display_signal(data_id, curve)
+        # Les rafales de changements de plage sont regroupées en un rendu par frame
+        self.render_scheduler.request_render(self)
+
+    def render_curves(self, max_points=None):
+        """Redraw every curve for the current range, with ``max_points`` columns (full resolution by default)."""
+        for data_id, curve in list(self.curves.items()):
+            self.display_signal(data_id, curve, max_points)
+        self.render_stats.frame()
+
+    def set_render_scheduler(self, scheduler):
+        """Use a shared render scheduler (X-linked group), or the widget's own one when ``scheduler`` is None."""
+        scheduler = scheduler if scheduler is not None else self.own_render_scheduler
+        if self.render_scheduler is not None:
+            self.render_scheduler.detach(self)
+        self.render_scheduler = scheduler
+        scheduler.attach(self)
 
     def update_viewbox_geometry(self):
         """ S'assurer que tous les ViewBox sont synchronisés avec la géométrie du graphique principal. """
@@ -442,11 +835,71 @@ class SignalPlotWidget(QWidget):
 
     def remove_data(self, data_id):
         """ Supprimer une courbe spécifique du graphique. """
+        if data_id in self.fft_sequences:
+            del self.fft_sequences[data_id]
+            self.current_frames.pop(data_id, None)
+            self.frame_prefetcher.clear(data_id)
+            self.playback_clock.update_range()
         if data_id in self.curves:
             curve = self.curves.pop(data_id)
-            self.legend.removeItem(curve)
+            self.legend_model.remove(data_id)
+            self.render_generation.pop(data_id, None)
+            self.scope_traces.pop(data_id, None)
+            if curve.getViewBox() is not None:
+                curve.getViewBox().removeItem(curve)
             curve.clear()
-            print(f"Removed curve for data_id {data_id}")
+            self.remove_curve_axis(data_id)
+            logger.debug("Removed curve for data_id %s", data_id)
+        if self.fft_data is not None and self.fft_data.data_id == data_id:
+            self.retarget_waterfall()
+
+    def retarget_waterfall(self):
+        """
+        La FFTS de la vue waterfall a été retirée : la vue passe à la dernière FFTS restante, ou est masquée s'il n'en
+        reste aucune. Le buffer et l'image de l'ancienne FFTS sont abandonnés.
+        """
+        if self.waterfall_image is not None and self.waterfall_image.getViewBox() is not None:
+            self.waterfall_image.getViewBox().removeItem(self.waterfall_image)
+        self.waterfall_image = None
+        self.waterfall = None
+        self.waterfall_axis = None
+        if self.fft_sequences:
+            data_id = list(self.fft_sequences)[-1]
+            self.fft_data = self.data_resolver.data_object(data_id)
+            self.fft_curve = self.curves[data_id]
+            self.fft_axis = self.unit_axes[self.curve_axes[data_id]][0]
+            if self.waterfall_mode:
+                self.set_waterfall_mode(True)
+        else:
+            self.fft_data = self.fft_curve = self.fft_axis = None
+            self.waterfall_timer.stop()
+            self.waterfall_mode = False
+            self.waterfall_button.blockSignals(True)
+            self.waterfall_button.setChecked(False)
+            self.waterfall_button.blockSignals(False)
+            self.animation_controls.setVisible(False)
+
+    def remove_curve_axis(self, data_id):
+        """ Retirer l'axe et le ViewBox de l'unité de ``data_id`` quand sa dernière courbe est supprimée. """
+        key = self.curve_axes.pop(data_id, None)
+        if key is None:
+            return
+        if key in self.curve_axes.values():
+            self.update_axis_label(key)
+            return
+        axis, viewbox = self.unit_axes.pop(key)
+        self.extra_axes.remove((axis, viewbox))
+        layout = self.plot_widget.plotItem.layout
+        layout.removeItem(axis)
+        self.plot_widget.scene().removeItem(axis)
+        self.plot_widget.scene().removeItem(viewbox)
+        # Colonnes des axes restants resserrées, axe partagé compris
+        for i, (other_axis, _) in enumerate(self.extra_axes):
+            layout.removeItem(other_axis)
+            layout.addItem(other_axis, 2, 3 + i)
+        if self.y_axis_grouped:
+            layout.removeItem(self.shared_axis)
+            layout.addItem(self.shared_axis, 2, 3 + len(self.extra_axes))
 
     def is_compatible(self, data_id):
         """
@@ -456,10 +909,7 @@ class SignalPlotWidget(QWidget):
         if not self.curves:
             return True
 
-        new_data_info = self.data_pool.get_data_info(data_id)
-        new_data_object = new_data_info['data_object'].iloc[0]
-        new_data_type = new_data_object.data_type
-        print(f"New data type: {new_data_type} - Current data type: {self.data_type}")
+        new_data_type = self.data_resolver.handle(data_id).data_type
         if new_data_type == self.data_type or self.data_type is None:
             return True
 
@@ -474,8 +924,10 @@ class SignalPlotWidget(QWidget):
 
     def toggle_y_axis_grouping(self):
         """
-        Active ou désactive l'affichage d'un axe Y partagé, sans modifier les ViewBoxes.
+        Active ou désactive l'affichage d'un axe Y partagé : toutes les courbes passent dans le ViewBox principal, les
+        ViewBox par unité sont vidés.
         """
+        main_viewbox = self.plot_widget.plotItem.vb
         if not self.y_axis_grouped:
             # Activer un axe Y unique pour toutes les courbes
             # Cacher tous les axes individuels
@@ -483,18 +935,24 @@ class SignalPlotWidget(QWidget):
                 axis.hide()
 
             # Ajouter un seul axe Y partagé si non existant
+            layout = self.plot_widget.plotItem.layout
             if not hasattr(self, 'shared_axis'):
                 self.shared_axis = pg.AxisItem('right')
                 self.shared_axis.setGrid(150)
-                # Ajouter l'axe partagé à droite du layout
-                self.plot_widget.plotItem.layout.addItem(self.shared_axis, 2, 3 + len(self.extra_axes))
-
-            # Lier l'axe partagé au ViewBox principal
-            self.shared_axis.linkToView(self.plot_widget.plotItem.vb)
-
-            # Synchroniser tous les ViewBoxes avec le ViewBox principal
-            for _, viewbox in self.extra_axes:
-                viewbox.setYLink(self.plot_widget.plotItem.vb)
+                # Lier l'axe partagé au ViewBox principal
+                self.shared_axis.linkToView(main_viewbox)
+            else:
+                layout.removeItem(self.shared_axis)
+            # Axe partagé à droite des axes par unité
+            layout.addItem(self.shared_axis, 2, 3 + len(self.extra_axes))
+
+            # Déplacer toutes les courbes dans le ViewBox principal
+            for curve in self.curves.values():
+                if curve.getViewBox() is not main_viewbox:
+                    curve.getViewBox().removeItem(curve)
+                    main_viewbox.addItem(curve)
+            self.move_waterfall_image()
+            main_viewbox.enableAutoRange(axis='y')
 
             # Afficher l'axe partagé
             self.shared_axis.show()
@@ -506,41 +964,30 @@ class SignalPlotWidget(QWidget):
                 # Cacher l'axe partagé au lieu de le supprimer
                 self.shared_axis.hide()
 
-            # Dissocier les liens Y de tous les ViewBoxes
-            for _, viewbox in self.extra_axes:
-                viewbox.setYLink(None)
+            # Remettre chaque courbe dans le ViewBox de son unité
+            for data_id, curve in self.curves.items():
+                viewbox = self.unit_axes[self.curve_axes[data_id]][1]
+                if curve.getViewBox() is not viewbox:
+                    main_viewbox.removeItem(curve)
+                    viewbox.addItem(curve)
+            self.move_waterfall_image()
 
             # Réafficher les axes individuels
-            for i, (axis, viewbox) in enumerate(self.extra_axes):
+            for axis, viewbox in self.extra_axes:
                 axis.show()
-                axis.linkToView(viewbox)  # Relier chaque axe Y à son viewbox spécifique
-                self.plot_widget.plotItem.layout.addItem(axis, 2, 3 + i)  # Réajouter chaque axe à droite dans le layout
+                viewbox.enableAutoRange(axis='y')
 
             self.y_axis_grouped = False
 
-    def find_label_and_color_button_by_data_name(self, data_name):
-        """ Trouver l'élément de légende correspondant au nom de la donnée. """
-        for i in range(0, self.legend_layout.count(), 2):
-            label = self.legend_layout.itemAt(i).widget()
-            print(label.text())
-            if data_name in label.text():
-                # Trouver le bouton de couleur correspondant
-                color_button = self.legend_layout.itemAt(i + 1).widget()
-                return label, color_button
-
-    def change_curve_color(self, data_id, label, color_button=None, rgb_color=None):
-        """ Permet de changer la couleur de la courbe en cliquant sur l'élément de légende. """
-        color = None
-        if rgb_color:
+    def change_curve_color(self, data_id, rgb_color=None):
+        """ Change la couleur de la courbe, choisie dans un QColorDialog si ``rgb_color`` n'est pas donnée. """
+        if rgb_color is not None:
             color = QColor(rgb_color)
-            print(f"Changing color to {color.name()}")
-        elif color_button:
-            color = QColorDialog.getColor()
+        else:
+            color = QColorDialog.getColor(self.legend_model.color(data_id))
         if color.isValid():
-            hex_color = color.name()
-            label.setStyleSheet(f"font-weight: bold;")
-            color_button.setStyleSheet(f"background-color: {hex_color};")
-            self.curves[data_id].setPen(pg.mkPen(hex_color))
+            self.legend_model.set_colors({data_id: color})
+            self.curves[data_id].setPen(pg.mkPen(color.name()))
 
     def generate_color(self, index, num_curves):
         """
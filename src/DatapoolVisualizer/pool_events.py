@@ -0,0 +1,36 @@
+class PoolEvent:
+    """
+    One change made to a DataPool, as reported by ``DataPoolNotifier``.
+
+    :param kind: One of the kind constants below.
+    :param data_id: Data concerned by the change.
+    :param source_id: Source of the data, when the pool call provides it.
+    :param subscriber_id: Subscriber concerned, for subscription and acknowledgement changes.
+    """
+    REGISTERED = 'registered'
+    STORED = 'stored'
+    SUBSCRIBED = 'subscribed'
+    ACKNOWLEDGED = 'acknowledged'
+    LOCKED = 'locked'
+    UNLOCKED = 'unlocked'
+    REMOVED = 'removed'
+
+    def __init__(self, kind, data_id, source_id=None, subscriber_id=None):
+        self.kind = kind
+        self.data_id = data_id
+        self.source_id = source_id
+        self.subscriber_id = subscriber_id
+
+    @property
+    def key(self):
+        return self.kind, self.data_id, self.source_id, self.subscriber_id
+
+    def __eq__(self, other):
+        return isinstance(other, PoolEvent) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"PoolEvent({self.kind!r}, {self.data_id!r}, source_id={self.source_id!r}, " \
+               f"subscriber_id={self.subscriber_id!r})"
@@ -0,0 +1,139 @@
+from src.DatapoolVisualizer.pool_events import PoolEvent
+
+
+class RegistryIndex:
+    """
+    Dictionary lookups over the three DataFrame registries of a DataPool.
+
+    The index is built in one pass over each registry (``rebuild``), then kept up to date from the ``PoolEvent``
+    flushed by a ``DataPoolNotifier`` (``apply_events``), so that looking up a data, its source or its subscribers is
+    O(1) instead of a filtered DataFrame scan.
+    """
+    # Au-delà de cette part des données touchées (et d'au moins REBUILD_MIN données), une reconstruction complète est
+    # moins chère que les mises à jour unitaires
+    REBUILD_FRACTION = 0.25
+    REBUILD_MIN = 100
+
+    def __init__(self):
+        self.data_rows = {}  # data_id -> {'data_name', 'data_type', 'storage_type', 'data_object'}
+        self.source_rows = {}  # data_id -> {'source_id', 'locked', 'protected'}
+        self.source_data = {}  # source_id -> {data_id: None}, dans l'ordre d'enregistrement
+        # data_id -> {subscriber_id: [acquitement de chaque ligne]} : le pool accepte plusieurs lignes pour un même
+        # couple (data_id, subscriber_id)
+        self.subscribers = {}
+
+    @classmethod
+    def from_pool(cls, pool):
+        index = cls()
+        index.rebuild(pool.data_registry, pool.source_to_data, pool.subscriber_to_data)
+        return index
+
+    def rebuild(self, data_registry, source_to_data, subscriber_to_data):
+        """Rebuild every lookup from the registries."""
+        self.data_rows = {
+            data_id: {'data_name': data_name, 'data_type': data_type, 'storage_type': storage_type,
+                      'data_object': data_object}
+            for data_id, data_name, data_type, storage_type, data_object in zip(
+                data_registry['data_id'].values, data_registry['data_name'].values,
+                data_registry['data_type'].values, data_registry['storage_type'].values,
+                data_registry['data_object'].values)}
+        self.source_rows = {
+            data_id: {'source_id': source_id, 'locked': locked, 'protected': protected}
+            for source_id, data_id, locked, protected in zip(
+                source_to_data['source_id'].values, source_to_data['data_id'].values,
+                source_to_data['locked'].values, source_to_data['protected'].values)}
+        # Un seul groupby : positions des lignes de chaque source
+        data_ids = source_to_data['data_id'].values
+        self.source_data = {source_id: dict.fromkeys(data_ids[positions]) for source_id, positions in
+                            source_to_data.groupby('source_id', sort=False).indices.items()}
+        self.subscribers = {}
+        for subscriber_id, data_id, acquitted in zip(subscriber_to_data['subscriber_id'].values,
+                                                     subscriber_to_data['data_id'].values,
+                                                     subscriber_to_data['acquitements'].values):
+            self.subscribers.setdefault(data_id, {}).setdefault(subscriber_id, []).append(acquitted)
+
+    def apply_events(self, pool, events):
+        """
+        Update the index from flushed pool events.
+
+        The index is rebuilt from scratch only when the events touch a large part of it: many events on the same data
+        (a signal stored at a high rate) are still applied one by one.
+
+        :return: The data_id whose entries changed, or None when the index was rebuilt from scratch.
+        """
+        changed = dict.fromkeys(event.data_id for event in events)
+        if len(changed) > max(self.REBUILD_MIN, self.REBUILD_FRACTION * len(self.data_rows)):
+            self.rebuild(pool.data_registry, pool.source_to_data, pool.subscriber_to_data)
+            return None
+        for event in events:
+            self.apply_event(pool, event)
+        return list(changed)
+
+    def apply_event(self, pool, event):
+        data_id = event.data_id
+        if event.kind == PoolEvent.REGISTERED:
+            self._index_registered(pool, data_id)
+        elif event.kind == PoolEvent.REMOVED:
+            self.remove(data_id)
+        elif data_id not in self.data_rows:
+            return
+        elif event.kind == PoolEvent.SUBSCRIBED:
+            self.subscribers.setdefault(data_id, {}).setdefault(event.subscriber_id, []).append(0)
+        elif event.kind == PoolEvent.ACKNOWLEDGED:
+            acks = self.subscribers.get(data_id, {}).get(event.subscriber_id)
+            if acks:
+                # acknowledge_data acquitte la première ligne du couple, même déjà acquittée
+                acks[0] = True
+        elif event.kind in (PoolEvent.LOCKED, PoolEvent.UNLOCKED, PoolEvent.STORED):
+            # store_data déverrouille la donnée après l'écriture
+            self.source_rows[data_id]['locked'] = event.kind == PoolEvent.LOCKED
+
+    @staticmethod
+    def _registry_row(registry, data_id):
+        """Row of ``data_id`` in ``registry``, or None. The last row is checked first, where new data is appended."""
+        if not len(registry):
+            return None
+        row = registry.iloc[-1]
+        if row['data_id'] == data_id:
+            return row
+        rows = registry[registry['data_id'] == data_id]
+        return None if rows.empty else rows.iloc[0]
+
+    def _index_registered(self, pool, data_id):
+        data_row = self._registry_row(pool.data_registry, data_id)
+        source_row = self._registry_row(pool.source_to_data, data_id)
+        if data_row is None or source_row is None:
+            # Donnée déjà supprimée avant le flush
+            self.remove(data_id)
+            return
+        self.data_rows[data_id] = {'data_name': data_row['data_name'], 'data_type': data_row['data_type'],
+                                   'storage_type': data_row['storage_type'], 'data_object': data_row['data_object']}
+        self.source_rows[data_id] = {'source_id': source_row['source_id'], 'locked': source_row['locked'],
+                                     'protected': source_row['protected']}
+        self.source_data.setdefault(source_row['source_id'], {})[data_id] = None
+
+    def remove(self, data_id):
+        self.data_rows.pop(data_id, None)
+        self.subscribers.pop(data_id, None)
+        source_row = self.source_rows.pop(data_id, None)
+        if source_row is not None:
+            source_data = self.source_data.get(source_row['source_id'], {})
+            source_data.pop(data_id, None)
+            if not source_data:
+                self.source_data.pop(source_row['source_id'], None)
+
+    # --- Lookups ---
+
+    def data_object(self, data_id):
+        """Return the data object of ``data_id``, or None if it is not registered."""
+        row = self.data_rows.get(data_id)
+        return None if row is None else row['data_object']
+
+    def is_locked(self, data_id):
+        return self.source_rows[data_id]['locked']
+
+    def source_of(self, data_id):
+        return self.source_rows[data_id]['source_id']
+
+    def data_of_source(self, source_id):
+        return list(self.source_data.get(source_id, ()))
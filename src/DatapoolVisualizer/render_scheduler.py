@@ -0,0 +1,96 @@
+import time
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class RenderScheduler(QObject):
+    """
+    Frame-budgeted redraw scheduler for one or several SignalPlotWidget.
+
+    Bursts of range changes are collapsed into at most one redraw per display frame. While the view keeps moving,
+    curves are drawn with a coarser level of detail, degraded further whenever a frame goes over the latency budget;
+    once no range change has been received for ``idle_delay_ms``, a full-resolution refine pass is made.
+
+    A single scheduler can be shared by X-linked plots (see ``PlotController.sync_x_axes``) so that one drag redraws
+    the whole group once per frame.
+    """
+
+    MAX_COARSE_LEVEL = 3  # jusqu'à un huitième de la largeur en pixels pendant une interaction
+
+    def __init__(self, frame_interval_ms=16, latency_budget_ms=12, idle_delay_ms=150, parent=None):
+        super().__init__(parent)
+        self.latency_budget_ms = latency_budget_ms
+        self.widgets = []
+        self.pending = {}  # widget -> None, dict pour garder l'ordre d'arrivée
+        self.needs_refine = {}
+        self.coarse_level = 1
+        self.last_frame_ms = 0.0
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setInterval(frame_interval_ms)
+        self.frame_timer.timeout.connect(self.render_frame)
+
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(idle_delay_ms)
+        self.idle_timer.timeout.connect(self.refine)
+
+    def attach(self, widget):
+        if widget not in self.widgets:
+            self.widgets.append(widget)
+
+    def detach(self, widget):
+        if widget in self.widgets:
+            self.widgets.remove(widget)
+        self.pending.pop(widget, None)
+        self.needs_refine.pop(widget, None)
+
+    def request_render(self, widget):
+        """Mark ``widget`` as needing a redraw at the next frame."""
+        self.pending[widget] = None
+        self.needs_refine[widget] = None
+        if not self.frame_timer.isActive():
+            self.frame_timer.start()
+        # Tant que des changements arrivent, le rendu pleine résolution est repoussé
+        self.idle_timer.start()
+
+    def render_frame(self):
+        """Redraw every pending widget once, at a level of detail adapted to the latency budget."""
+        widgets, self.pending = list(self.pending), {}
+        start = time.perf_counter()
+        for widget in widgets:
+            widget.render_curves(max_points=self.interactive_points(widget))
+        self.last_frame_ms = (time.perf_counter() - start) * 1000
+        self.adapt_level(widgets)
+
+    def interactive_points(self, widget):
+        return max(16, widget.pixel_columns() >> self.coarse_level)
+
+    def adapt_level(self, widgets):
+        """Degrade or restore the interactive level of detail from the last frame and worker timings."""
+        worker_ms = max((widget.last_render_ms for widget in widgets), default=0.0)
+        frame_cost = max(self.last_frame_ms, worker_ms)
+        if frame_cost > self.latency_budget_ms:
+            self.coarse_level = min(self.coarse_level + 1, self.MAX_COARSE_LEVEL)
+        elif frame_cost < self.latency_budget_ms / 2:
+            self.coarse_level = max(self.coarse_level - 1, 1)
+
+    def refine(self):
+        """Full-resolution redraw once the view stopped moving."""
+        if self.frame_timer.isActive():
+            # Une frame est encore en attente : affiner juste après elle
+            self.idle_timer.start()
+            return
+        widgets, self.needs_refine = list(self.needs_refine), {}
+        for widget in widgets:
+            widget.render_curves()
+
+    def flush(self):
+        """Immediately render every pending widget at full resolution."""
+        self.frame_timer.stop()
+        self.idle_timer.stop()
+        widgets = list(dict.fromkeys(list(self.pending) + list(self.needs_refine)))
+        self.pending, self.needs_refine = {}, {}
+        for widget in widgets:
+            widget.render_curves()
@@ -0,0 +1,61 @@
+import logging
+import time
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class DecimationResult:
+    """Decimated arrays of one curve, tagged with the generation of the request that produced them."""
+
+    def __init__(self, data_id, generation, x_data, y_data, elapsed_ms=0.0):
+        self.data_id = data_id
+        self.generation = generation
+        self.x_data = x_data
+        self.y_data = y_data
+        self.elapsed_ms = elapsed_ms
+
+
+class DecimationSignals(QObject):
+    """
+    Signals emitted by decimation tasks.
+
+    The object lives in the GUI thread, so results emitted from a worker thread are delivered through queued
+    connections and only ever reach ``setData`` on the GUI thread.
+    """
+    finished = Signal(object)  # DecimationResult
+
+
+class DecimationTask(QRunnable):
+    """
+    Run the decimation of one curve on a ``QThreadPool`` worker.
+
+    :param compute: Callable returning ``(x_data, y_data)``; it must not touch any Qt item.
+    :param is_current: Callable ``(data_id, generation) -> bool`` used to skip requests made stale while they were
+        waiting in the pool queue.
+    """
+
+    def __init__(self, data_id, generation, compute, signals, is_current):
+        super().__init__()
+        self.data_id = data_id
+        self.generation = generation
+        self.compute = compute
+        self.signals = signals
+        self.is_current = is_current
+
+    def run(self):
+        if not self.is_current(self.data_id, self.generation):
+            return
+        start = time.perf_counter()
+        try:
+            x_data, y_data = self.compute()
+        except Exception:
+            logger.exception("Decimation failed for data %s", self.data_id)
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        try:
+            self.signals.finished.emit(DecimationResult(self.data_id, self.generation, x_data, y_data, elapsed_ms))
+        except RuntimeError:
+            # Le widget destinataire a été détruit pendant le calcul
+            pass
@@ -0,0 +1,141 @@
+import numpy as np
+
+from src.DatapoolVisualizer.decimation import interleave_min_max, reduce_min_max
+from src.DatapoolVisualizer.viewport import map_viewport
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring buffer of samples.
+
+    Every sample is written twice, at ``i`` and ``i + capacity``, so that the last ``capacity`` samples can always be
+    returned as one contiguous view, without copying.
+    """
+
+    def __init__(self, capacity, dtype=np.float32):
+        self.capacity = max(1, int(capacity))
+        self.buffer = np.zeros(2 * self.capacity, dtype=dtype)
+        self.head = 0  # prochaine position d'écriture
+        self.count = 0
+
+    def extend(self, samples):
+        """Append ``samples``, overwriting the oldest ones once the buffer is full."""
+        samples = np.asarray(samples)[-self.capacity:]
+        n = len(samples)
+        if not n:
+            return
+        first = min(n, self.capacity - self.head)
+        self.buffer[self.head:self.head + first] = samples[:first]
+        self.buffer[self.head + self.capacity:self.head + self.capacity + first] = samples[:first]
+        if n > first:
+            self.buffer[:n - first] = samples[first:]
+            self.buffer[self.capacity:self.capacity + n - first] = samples[first:]
+        self.head = (self.head + n) % self.capacity
+        self.count = min(self.count + n, self.capacity)
+
+    def view(self):
+        """Contiguous view of the buffered samples, oldest first."""
+        start = self.head + self.capacity - self.count
+        return self.buffer[start:start + self.count]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+
+class ScopeTrace:
+    """
+    Last ``window_seconds`` of a growing temporal signal, for the scope/roll mode of ``SignalPlotWidget``.
+
+    Only the samples appended since the previous ``ingest`` are read. They go into a ring buffer of raw samples and,
+    block by block, into rings of min/max columns, so that the decimated view is updated at the tail only and memory
+    stays constant however long the acquisition runs.
+    """
+
+    def __init__(self, tmin, dt, window_seconds, columns=4096):
+        self.tmin = tmin
+        self.dt = dt
+        self.samples = RingBuffer(max(1, int(round(window_seconds / dt))))
+        self.block_size = max(1, self.samples.capacity // columns)
+        num_columns = -(-self.samples.capacity // self.block_size) + 1
+        self.mins = RingBuffer(num_columns)
+        self.maxs = RingBuffer(num_columns)
+        self.tail = np.empty(0, dtype=np.float32)  # samples du bloc en cours, pas encore réduits
+        self.ingested = 0  # nombre de samples du signal déjà consommés
+
+    @property
+    def end_time(self):
+        return self.tmin + self.ingested * self.dt
+
+    def clear(self):
+        self.samples.clear()
+        self.mins.clear()
+        self.maxs.clear()
+        self.tail = np.empty(0, dtype=np.float32)
+
+    def ingest(self, data_object, signal_source):
+        """
+        Read the samples appended to ``data_object`` since the last call.
+
+        The trace restarts from scratch when the signal got shorter (replaced rather than extended).
+
+        :return: Number of new samples.
+        """
+        num_samples = data_object.num_samples or 0
+        if num_samples < self.ingested:
+            self.clear()
+            self.ingested = 0
+        if num_samples == self.ingested:
+            return 0
+
+        start_index = self.ingested
+        if num_samples - self.ingested > self.samples.capacity:
+            # Plus d'une fenêtre de retard : seule la dernière fenêtre est lue, alignée sur les blocs
+            self.clear()
+            start_index = (num_samples - self.samples.capacity) // self.block_size * self.block_size
+        new_samples = signal_source.read_range(data_object, start_index, num_samples)
+        self.samples.extend(new_samples)
+
+        pending = np.concatenate((self.tail, new_samples))
+        full = len(pending) // self.block_size * self.block_size
+        if full:
+            mins, maxs = reduce_min_max(pending[:full], self.block_size)
+            self.mins.extend(mins)
+            self.maxs.extend(maxs)
+        self.tail = pending[full:].astype(np.float32)
+        added = num_samples - self.ingested
+        self.ingested = num_samples
+        return added
+
+    def arrays(self, x_min, x_max, max_points):
+        """
+        Return the buffered part of ``[x_min, x_max]``: raw samples when few are visible, min/max columns otherwise.
+
+        :return: (x_data, y_data)
+        """
+        window = map_viewport(x_min, x_max, self.tmin, self.dt, self.ingested)
+        first_sample = self.ingested - self.samples.count
+        start_index, end_index = max(window.start_index, first_sample), window.end_index
+        if end_index <= start_index:
+            return np.empty(0), np.empty(0)
+
+        if window.view_samples < 2 * max_points:
+            samples = self.samples.view()[start_index - first_sample:end_index - first_sample]
+            return self.tmin + np.arange(start_index, start_index + len(samples)) * self.dt, samples
+
+        # Colonnes complètes plus le bloc en cours comme dernière colonne partielle
+        mins, maxs = self.mins.view(), self.maxs.view()
+        if len(self.tail):
+            mins, maxs = np.append(mins, self.tail.min()), np.append(maxs, self.tail.max())
+        first_column = (self.ingested - len(self.tail)) // self.block_size - self.mins.count
+        block_starts = (first_column + np.arange(len(mins), dtype=np.int64)) * self.block_size
+        lo = np.searchsorted(block_starts, start_index - self.block_size, side='right')
+        hi = np.searchsorted(block_starts, end_index, side='left')
+        block_starts, mins, maxs = block_starts[lo:hi], mins[lo:hi], maxs[lo:hi]
+
+        group = -(-len(mins) // max(1, max_points))
+        if group > 1:
+            # Regrouper les colonnes pour ne pas dépasser la largeur en pixels
+            mins, maxs = reduce_min_max(mins, group)[0], reduce_min_max(maxs, group)[1]
+            block_starts = block_starts[::group]
+        return interleave_min_max(self.tmin + block_starts * self.dt, mins, maxs)
@@ -0,0 +1,98 @@
+from bisect import bisect_left, insort
+
+
+class SearchIndex:
+    """
+    Case-insensitive search of the pool data by name, ID, type and source.
+
+    Each data keeps one lowercase text joining its four fields, scanned for substring queries, and a sorted list of
+    ``(field, data_id)`` answers prefix queries by binary search. Both are updated per data (``set_entry``,
+    ``remove``), so pool events never require a rebuild. While the user types, a query that extends the previous one
+    only scans the previous matches.
+    """
+
+    def __init__(self):
+        self.fields = {}  # data_id -> champs en minuscules (nom, id, type, source)
+        self.texts = {}  # data_id -> champs joints, pour la recherche de sous-chaîne
+        self.tokens = []  # (champ, data_id) triés, pour la recherche de préfixe
+        self.last_query = None
+        self.last_matches = None
+
+    def __len__(self):
+        return len(self.fields)
+
+    def rebuild(self, registry_index):
+        """Index every data of a ``RegistryIndex``."""
+        self.fields, self.texts = {}, {}
+        for data_id, row in registry_index.data_rows.items():
+            source = registry_index.source_rows.get(data_id)
+            fields = self._fields(data_id, row['data_name'], row['data_type'],
+                                  None if source is None else source['source_id'])
+            self.fields[data_id] = fields
+            self.texts[data_id] = '\n'.join(fields)
+        self.tokens = sorted((field, data_id) for data_id, fields in self.fields.items() for field in fields)
+        self.last_query = None
+
+    def update(self, registry_index, data_ids):
+        """Re-index ``data_ids`` from a ``RegistryIndex``, dropping those no longer registered."""
+        for data_id in data_ids:
+            row = registry_index.data_rows.get(data_id)
+            if row is None:
+                self.remove(data_id)
+                continue
+            source = registry_index.source_rows.get(data_id)
+            self.set_entry(data_id, row['data_name'], row['data_type'],
+                           None if source is None else source['source_id'])
+
+    @staticmethod
+    def _fields(data_id, data_name, data_type, source_id):
+        data_type = getattr(data_type, 'name', data_type)
+        return tuple(str(field).lower() for field in (data_name, data_id, data_type, source_id))
+
+    def set_entry(self, data_id, data_name, data_type, source_id):
+        fields = self._fields(data_id, data_name, data_type, source_id)
+        if self.fields.get(data_id) == fields:
+            return
+        self.remove(data_id)
+        self.fields[data_id] = fields
+        self.texts[data_id] = '\n'.join(fields)
+        for field in fields:
+            insort(self.tokens, (field, data_id))
+        self.last_query = None
+
+    def remove(self, data_id):
+        fields = self.fields.pop(data_id, None)
+        if fields is None:
+            return
+        del self.texts[data_id]
+        for field in fields:
+            position = bisect_left(self.tokens, (field, data_id))
+            if position < len(self.tokens) and self.tokens[position] == (field, data_id):
+                del self.tokens[position]
+        self.last_query = None
+
+    def search(self, query, prefix=False):
+        """
+        Return the data_id matching ``query``, in registration order for substring queries.
+
+        :param prefix: Match only the start of the fields instead of any substring.
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(self.fields)
+        if prefix:
+            matches = {}
+            position = bisect_left(self.tokens, (query,))
+            while position < len(self.tokens) and self.tokens[position][0].startswith(query):
+                matches[self.tokens[position][1]] = None
+                position += 1
+            return list(matches)
+
+        texts = self.texts
+        if self.last_query is not None and self.last_query in query and len(self.last_matches) < len(texts) // 4:
+            # Frappe suivante : les résultats sont forcément parmi ceux (peu nombreux) de la requête précédente
+            matches = [data_id for data_id in self.last_matches if query in texts[data_id]]
+        else:
+            matches = [data_id for data_id, text in texts.items() if query in text]
+        self.last_query, self.last_matches = query, matches
+        return matches
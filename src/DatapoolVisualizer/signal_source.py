@@ -0,0 +1,83 @@
+import mmap
+import threading
+
+import numpy as np
+
+
+class SignalSource:
+    """
+    Zero-copy access to the samples of temporal and frequency signals.
+
+    File-backed signals (``in_file=True``) are opened once as read-only ``numpy.memmap`` views: slicing them does not
+    copy anything and repeated zooms are served by the OS page cache. Signals stored in RAM are exposed as NumPy
+    arrays, converted only once when the pool holds them as lists or tuples.
+    """
+
+    def __init__(self):
+        self.views = {}  # data_id -> (key, array)
+        self.lock = threading.Lock()
+        self.samples_read = 0  # samples servis par read_range, pour les statistiques de rendu
+
+    @staticmethod
+    def _view_key(data_object):
+        if data_object.in_file:
+            return 'file', data_object.file_path, data_object.num_samples
+        return 'ram', id(data_object.data), data_object.num_samples
+
+    def samples(self, data_object):
+        """Return the full sample array of ``data_object`` without copying the stored data."""
+        key = self._view_key(data_object)
+        with self.lock:
+            cached = self.views.get(data_object.data_id)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            dtype = np.dtype(data_object.sample_type)
+            if data_object.in_file:
+                num_samples = data_object.num_samples or 0
+                if not data_object.file_path or num_samples == 0:
+                    view = np.empty(0, dtype=dtype)
+                else:
+                    view = np.memmap(data_object.file_path, dtype=dtype, mode='r', shape=(num_samples,))
+            else:
+                view = np.asarray(data_object.data if data_object.data is not None else [])
+            self.views[data_object.data_id] = (key, view)
+            return view
+
+    def read_range(self, data_object, start_index, end_index):
+        """Return a view on the samples ``[start_index, end_index)``."""
+        samples = self.samples(data_object)[max(0, start_index):max(0, end_index)]
+        self.samples_read += len(samples)
+        return samples
+
+    def iter_chunks(self, data_object, chunk_size=1 << 22):
+        """
+        Yield consecutive views of ``chunk_size`` samples.
+
+        For memory-mapped signals the pages of each chunk are released once the consumer moves to the next chunk, so
+        a full pass over a multi-GB file keeps the resident memory flat.
+        """
+        view = self.samples(data_object)
+        for start in range(0, len(view), chunk_size):
+            end = min(start + chunk_size, len(view))
+            yield view[start:end]
+            self.release_pages(view, start, end)
+
+    @staticmethod
+    def release_pages(view, start_index, end_index):
+        """Tell the OS that the mapped pages of ``[start_index, end_index)`` are no longer needed."""
+        mapping = getattr(view, '_mmap', None)
+        if mapping is None or not hasattr(mapping, 'madvise') or not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        first_byte = (start_index * view.itemsize) // mmap.PAGESIZE * mmap.PAGESIZE
+        last_byte = end_index * view.itemsize
+        if last_byte > first_byte:
+            mapping.madvise(mmap.MADV_DONTNEED, first_byte, last_byte - first_byte)
+
+    def close(self, data_id=None):
+        """Drop the view of ``data_id``, or every view when no data_id is given, unmapping the files."""
+        with self.lock:
+            if data_id is None:
+                self.views.clear()
+            else:
+                self.views.pop(data_id, None)
@@ -0,0 +1,114 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class TileCache:
+    """
+    LRU cache of decimated min/max tiles with a memory budget.
+
+    A tile holds ``tile_columns`` consecutive min/max columns of one LOD level of a signal and is keyed by
+    ``(data_id, level, tile_index)``. When the view pans, only the tiles newly exposed (or entering the prefetch
+    margin) have to be computed. Least recently used tiles are evicted once ``budget_bytes`` is exceeded.
+
+    The cache can be shared by several plots and queried from decimation worker threads.
+    """
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024, tile_columns=256):
+        self.budget_bytes = budget_bytes
+        self.tile_columns = tile_columns
+        self.tiles = OrderedDict()  # (data_id, level, tile_index) -> (mins, maxs)
+        self.versions = {}  # data_id -> num_samples pour lequel les tuiles ont été calculées
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get_columns(self, data_id, num_samples, level, first_column, last_column, compute_tile):
+        """
+        Return the min/max columns ``[first_column, last_column)`` of ``level``.
+
+        :param num_samples: Current number of samples of the signal; tiles computed for another count are dropped.
+        :param compute_tile: Callable ``(tile_index) -> (mins, maxs)`` computing one missing tile.
+        :return: (column minimums, column maximums)
+        """
+        if last_column <= first_column:
+            return np.empty(0), np.empty(0)
+        with self.lock:
+            if self.versions.get(data_id) != num_samples:
+                self._drop(data_id)
+                self.versions[data_id] = num_samples
+
+        first_tile = first_column // self.tile_columns
+        last_tile = (last_column - 1) // self.tile_columns
+        mins, maxs = [], []
+        for tile_index in range(first_tile, last_tile + 1):
+            tile_mins, tile_maxs = self.get_tile((data_id, level, tile_index), lambda: compute_tile(tile_index))
+            mins.append(tile_mins)
+            maxs.append(tile_maxs)
+
+        offset = first_tile * self.tile_columns
+        mins, maxs = np.concatenate(mins), np.concatenate(maxs)
+        return mins[first_column - offset:last_column - offset], maxs[first_column - offset:last_column - offset]
+
+    def get_tile(self, key, compute):
+        with self.lock:
+            tile = self.tiles.get(key)
+            if tile is not None:
+                self.tiles.move_to_end(key)
+                self.hits += 1
+                return tile
+            self.misses += 1
+
+        # Calcul hors verrou : plusieurs workers peuvent produire des tuiles en parallèle
+        tile = compute()
+        with self.lock:
+            if key not in self.tiles:
+                self.tiles[key] = tile
+                self.size_bytes += tile[0].nbytes + tile[1].nbytes
+                self._evict()
+        return tile
+
+    def _evict(self):
+        while self.size_bytes > self.budget_bytes and len(self.tiles) > 1:
+            _, (mins, maxs) = self.tiles.popitem(last=False)
+            self.size_bytes -= mins.nbytes + maxs.nbytes
+            self.evictions += 1
+
+    def _drop(self, data_id):
+        for key in [key for key in self.tiles if key[0] == data_id]:
+            mins, maxs = self.tiles.pop(key)
+            self.size_bytes -= mins.nbytes + maxs.nbytes
+
+    def set_budget(self, budget_bytes):
+        """Change the memory budget, evicting tiles right away if needed."""
+        with self.lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def invalidate(self, data_id=None):
+        """Drop the tiles of ``data_id``, or every tile when no data_id is given."""
+        with self.lock:
+            if data_id is None:
+                self.tiles.clear()
+                self.versions.clear()
+                self.size_bytes = 0
+            else:
+                self._drop(data_id)
+                self.versions.pop(data_id, None)
+
+    def stats(self):
+        """Return the hit/miss/eviction counters and the current memory use, to size the budget."""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'tiles': len(self.tiles),
+                'size_bytes': self.size_bytes,
+                'budget_bytes': self.budget_bytes,
+            }
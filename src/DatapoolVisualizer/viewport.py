@@ -0,0 +1,52 @@
+import math
+
+from PyDataCore import Data_Type
+
+
+class SampleWindow:
+    """
+    Sample indices of a signal to read for a given viewport.
+
+    ``start_index``/``end_index`` delimit the samples to read (visible part plus overscan), clipped to the signal's
+    own extent. ``view_samples`` is the number of samples the whole viewport spans, clipped or not: it sets the
+    decimation density, so that a short signal in a wide view is not drawn with more columns than the screen has.
+    """
+
+    def __init__(self, start_index, end_index, view_samples):
+        self.start_index = start_index
+        self.end_index = end_index
+        self.view_samples = view_samples
+
+    @property
+    def is_empty(self):
+        return self.end_index <= self.start_index
+
+    def __repr__(self):
+        return f"SampleWindow({self.start_index}, {self.end_index}, view_samples={self.view_samples})"
+
+
+def signal_axis(data_object):
+    """
+    Return ``(x0, step)`` of a sampled signal: its first abscissa (tmin or fmin) and its resolution (dt or df).
+    """
+    if data_object.data_type == Data_Type.TEMPORAL_SIGNAL:
+        return data_object.tmin, data_object.dt
+    return data_object.fmin, data_object.df
+
+
+def map_viewport(x_min, x_max, x0, step, num_samples, overscan=0.0):
+    """
+    Map the viewport ``[x_min, x_max]`` onto the sample indices of a signal starting at ``x0`` with a ``step``
+    resolution.
+
+    :param overscan: Extra fraction of the viewport width read on each side, so that small pans are already covered.
+    :return: SampleWindow
+    """
+    if x_min is None or x_max is None or not num_samples or step <= 0 or x_max <= x_min:
+        return SampleWindow(0, 0, 0)
+    first = math.floor((x_min - x0) / step)
+    last = math.ceil((x_max - x0) / step) + 1
+    margin = math.ceil((last - first) * overscan)
+    start_index = min(max(first - margin, 0), num_samples)
+    end_index = min(max(last + margin, 0), num_samples)
+    return SampleWindow(start_index, end_index, last - first)
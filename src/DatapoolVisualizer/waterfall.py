@@ -0,0 +1,60 @@
+import numpy as np
+
+
+class WaterfallBuffer:
+    """
+    Preallocated ``frames x bins`` float32 image of an FFTS sequence.
+
+    Frames are appended one row at a time; the capacity doubles when full so that a growing sequence is stacked in
+    amortized constant time. The running minimum and maximum are kept up to date from the new rows only, so that the
+    color levels never require a pass over the whole image.
+    """
+
+    def __init__(self, num_bins, initial_frames=64):
+        self.num_bins = num_bins
+        self.frames = np.full((max(1, initial_frames), num_bins), np.nan, dtype=np.float32)
+        self.num_frames = 0
+        self.levels = None  # (min, max) des frames empilées
+
+    @property
+    def image(self):
+        """View on the filled rows of the buffer."""
+        return self.frames[:self.num_frames]
+
+    def append(self, samples):
+        """Stack one frame; a frame longer or shorter than ``num_bins`` is truncated or padded with NaN."""
+        if self.num_frames == len(self.frames):
+            grown = np.full((2 * len(self.frames), self.num_bins), np.nan, dtype=np.float32)
+            grown[:self.num_frames] = self.frames
+            self.frames = grown
+        row = self.frames[self.num_frames]
+        count = min(len(samples), self.num_bins)
+        row[:count] = samples[:count]
+        self.num_frames += 1
+        if count:
+            low, high = float(np.nanmin(row[:count])), float(np.nanmax(row[:count]))
+            if self.levels is not None:
+                low, high = min(low, self.levels[0]), max(high, self.levels[1])
+            self.levels = (low, high)
+
+    def sync(self, frame_ids, load_frame):
+        """
+        Stack the frames of ``frame_ids`` not yet in the buffer.
+
+        :param frame_ids: data_id of every frame of the sequence, in order (``FFTSData.data``).
+        :param load_frame: Callable ``(data_id) -> samples`` reading one frame.
+        :return: Number of frames appended.
+        """
+        if len(frame_ids) < self.num_frames:
+            # Des frames ont été retirées : tout réempiler
+            self.clear()
+        added = 0
+        for data_id in frame_ids[self.num_frames:]:
+            self.append(load_frame(data_id))
+            added += 1
+        return added
+
+    def clear(self):
+        self.frames[:self.num_frames] = np.nan
+        self.num_frames = 0
+        self.levels = None
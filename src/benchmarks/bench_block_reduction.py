@@ -0,0 +1,75 @@
+"""
+Benchmark de la réduction min/max de display_signal : boucle historique par chunk (get_data_chunk + np.min/np.max
+par colonne) contre la réduction vectorisée en un seul reshape.
+
+Usage : python -m src.benchmarks.bench_block_reduction [--sizes 1e6 1e7 1e8] [--max-points 500]
+"""
+import argparse
+import time
+
+import numpy as np
+from PyDataCore import DataPool, Data_Type
+
+from src.DatapoolVisualizer.decimation import decimate_range
+
+
+def legacy_chunk_loop(data_pool, data_id, start_index, end_index, max_points):
+    """Copie de la boucle de display_signal avant la réduction vectorisée."""
+    chunk_size = max(1, (end_index - start_index) // max_points)
+    x_data, y_data_min, y_data_max = [], [], []
+    for chunk_start in range(start_index, end_index, chunk_size):
+        chunk = data_pool.get_data_chunk(data_id, chunk_start // chunk_size, chunk_size=chunk_size)
+        if len(chunk) == 0:
+            continue
+        x_data.append(chunk_start)
+        y_data_min.append(np.min(chunk))
+        y_data_max.append(np.max(chunk))
+    x_data = np.repeat(x_data, 2)
+    y_data = np.empty(len(x_data))
+    y_data[0::2], y_data[1::2] = y_data_min, y_data_max
+    return x_data, y_data
+
+
+def vectorized_reduction(data_object, start_index, end_index, max_points):
+    samples = np.asarray(data_object.data)[start_index:end_index]
+    return decimate_range(samples, start_index, end_index, max_points)
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes, max_points, repeat):
+    rows = []
+    for size in sizes:
+        num_samples = int(size)
+        data_pool = DataPool()
+        data_id = data_pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"bench_{num_samples}", "bench", False, False,
+                                          time_step=1e-6, unit="V")
+        samples = np.random.default_rng(0).standard_normal(num_samples, dtype=np.float32)
+        data_pool.store_data(data_id, samples, "bench")
+        data_object = data_pool.get_data_info(data_id)['data_object'].iloc[0]
+
+        legacy = best_of(lambda: legacy_chunk_loop(data_pool, data_id, 0, num_samples, max_points), repeat)
+        vectorized = best_of(lambda: vectorized_reduction(data_object, 0, num_samples, max_points), repeat)
+        rows.append((num_samples, legacy, vectorized))
+        del data_pool, samples, data_object
+
+    print(f"\n{'samples':>12} {'loop (ms)':>12} {'vectorized (ms)':>16} {'speedup':>9}")
+    for num_samples, legacy, vectorized in rows:
+        print(f"{num_samples:>12.0e} {legacy * 1e3:>12.2f} {vectorized * 1e3:>16.2f} {legacy / vectorized:>8.1f}x")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e6, 1e7, 1e8])
+    parser.add_argument("--max-points", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.max_points, args.repeat)
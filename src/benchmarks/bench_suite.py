@@ -0,0 +1,278 @@
+"""
+Suite de benchmarks sans fenêtre (plateforme Qt offscreen) : rendu des signaux, zoom, rafraîchissement de l'arbre du
+DataPool et lecture des FFTS. Les mesures sont écrites dans un fichier JSON pour comparer les versions entre elles.
+
+Usage : python -m src.benchmarks.bench_suite [--sizes 1e5 1e6 1e7] [--storage ram file] [--rows 1e3 1e4 1e5]
+                                             [--output bench_results.json] [--baseline previous.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+import PySide6
+from PyDataCore import DataPool, Data_Type
+from PySide6.QtWidgets import QApplication
+
+from src.DatapoolVisualizer.datapool_viewer import DataPoolViewerWidget
+from src.DatapoolVisualizer.plot_widget import SignalPlotWidget
+from src.DatapoolVisualizer.pool_events import PoolEvent
+
+CHUNK_SAMPLES = 1 << 24
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def result(benchmark, params, timings_ms):
+    return {
+        'benchmark': benchmark,
+        'params': params,
+        'timings_ms': [round(timing, 4) for timing in timings_ms],
+        'min_ms': round(min(timings_ms), 4),
+        'median_ms': round(statistics.median(timings_ms), 4),
+        'max_ms': round(max(timings_ms), 4),
+    }
+
+
+def quiet():
+    """PyDataCore affiche chaque enregistrement et chaque stockage : sortie masquée pendant la préparation."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def make_signal(num_samples, storage, folder):
+    """
+    Pool holding one temporal signal of ``num_samples`` float samples, in RAM or in a file.
+
+    File-backed samples are written directly by blocks: ``store_data`` packs every sample with ``struct`` and cannot
+    be used beyond a few million samples.
+    """
+    rng = np.random.default_rng(0)
+    with quiet():
+        pool = DataPool()
+        data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"bench_{num_samples}", "bench", False,
+                                     storage == 'file', time_step=1e-6, unit="V")
+        if storage == 'ram':
+            pool.store_data(data_id, rng.standard_normal(num_samples).astype(np.float32), "bench")
+        else:
+            data_object = pool.data_registry['data_object'].iloc[-1]
+            data_object.file_path = os.path.join(folder, f"{data_id}.dat")
+            dtype = np.dtype(data_object.sample_type)
+            with open(data_object.file_path, 'wb') as file:
+                for start in range(0, num_samples, CHUNK_SAMPLES):
+                    count = min(CHUNK_SAMPLES, num_samples - start)
+                    rng.standard_normal(count).astype(dtype).tofile(file)
+            data_object.num_samples = num_samples
+            data_object.data_size_in_bytes = num_samples * dtype.itemsize
+            pool.unlock_data(data_id)
+    return pool, data_id
+
+
+def make_widget(pool):
+    widget = SignalPlotWidget(pool)
+    widget.resize(1200, 600)
+    widget.show()
+    QApplication.processEvents()
+    return widget
+
+
+def bench_signal(num_samples, storage, repeat, folder):
+    """``add_data`` (cold caches), ``display_signal`` (warm) and a zoom-in sequence with ``handle_zoom``."""
+    params = {'samples': num_samples, 'storage': storage}
+    pool, data_id = make_signal(num_samples, storage, folder)
+    results = []
+
+    add_timings = []
+    for _ in range(repeat):
+        # Widget neuf à chaque mesure : pyramide LOD et tuiles recalculées
+        widget = make_widget(pool)
+        add_timings.append(timed(lambda: (widget.add_data(data_id), widget.wait_for_rendering())))
+        widget.close()
+        widget.deleteLater()
+    results.append(result('signal.add_data', params, add_timings))
+
+    widget = make_widget(pool)
+    with quiet():
+        widget.add_data(data_id)
+    widget.wait_for_rendering()
+    results.append(result('signal.display_signal', params, [
+        timed(lambda: (widget.display_signal(data_id), widget.wait_for_rendering())) for _ in range(repeat)]))
+
+    x_min, x_max = widget.x_min, widget.x_max
+    center = (x_min + x_max) / 2
+    zoom_timings = []
+    for _ in range(repeat):
+        for fraction in (1.0, 1e-1, 1e-2, 1e-3, 1e-4, 1e-2, 1.0):
+            half_width = (x_max - x_min) * fraction / 2
+            zoom_timings.append(timed(lambda: (widget.handle_zoom(None, (center - half_width, center + half_width)),
+                                               widget.wait_for_rendering())))
+    results.append(result('signal.handle_zoom', params, zoom_timings))
+    widget.close()
+    widget.deleteLater()
+    widget.signal_source.close()
+    return results
+
+
+def make_registry(num_rows, num_sources=500, num_subscribers=7):
+    data_ids = [f"data{i}" for i in range(num_rows)]
+    data_registry = pd.DataFrame({'data_id': data_ids, 'data_type': 'TEMPORAL_SIGNAL',
+                                  'data_name': [f"signal_{i}" for i in range(num_rows)], 'storage_type': 'ram',
+                                  'data_object': None})
+    source_to_data = pd.DataFrame({'source_id': [f"source{i % num_sources}" for i in range(num_rows)],
+                                   'data_id': data_ids, 'locked': False, 'protected': False})
+    subscriber_to_data = pd.DataFrame({'subscriber_id': [f"subscriber{i % num_subscribers}" for i in range(num_rows)],
+                                       'data_id': data_ids, 'acquitements': 0})
+    return data_registry, source_to_data, subscriber_to_data
+
+
+class RegistryPool:
+    """Registres seuls, comme les attend ``DataPoolViewerWidget.apply_events``."""
+
+    def __init__(self, data_registry, source_to_data, subscriber_to_data):
+        self.data_registry = data_registry
+        self.source_to_data = source_to_data
+        self.subscriber_to_data = subscriber_to_data
+
+
+def bench_tree(num_rows, repeat):
+    """Viewer construction, full ``populate_tree_view`` after one change, and the same change as a pool event."""
+    params = {'rows': num_rows}
+    registries = make_registry(num_rows)
+    widgets = []
+    build_timings = [timed(lambda: widgets.append(DataPoolViewerWidget(*registries))) for _ in range(repeat)]
+    widget = widgets[-1]
+
+    data_registry, source_to_data, subscriber_to_data = registries
+    refresh_timings, event_timings = [], []
+    for i in range(repeat):
+        source_to_data.loc[i, 'locked'] = not source_to_data.loc[i, 'locked']
+        refresh_timings.append(timed(lambda: widget.populate_tree_view(*registries)))
+        source_to_data.loc[i, 'locked'] = not source_to_data.loc[i, 'locked']
+        kind = PoolEvent.LOCKED if source_to_data.loc[i, 'locked'] else PoolEvent.UNLOCKED
+        event_timings.append(timed(lambda: widget.apply_events(RegistryPool(*registries),
+                                                               [PoolEvent(kind, data_registry['data_id'][i])])))
+    return [result('tree.build', params, build_timings),
+            result('tree.populate_tree_view', params, refresh_timings),
+            result('tree.apply_events', params, event_timings)]
+
+
+def bench_ffts(num_frames, num_bins, repeat):
+    """Stepping through every frame of an FFTS, cold (frames reduced on demand) then from the frame cache."""
+    params = {'frames': num_frames, 'bins': num_bins}
+    with quiet():
+        pool = DataPool()
+        ffts_id = pool.register_data(Data_Type.FFTS, "ffts", "bench", freq_step=1.0, fmin=0.0, unit="dB")
+        pool.unlock_data(ffts_id)
+        ffts = pool.get_data_info(ffts_id)['data_object'].iloc[0]
+        rng = np.random.default_rng(0)
+        for i in range(num_frames):
+            frame_id = pool.register_data(Data_Type.FREQ_SIGNAL, f"frame{i}", "bench", freq_step=1.0, fmin=0.0,
+                                          unit="dB", timestamp=i * 0.05)
+            pool.store_data(frame_id, rng.standard_normal(num_bins).astype(np.float32), "bench")
+            ffts.add_fft_signal(pool.get_data_info(frame_id)['data_object'].iloc[0])
+        widget = make_widget(pool)
+        widget.add_data(ffts_id)
+    widget.frame_prefetcher.capacity = num_frames
+
+    results = []
+    for label in ('cold', 'cached'):
+        timings = []
+        for _ in range(repeat):
+            if label == 'cold':
+                widget.frame_prefetcher.clear()
+            timings.extend(timed(lambda: widget.display_fft_frame(ffts_id, frame_index))
+                           for frame_index in range(num_frames))
+        results.append(result(f'ffts.step_frame.{label}', params, timings))
+    widget.close()
+    widget.deleteLater()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print the median of every benchmark against the same benchmark of a previous run."""
+    with open(baseline_path) as file:
+        baseline = {(entry['benchmark'], json.dumps(entry['params'], sort_keys=True)): entry
+                    for entry in json.load(file)['results']}
+    print(f"\n{'benchmark':<28} {'params':<36} {'baseline (ms)':>14} {'now (ms)':>10} {'ratio':>7}")
+    for entry in results:
+        params = json.dumps(entry['params'], sort_keys=True)
+        previous = baseline.get((entry['benchmark'], params))
+        if previous is None:
+            continue
+        ratio = entry['median_ms'] / previous['median_ms'] if previous['median_ms'] else float('nan')
+        print(f"{entry['benchmark']:<28} {params:<36} {previous['median_ms']:>14.3f} {entry['median_ms']:>10.3f} "
+              f"{ratio:>6.2f}x")
+
+
+def run(sizes, storages, rows, frames, bins, repeat, output, baseline=None):
+    app = QApplication.instance() or QApplication([])
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            for storage in storages:
+                results.extend(bench_signal(int(size), storage, repeat, folder))
+                print(f"signal {storage} {int(size):.0e} done", file=sys.stderr)
+    for num_rows in rows:
+        results.extend(bench_tree(int(num_rows), repeat))
+        print(f"tree {int(num_rows)} rows done", file=sys.stderr)
+    results.extend(bench_ffts(frames, bins, repeat))
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pyside6': PySide6.__version__,
+            'qpa_platform': app.platformName(),
+        },
+        'results': results,
+    }
+    with open(output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    print(f"\n{'benchmark':<28} {'params':<36} {'min (ms)':>10} {'median (ms)':>12}")
+    for entry in results:
+        print(f"{entry['benchmark']:<28} {json.dumps(entry['params'], sort_keys=True):<36} {entry['min_ms']:>10.3f} "
+              f"{entry['median_ms']:>12.3f}")
+    if baseline:
+        compare(results, baseline)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e5, 1e6, 1e7],
+                        help="signal sizes in samples, up to 1e9 (file-backed signals need 4 bytes per sample)")
+    parser.add_argument("--storage", nargs="+", choices=['ram', 'file'], default=['ram', 'file'])
+    parser.add_argument("--rows", nargs="+", type=float, default=[1e3, 1e4, 1e5])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--bins", type=int, default=8192)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="previous JSON output to compare with")
+    args = parser.parse_args()
+    run(args.sizes, args.storage, args.rows, args.frames, args.bins, args.repeat, args.output, args.baseline)
@@ -0,0 +1,339 @@
+"""
+Test d'endurance du DataPoolViewer (plateforme Qt offscreen) : un pool synthétique, généré à partir d'une graine, subit
+pendant N minutes des rafales d'enregistrements, de stockages, de verrouillages, d'abonnements, d'acquittements et de
+suppressions, observées par un DataPoolNotifier relié à un DataPoolViewerWidget.
+
+Le rapport donne la latence de la boucle d'événements Qt (percentiles), les rafraîchissements manqués, le débit de
+mutations réellement atteint et la croissance de la mémoire, et vérifie que l'arbre correspond au pool à la fin : le
+code de sortie vaut 1 sinon.
+
+Usage : python -m src.benchmarks.soak_pool [--seed 0] [--sources 50] [--data 2000] [--subscribers 200]
+                                           [--rate 1000] [--minutes 5] [--output soak_results.json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import PySide6
+from PyDataCore import DataPool, Data_Type
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtWidgets import QApplication
+
+from src.DatapoolVisualizer.datapool_model import registry_snapshot
+from src.DatapoolVisualizer.datapool_viewer import DataPoolNotifier, DataPoolViewerWidget
+from src.DatapoolVisualizer.registry_index import RegistryIndex
+from src.benchmarks.bench_suite import git_revision
+
+# Répartition des mutations (les enregistrements et suppressions maintiennent le pool autour de --data)
+MUTATION_WEIGHTS = {
+    'store': 40,
+    'lock': 15,
+    'register_or_delete': 20,
+    'subscribe': 20,
+    'acknowledge': 5,
+}
+
+
+def rss_mb():
+    """Resident memory of the process, from /proc when available, else the peak reported by getrusage."""
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentiles(values):
+    if not values:
+        return {}
+    values = np.asarray(values)
+    return {'p50': round(float(np.percentile(values, 50)), 3), 'p95': round(float(np.percentile(values, 95)), 3),
+            'p99': round(float(np.percentile(values, 99)), 3), 'max': round(float(values.max()), 3),
+            'count': len(values)}
+
+
+class SyntheticPool:
+    """
+    DataPool filled and then mutated from a seeded random generator, so that two runs with the same parameters apply
+    the same sequence of pool calls.
+    """
+
+    def __init__(self, seed, num_sources, num_data, num_subscribers, subscribers_per_data, samples):
+        self.random = random.Random(seed)
+        self.samples = np.random.default_rng(seed).standard_normal(samples).astype(np.float32)
+        self.target = num_data
+        self.sources = [f"source{i}" for i in range(num_sources)]
+        self.subscribers = [f"subscriber{i}" for i in range(num_subscribers)]
+        self.pool = DataPool()
+        self.source_of = {}  # data_id -> source_id, données vivantes
+        self.data_ids = []  # mêmes données, pour un tirage en O(1)
+        self.locked = set()
+        self.subscriptions = []  # (data_id, subscriber_id) non acquittés
+        self.counter = 0
+        for _ in range(num_data):
+            data_id = self.register()
+            for subscriber_id in self.random.sample(self.subscribers, min(subscribers_per_data, num_subscribers)):
+                self.subscribe(data_id, subscriber_id)
+
+    def register(self):
+        source_id = self.random.choice(self.sources)
+        data_id = self.pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"signal_{self.counter}", source_id,
+                                          time_step=1e-3, unit="V")
+        self.counter += 1
+        self.source_of[data_id] = source_id
+        self.data_ids.append(data_id)
+        self.pool.store_data(data_id, self.samples, source_id)
+        return data_id
+
+    def forget(self, data_id):
+        del self.source_of[data_id]
+        position = self.data_ids.index(data_id)
+        self.data_ids[position] = self.data_ids[-1]
+        self.data_ids.pop()
+        self.locked.discard(data_id)
+
+    def subscribe(self, data_id, subscriber_id):
+        self.pool.add_subscriber(data_id, subscriber_id)
+        self.subscriptions.append((data_id, subscriber_id))
+
+    def mutate(self):
+        """Apply one random mutation to the pool and return its name."""
+        kind = self.random.choices(list(MUTATION_WEIGHTS), weights=list(MUTATION_WEIGHTS.values()))[0]
+        if kind == 'register_or_delete' or not self.data_ids:
+            if len(self.data_ids) < self.target or not self.data_ids:
+                self.register()
+                return 'register'
+            data_id = self.random.choice(self.data_ids)
+            self.pool.delete_data(data_id)
+            self.forget(data_id)
+            return 'delete'
+
+        data_id = self.random.choice(self.data_ids)
+        if kind == 'store':
+            if data_id not in self.locked:
+                self.pool.lock_data(data_id)
+            self.pool.store_data(data_id, self.samples, self.source_of[data_id])
+            self.locked.discard(data_id)
+        elif kind == 'lock':
+            # Une donnée verrouillée est déverrouillée par le prochain stockage ou par ce tirage
+            if data_id in self.locked:
+                self.pool.unlock_data(data_id)
+                self.locked.discard(data_id)
+            else:
+                self.pool.lock_data(data_id)
+                self.locked.add(data_id)
+        elif kind == 'subscribe':
+            self.subscribe(data_id, self.random.choice(self.subscribers))
+        elif kind == 'acknowledge':
+            while self.subscriptions:
+                position = self.random.randrange(len(self.subscriptions))
+                self.subscriptions[position], self.subscriptions[-1] = \
+                    self.subscriptions[-1], self.subscriptions[position]
+                data_id, subscriber_id = self.subscriptions.pop()
+                if data_id in self.source_of:
+                    break
+            else:
+                return kind
+            self.pool.acknowledge_data(data_id, subscriber_id)
+            if data_id not in self.pool.data_registry['data_id'].values:
+                # Tous les abonnés ont acquitté : donnée libérée par le pool
+                self.forget(data_id)
+        return kind
+
+
+class SoakRun:
+    """
+    Drive the mutations and the probes from the Qt event loop.
+
+    :param rate: Target mutations per second, applied in batches every ``tick_ms``. When the pool calls are too slow
+        to keep up, the missed mutations are not carried over: the achieved rate is reported instead.
+    :param probe_ms: Period of the timer measuring how late the event loop serves it.
+    """
+
+    def __init__(self, synthetic, notifier, viewer, rate, tick_ms=10, probe_ms=5, memory_s=1.0):
+        self.synthetic = synthetic
+        self.notifier = notifier
+        self.viewer = viewer
+        self.rate = rate
+        self.tick_ms = tick_ms
+        self.probe_ms = probe_ms
+        self.mutations = {}
+        self.mutation_ms = []
+        self.budget = 0.0
+        self.last_tick = None
+        self.latencies_ms = []
+        self.last_probe = None
+        self.apply_ms = []
+        self.flush_events = []
+        self.flush_delays_ms = []
+        self.dropped_refreshes = 0
+        self.first_pending = None
+        self.memory = []
+
+        notifier.events_flushed.connect(self.on_flush)
+        self.tick_timer = QTimer()
+        self.tick_timer.setTimerType(Qt.PreciseTimer)
+        self.tick_timer.timeout.connect(self.tick)
+        self.probe_timer = QTimer()
+        self.probe_timer.setTimerType(Qt.PreciseTimer)
+        self.probe_timer.timeout.connect(self.probe)
+        self.memory_timer = QTimer()
+        self.memory_timer.timeout.connect(self.sample_memory)
+        self.memory_interval_ms = int(memory_s * 1000)
+
+    def tick(self):
+        now = time.perf_counter()
+        elapsed = now - self.last_tick if self.last_tick is not None else self.tick_ms / 1000
+        self.last_tick = now
+        # Au plus 100 ms de retard rattrapés : pas de spirale quand le pool ne suit pas
+        self.budget = min(self.budget + elapsed * self.rate, max(1.0, self.rate * 0.1))
+        start = time.perf_counter()
+        while self.budget >= 1:
+            kind = self.synthetic.mutate()
+            self.mutations[kind] = self.mutations.get(kind, 0) + 1
+            self.budget -= 1
+        self.mutation_ms.append((time.perf_counter() - start) * 1000)
+        if self.notifier.pending and self.first_pending is None:
+            self.first_pending = time.perf_counter()
+
+    def probe(self):
+        now = time.perf_counter()
+        if self.last_probe is not None:
+            self.latencies_ms.append(max(0.0, (now - self.last_probe) * 1000 - self.probe_ms))
+        self.last_probe = now
+
+    def on_flush(self, events):
+        now = time.perf_counter()
+        if self.first_pending is not None:
+            # Un flush est dû min_interval_ms après le précédent ; chaque intervalle de plus est un rafraîchissement
+            # manqué
+            delay_ms = (now - self.first_pending) * 1000
+            self.flush_delays_ms.append(delay_ms)
+            self.dropped_refreshes += max(0, int(delay_ms // self.notifier.min_interval_ms) - 1)
+            self.first_pending = None
+        start = time.perf_counter()
+        self.viewer.apply_events(self.synthetic.pool, events)
+        self.apply_ms.append((time.perf_counter() - start) * 1000)
+        self.flush_events.append(len(events))
+
+    def sample_memory(self):
+        self.memory.append((time.perf_counter(), rss_mb()))
+
+    def run(self, seconds):
+        app = QApplication.instance()
+        self.sample_memory()
+        self.tick_timer.start(self.tick_ms)
+        self.probe_timer.start(self.probe_ms)
+        self.memory_timer.start(self.memory_interval_ms)
+        start = time.perf_counter()
+        QTimer.singleShot(int(seconds * 1000), app.quit)
+        app.exec()
+        for timer in (self.tick_timer, self.probe_timer, self.memory_timer):
+            timer.stop()
+        duration = time.perf_counter() - start
+        self.sample_memory()
+        # Derniers événements appliqués avant la vérification
+        self.notifier.flush()
+        return duration
+
+    def memory_report(self):
+        times = np.array([sample[0] for sample in self.memory])
+        values = np.array([sample[1] for sample in self.memory])
+        slope = float(np.polyfit(times - times[0], values, 1)[0]) * 60 if len(values) > 2 else 0.0
+        return {'rss_start_mb': round(float(values[0]), 1), 'rss_end_mb': round(float(values[-1]), 1),
+                'rss_peak_mb': round(float(values.max()), 1), 'growth_mb': round(float(values[-1] - values[0]), 1),
+                'slope_mb_per_min': round(slope, 3)}
+
+
+def run(seed, sources, data, subscribers, subscribers_per_data, samples, rate, minutes, max_rate_hz, output):
+    app = QApplication.instance() or QApplication([])
+    # PyDataCore affiche chaque appel : sortie jetée, un tampon en mémoire fausserait la mesure de croissance
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        setup_start = time.perf_counter()
+        synthetic = SyntheticPool(seed, sources, data, subscribers, subscribers_per_data, samples)
+        pool = synthetic.pool
+        notifier = DataPoolNotifier(max_rate_hz)
+        notifier.attach_to_pool(pool)
+        viewer = DataPoolViewerWidget(pool.data_registry, pool.source_to_data, pool.subscriber_to_data)
+        viewer.resize(800, 600)
+        viewer.show()
+        app.processEvents()
+        setup_s = time.perf_counter() - setup_start
+        print(f"setup done in {setup_s:.1f} s, soaking for {minutes} min", file=sys.stderr)
+
+        soak = SoakRun(synthetic, notifier, viewer, rate)
+        duration = soak.run(minutes * 60)
+    # L'index incrémental et les lignes de l'arbre doivent correspondre à un index reconstruit depuis le pool
+    expected = registry_snapshot(RegistryIndex.from_pool(pool))
+    consistent = registry_snapshot(viewer.registry_index) == expected and viewer.model.entries == expected
+
+    total_mutations = sum(soak.mutations.values())
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pyside6': PySide6.__version__,
+            'qpa_platform': app.platformName(),
+        },
+        'params': {'seed': seed, 'sources': sources, 'data': data, 'subscribers': subscribers,
+                   'subscribers_per_data': subscribers_per_data, 'samples': samples, 'rate': rate,
+                   'minutes': minutes, 'max_rate_hz': max_rate_hz},
+        'setup_s': round(setup_s, 3),
+        'duration_s': round(duration, 3),
+        'mutations': dict(soak.mutations, total=total_mutations),
+        'achieved_rate': round(total_mutations / duration, 1),
+        'event_loop_latency_ms': percentiles(soak.latencies_ms),
+        'mutation_batch_ms': percentiles(soak.mutation_ms),
+        'flushes': len(soak.flush_events),
+        'events_per_flush': percentiles(soak.flush_events),
+        'flush_delay_ms': percentiles(soak.flush_delays_ms),
+        'tree_apply_ms': percentiles(soak.apply_ms),
+        'dropped_refreshes': soak.dropped_refreshes,
+        'memory': soak.memory_report(),
+        'final_data': len(pool.data_registry),
+        'tree_consistent': consistent,
+    }
+    with open(output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    latency = report['event_loop_latency_ms']
+    print(f"mutations      {total_mutations} in {duration:.1f} s ({report['achieved_rate']}/s for {rate}/s requested)")
+    print(f"loop latency   p50 {latency.get('p50')} ms, p95 {latency.get('p95')} ms, p99 {latency.get('p99')} ms, "
+          f"max {latency.get('max')} ms")
+    print(f"refreshes      {report['flushes']} flushes, {soak.dropped_refreshes} dropped, tree apply p95 "
+          f"{report['tree_apply_ms'].get('p95')} ms")
+    print(f"memory         {report['memory']['rss_start_mb']} -> {report['memory']['rss_end_mb']} MB "
+          f"({report['memory']['slope_mb_per_min']} MB/min)")
+    print(f"tree           {'consistent' if consistent else 'OUT OF SYNC'} with the pool")
+    viewer.close()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sources", type=int, default=50)
+    parser.add_argument("--data", type=int, default=2000, help="data registered at start, kept as target size")
+    parser.add_argument("--subscribers", type=int, default=200)
+    parser.add_argument("--subscribers-per-data", type=int, default=2)
+    parser.add_argument("--samples", type=int, default=256, help="samples written by every store")
+    parser.add_argument("--rate", type=float, default=1000, help="target mutations per second")
+    parser.add_argument("--minutes", type=float, default=5)
+    parser.add_argument("--max-rate-hz", type=float, default=20, help="flush rate limit of the DataPoolNotifier")
+    parser.add_argument("--output", default="soak_results.json")
+    args = parser.parse_args()
+    report = run(args.seed, args.sources, args.data, args.subscribers, args.subscribers_per_data, args.samples,
+                 args.rate, args.minutes, args.max_rate_hz, args.output)
+    # Code de sortie non nul quand l'arbre ne correspond plus au pool, pour la CI
+    sys.exit(0 if report['tree_consistent'] else 1)
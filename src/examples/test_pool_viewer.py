@@ -22,8 +22,8 @@ class MainWindow(QMainWindow):
         # Créer un QDockWidget pour rendre la vue détachable
         self.create_dockable_view()
 
-        # Connecter le signal "data_changed" pour rafraîchir le TreeView
-        self.notifier.data_changed.connect(self.refresh_view)
+        # Appliquer les changements regroupés du DataPool au TreeView
+        self.notifier.events_flushed.connect(self.refresh_view)
 
         # Simuler l'ajout initial de données au DataPool
         self.simulate_initial_data()
@@ -37,9 +37,9 @@ class MainWindow(QMainWindow):
         self.dock_widget.setWidget(self.viewer_widget)
         self.addDockWidget(Qt.RightDockWidgetArea, self.dock_widget)
 
-    def refresh_view(self):
-        # Rafraîchir le DataPoolViewer quand le DataPool est mis à jour
-        self.viewer_widget.populate_tree_view(self.pool.data_registry, self.pool.source_to_data, self.pool.subscriber_to_data)
+    def refresh_view(self, events):
+        # Rafraîchir uniquement les lignes des données modifiées
+        self.viewer_widget.apply_events(self.pool, events)
 
     def simulate_initial_data(self):
         # Simuler l'ajout initial de données dans le DataPool
@@ -0,0 +1,59 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pytest
+from PyDataCore import DataPool, Data_Type
+from PySide6.QtWidgets import QApplication
+
+from src.DatapoolVisualizer.plot_widget import SignalPlotWidget
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """QApplication unique de la session, sans affichage (plateforme offscreen)."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def pool():
+    return DataPool()
+
+
+@pytest.fixture
+def signals(pool):
+    """
+    Register temporal signals in ``pool``: ``signals(count)`` returns their data_ids. Signal ``i`` holds
+    ``num_samples + i`` samples of a sine, or nothing when ``num_samples`` is None.
+    """
+    def register(count, unit="V", num_samples=100, name="Signal", sources=("source",)):
+        data_ids = []
+        for i in range(count):
+            source = sources[i % len(sources)]
+            data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"{name} {i}", source, time_step=1.0, unit=unit)
+            if num_samples is not None:
+                pool.store_data(data_id, np.sin(np.arange(num_samples + i) / 10.0), source)
+            data_ids.append(data_id)
+        return data_ids
+    return register
+
+
+@pytest.fixture
+def make_widget(pool):
+    """Plots on ``pool``, rendered synchronously and closed at the end of the test."""
+    widgets = []
+
+    def make():
+        widget = SignalPlotWidget(pool)
+        widget.async_rendering = False
+        widgets.append(widget)
+        return widget
+    yield make
+    for widget in widgets:
+        widget.close()
+
+
+@pytest.fixture
+def widget(make_widget):
+    return make_widget()
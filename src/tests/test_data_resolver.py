@@ -0,0 +1,50 @@
+import pytest
+from PyDataCore import Data_Type
+
+from src.DatapoolVisualizer.data_resolver import DataObjectResolver
+from src.DatapoolVisualizer.pool_events import PoolEvent
+
+
+def test_data_is_looked_up_once(pool, signals):
+    data_id, = signals(1, num_samples=3)
+    resolver = DataObjectResolver(pool)
+
+    handle = resolver.handle(data_id)
+    assert resolver.handle(data_id) is handle
+    assert resolver.data_object(data_id) is pool.get_data_info(data_id)['data_object'].iloc[0]
+    assert (handle.data_type, handle.data_name) == (Data_Type.TEMPORAL_SIGNAL, "Signal 0")
+    assert (resolver.hits, resolver.misses) == (2, 1)
+
+
+def test_events_invalidate_handles(pool, signals):
+    data_id, = signals(1, num_samples=3)
+    resolver = DataObjectResolver(pool)
+    resolver.handle(data_id)
+
+    resolver.apply_events([PoolEvent(PoolEvent.LOCKED, data_id)])
+    with pytest.raises(PermissionError):
+        resolver.handle(data_id)
+
+    pool.lock_data(data_id)
+    pool.store_data(data_id, [1.0, 2.0, 3.0, 4.0], "source")
+    resolver.apply_events([PoolEvent(PoolEvent.STORED, data_id, "source")])
+    assert resolver.data_object(data_id).num_samples == 4
+    assert resolver.misses == 2
+
+    resolver.apply_events([PoolEvent(PoolEvent.REMOVED, data_id)])
+    assert data_id not in resolver.handles
+
+
+def test_handles_are_looked_up_in_bulk(pool, signals):
+    data_id, other_id = signals(2, num_samples=1)
+    resolver = DataObjectResolver(pool)
+    resolver.handle(data_id)
+
+    handles = resolver.handle_many([data_id, other_id])
+    assert handles[other_id].data_name == "Signal 1" and handles[data_id] is resolver.handle(data_id)
+    assert (resolver.hits, resolver.misses) == (2, 2)
+
+    pool.lock_data(other_id)
+    resolver.invalidate(other_id)
+    with pytest.raises(PermissionError):
+        resolver.handle_many([data_id, other_id])
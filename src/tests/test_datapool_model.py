@@ -0,0 +1,121 @@
+from PySide6.QtCore import QModelIndex
+from PySide6.QtTest import QAbstractItemModelTester
+
+from src.DatapoolVisualizer.datapool_model import DataPoolTreeModel, registry_snapshot
+from src.DatapoolVisualizer.registry_index import RegistryIndex
+
+SOURCES = ("source0", "source1")
+
+
+def snapshot(pool):
+    return registry_snapshot(RegistryIndex.from_pool(pool))
+
+
+def fetch_all(model, parent=QModelIndex()):
+    while model.canFetchMore(parent):
+        model.fetchMore(parent)
+    for row in range(model.rowCount(parent)):
+        fetch_all(model, model.index(row, 0, parent))
+
+
+def test_tree_groups_data_by_source(pool, signals):
+    data_ids = signals(3, num_samples=None, sources=SOURCES)
+    pool.add_subscriber(data_ids[0], "sub")
+    model = DataPoolTreeModel()
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+
+    model.refresh(snapshot(pool))
+    fetch_all(model)
+
+    assert model.rowCount() == 2
+    source = model.index(0, 0)
+    assert model.rowCount(source) == 2
+    data_index = model.index(0, 0, source)
+    assert data_index.data(DataPoolTreeModel.DataIdRole) == data_ids[0]
+    assert model.index(0, 0, data_index).data().startswith("Subscriber ID: sub")
+
+
+def test_refresh_only_signals_changed_rows(pool, signals):
+    data_ids = signals(50, num_samples=None, sources=SOURCES)
+    model = DataPoolTreeModel()
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    model.refresh(snapshot(pool))
+    fetch_all(model)
+    inserted, changed, removed = [], [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append(parent.data()))
+    model.dataChanged.connect(lambda first, last, roles: changed.append(first.data(DataPoolTreeModel.DataIdRole)))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+
+    pool.unlock_data(data_ids[7])
+    pool.add_subscriber(data_ids[8], "sub")
+    pool.delete_data(data_ids[9])
+    model.refresh(snapshot(pool))
+
+    assert changed == [data_ids[7]]
+    # Donnée sans abonné jamais dépliée : le nouvel abonné attend le fetchMore
+    assert inserted == []
+    assert model.hasChildren(model.node_index(model.data_nodes[data_ids[8]]))
+    assert len(removed) == 1
+    assert data_ids[9] not in model.data_nodes
+
+
+def test_rows_are_fetched_by_pages(pool, signals):
+    data_ids = signals(25, num_samples=None, sources=SOURCES)
+    pool.add_subscriber(data_ids[0], "sub")
+    model = DataPoolTreeModel(page_size=10)
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    model.refresh(snapshot(pool))
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    source = model.index(0, 0)
+    assert model.rowCount(source) == 0 and model.hasChildren(source)
+    model.fetchMore(source)
+    assert model.rowCount(source) == 10 and model.canFetchMore(source)
+    model.fetchMore(source)
+    model.fetchMore(source)
+    assert model.rowCount(source) == 13 and not model.canFetchMore(source)
+
+    data_index = model.index(0, 0, source)
+    assert model.rowCount(data_index) == 0 and model.hasChildren(data_index)
+    model.fetchMore(data_index)
+    assert model.index(0, 0, data_index).data().startswith("Subscriber ID: sub")
+    assert inserted == [(0, 9), (10, 12), (0, 0)]
+
+    # Les lignes non chargées ne sont pas annoncées, celles d'un parent entièrement chargé le sont
+    pool.add_subscriber(data_ids[1], "sub")
+    pool.add_subscriber(data_ids[0], "other")
+    model.refresh(snapshot(pool))
+    assert inserted[3:] == [(1, 1)]
+    assert model.rowCount(data_index) == 2
+
+
+def test_each_subscription_has_its_row(pool, signals):
+    data_ids = signals(1, num_samples=1, sources=SOURCES)
+    for _ in range(2):
+        pool.add_subscriber(data_ids[0], "sub")
+    pool.acknowledge_data(data_ids[0], "sub")
+    model = DataPoolTreeModel()
+    model.refresh(snapshot(pool))
+    fetch_all(model)
+
+    data_index = model.index(0, 0, model.index(0, 0))
+    assert [model.index(row, 0, data_index).data()[-1] for row in range(model.rowCount(data_index))] == ["✔", "✘"]
+
+
+def test_data_rows_are_created_when_their_source_is_expanded(pool, signals):
+    data_ids = signals(4, num_samples=None, sources=SOURCES)
+    model = DataPoolTreeModel()
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    model.refresh(snapshot(pool))
+    model.fetchMore(QModelIndex())
+
+    assert model.rowCount() == 2 and model.data_nodes == {}
+    source = model.index(1, 0)
+    assert model.hasChildren(source)
+    pool.delete_data(data_ids[1])
+    model.refresh(snapshot(pool))
+    model.fetchMore(source)
+
+    assert list(model.data_nodes) == [data_ids[3]]
+    assert model.index(0, 0, source).data(DataPoolTreeModel.DataIdRole) == data_ids[3]
@@ -0,0 +1,40 @@
+import numpy as np
+
+from src.DatapoolVisualizer.decimation import DECIMATION_STRATEGIES, decimate_range, lttb, reduce_min_max
+
+
+def test_reduce_min_max_handles_ragged_tail():
+    samples = np.arange(10.0)
+    mins, maxs = reduce_min_max(samples, 4)
+
+    np.testing.assert_array_equal(mins, [0, 4, 8])
+    np.testing.assert_array_equal(maxs, [3, 7, 9])
+
+
+def test_decimate_range_interleaves_min_and_max():
+    samples = np.array([3.0, -1.0, 5.0, 2.0, 0.0, 4.0])
+    x_indices, y_data = decimate_range(samples, 100, 106, 3)
+
+    np.testing.assert_array_equal(x_indices, [100, 100, 102, 102, 104, 104])
+    np.testing.assert_array_equal(y_data, [-1, 3, 2, 5, 0, 4])
+
+
+def test_m4_keeps_first_min_max_last_of_each_column():
+    samples = np.array([1.0, 5.0, -2.0, 3.0, 0.0, 4.0, -1.0, 2.0])
+    mins, maxs = reduce_min_max(samples, 4)
+    x_data, y_data = DECIMATION_STRATEGIES['m4'].reduce_columns(10.0, 0.5, np.array([0, 4]), 4, mins, maxs,
+                                                                 samples, 2)
+
+    np.testing.assert_array_equal(y_data, [1, -2, 5, 3, 0, -1, 4, 2])
+    np.testing.assert_array_equal(x_data, [10.0, 10.75, 10.75, 11.5, 12.0, 12.75, 12.75, 13.5])
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x_values = np.arange(1000.0)
+    y_values = np.zeros(1000)
+    y_values[500] = 10.0
+    x_data, y_data = lttb(x_values, y_values, 50)
+
+    assert len(x_data) == 50
+    assert (x_data[0], x_data[-1]) == (0.0, 999.0)
+    assert 10.0 in y_data
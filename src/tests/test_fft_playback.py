@@ -0,0 +1,95 @@
+import numpy as np
+from PyDataCore import DataPool, Data_Type
+from PySide6.QtCore import QThreadPool
+
+from src.DatapoolVisualizer.fft_playback import FFTSequence, FramePrefetcher, PlaybackClock
+from src.DatapoolVisualizer.signal_source import SignalSource
+
+
+def make_ffts(timestamps, num_bins=1000):
+    pool = DataPool()
+    ffts_id = pool.register_data(Data_Type.FFTS, "ffts", "test", freq_step=2.0, fmin=10.0, unit="dB")
+    pool.unlock_data(ffts_id)
+    ffts = pool.get_data_info(ffts_id)['data_object'].iloc[0]
+    for i, timestamp in enumerate(timestamps):
+        frame_id = pool.register_data(Data_Type.FREQ_SIGNAL, f"frame{i}", "test", freq_step=2.0, fmin=10.0,
+                                      unit="dB", timestamp=timestamp)
+        pool.store_data(frame_id, np.full(num_bins, i, dtype=np.float32), "test")
+        ffts.add_fft_signal(pool.get_data_info(frame_id)['data_object'].iloc[0])
+    return pool, ffts
+
+
+def test_frames_are_found_by_timestamp():
+    pool, ffts = make_ffts([1.0, 1.5, 3.0])
+    sequence = FFTSequence(ffts, pool, SignalSource())
+
+    assert [sequence.frame_at(t) for t in (0.0, 1.2, 1.5, 2.9, 10.0)] == [0, 0, 1, 1, 2]
+
+
+def test_missing_timestamps_use_default_period():
+    pool, ffts = make_ffts([0.0, 0.0, 0.0])
+    sequence = FFTSequence(ffts, pool, SignalSource())
+
+    np.testing.assert_allclose(sequence.timestamps, [0.0, 0.1, 0.2])
+
+
+def test_frame_is_reduced_to_pixel_width():
+    pool, ffts = make_ffts([0.0, 1.0], num_bins=10_000)
+    sequence = FFTSequence(ffts, pool, SignalSource())
+
+    x_data, y_data = sequence.frame_arrays(1, 0, 10_000, max_points=500)
+
+    assert len(x_data) == len(y_data) == 1000
+    assert x_data[0] == 10.0 and np.all(y_data == 1)
+    # L'axe fréquentiel décimé est réutilisé d'une frame à l'autre
+    assert sequence.frame_arrays(0, 0, 10_000, max_points=500)[0] is x_data
+
+
+def test_clock_keeps_position_on_speed_change():
+    clock = PlaybackClock()
+    clock.set_range(0.0, 10.0)
+    clock.seek(4.0)
+    clock.set_speed(4.0)
+
+    assert clock.position == 4.0 and clock.speed == 4.0
+
+
+class FakePlot:
+    def __init__(self, time_range):
+        self.time_range = time_range
+        self.positions = []
+
+    def playback_range(self):
+        return self.time_range
+
+    def show_position(self, position):
+        self.positions.append(position)
+
+
+def test_shared_clock_spans_and_drives_every_plot():
+    clock = PlaybackClock()
+    first, second, empty = FakePlot((1.0, 3.0)), FakePlot((0.5, 2.0)), FakePlot(None)
+    for plot in (first, second, empty):
+        clock.attach(plot)
+
+    assert (clock.start_time, clock.end_time) == (0.5, 3.0)
+
+    clock.seek(2.5)
+    assert first.positions == second.positions == empty.positions == [2.5]
+
+
+def test_prefetched_frames_are_dropped_with_their_ffts():
+    pool, ffts = make_ffts([0.0, 1.0])
+    other_pool, other = make_ffts([0.0, 1.0])
+    sequence, other_sequence = FFTSequence(ffts, pool, SignalSource()), FFTSequence(other, other_pool, SignalSource())
+    prefetcher = FramePrefetcher(QThreadPool.globalInstance())
+    prefetcher.get(sequence, 0, 0, 1000, 500)
+    prefetcher.get(other_sequence, 0, 0, 1000, 500)
+    key = prefetcher.key(sequence, 1, 0, 1000, 500)
+    prefetcher.pending.add(key)
+
+    prefetcher.clear(ffts.data_id)
+    # Calcul lancé avant le retrait de la FFTS : son résultat n'est pas gardé
+    prefetcher.store(key, sequence.frame_arrays(1, 0, 1000, 500), prefetched=True)
+
+    assert [cached[0] for cached in prefetcher.frames] == [other.data_id]
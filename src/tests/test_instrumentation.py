@@ -0,0 +1,43 @@
+import logging
+
+from src.DatapoolVisualizer.instrumentation import NULL_SPAN, RenderStats, enable_instrumentation, span
+
+
+def test_span_is_a_no_op_when_disabled():
+    enable_instrumentation(False)
+    assert span('decimate', data_id='d') is NULL_SPAN
+
+
+def test_span_logs_duration_and_fields(caplog):
+    enable_instrumentation(True)
+    try:
+        with caplog.at_level(logging.DEBUG, logger='src.DatapoolVisualizer.instrumentation'):
+            with span('decimate', data_id='d') as timing:
+                timing.add(points=12)
+    finally:
+        enable_instrumentation(False)
+    assert timing.elapsed_ms >= 0
+    assert "decimate" in caplog.text and "'points': 12" in caplog.text
+
+
+def test_render_stats_counts_recent_frames():
+    stats = RenderStats(window_seconds=10.0)
+    for _ in range(5):
+        stats.frame()
+    assert stats.fps == 0.5
+    stats.hit_ratio = 0.75
+    assert "75%" in stats.text() and "0 pts" in stats.text()
+
+
+def test_plot_overlay_reports_points_and_samples(signals, widget):
+    data_id, = signals(1, num_samples=300)
+    widget.add_data(data_id)
+
+    widget.set_stats_overlay(True)
+
+    assert widget.stats_timer.isActive()
+    assert widget.render_stats.points == 300
+    assert widget.render_stats.samples_read > 0
+    assert "300 pts" in widget.stats_overlay.textItem.toPlainText()
+    widget.set_stats_overlay(False)
+    assert not widget.stats_overlay.isVisible()
@@ -0,0 +1,37 @@
+from PySide6.QtCore import Qt
+
+from src.DatapoolVisualizer.legend_model import CurveLegendModel
+
+
+def make_model(count):
+    model = CurveLegendModel()
+    for i in range(count):
+        model.add(f"d{i}", f"Signal {i}", 'b')
+    return model
+
+
+def test_entries_are_indexed_by_data_id():
+    model = make_model(12)
+    model.set_colors({'d1': 'red', 'd10': 'green'})
+
+    # "Signal 1" et "Signal 10" ne sont plus confondus
+    assert model.color('d1').name() == '#ff0000' and model.color('d10').name() == '#008000'
+    assert model.data(model.index(10), CurveLegendModel.DataIdRole) == 'd10'
+
+    model.remove('d1')
+    assert model.rowCount() == 11
+    assert model.data(model.index(model.rows['d10']), Qt.DisplayRole) == "Signal 10"
+    assert 'd1' not in model
+
+
+def test_check_box_toggles_visibility():
+    model = make_model(3)
+    changes = []
+    model.visibility_changed.connect(lambda data_id, visible: changes.append((data_id, visible)))
+
+    assert model.setData(model.index(2), Qt.Unchecked.value, Qt.CheckStateRole)
+    model.set_visible('d2', False)
+
+    assert not model.is_visible('d2') and model.is_visible('d0')
+    assert model.data(model.index(2), Qt.CheckStateRole) == Qt.Unchecked
+    assert changes == [('d2', False)]
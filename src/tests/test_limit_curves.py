@@ -0,0 +1,49 @@
+import numpy as np
+from PyDataCore.data import FreqLimitsData
+
+from src.DatapoolVisualizer.limit_curves import LimitCurveCache, clip_polyline, freq_limit_polyline
+
+
+def make_limit(points, interpolation_type):
+    limit = FreqLimitsData('limit', 'limit', 0, 0, 'dB')
+    limit.set_interpolation_type(interpolation_type)
+    for frequency, level in points:
+        limit.add_limit_point(frequency, level)
+    return limit
+
+
+def test_linear_limit_is_its_breakpoints():
+    limit = make_limit([(100.0, 3.0), (10.0, 1.0), (1000.0, 2.0)], 'linear')
+
+    x_data, y_data = freq_limit_polyline(limit)
+
+    np.testing.assert_array_equal(x_data, [10.0, 100.0, 1000.0])
+    np.testing.assert_array_equal(y_data, [1.0, 3.0, 2.0])
+
+
+def test_log_limit_matches_reference_interpolation():
+    limit = make_limit([(10.0, 0.0), (1000.0, 20.0), (5000.0, 5.0)], 'log')
+
+    x_data, y_data = freq_limit_polyline(limit, points_per_segment=16)
+
+    assert len(x_data) == 2 * 16 + 1
+    expected = [limit.interpolate(frequency) for frequency in x_data]
+    np.testing.assert_allclose(y_data, expected, atol=1e-9)
+
+
+def test_clip_extends_end_levels_to_view():
+    x_data, y_data = clip_polyline(np.array([10.0, 20.0, 30.0]), np.array([1.0, 2.0, 3.0]), 0.0, 25.0)
+
+    np.testing.assert_array_equal(x_data, [0.0, 10.0, 20.0, 25.0])
+    np.testing.assert_array_equal(y_data, [1.0, 1.0, 2.0, 2.5])
+
+
+def test_cache_rebuilds_only_on_breakpoint_change():
+    limit = make_limit([(10.0, 1.0), (100.0, 2.0)], 'linear')
+    cache = LimitCurveCache()
+
+    first = cache.get(limit)
+    assert cache.get(limit)[0] is first[0]
+
+    limit.add_limit_point(1000.0, 0.0)
+    assert len(cache.get(limit)[0]) == 3
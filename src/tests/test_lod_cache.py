@@ -0,0 +1,64 @@
+import threading
+
+import numpy as np
+
+from src.DatapoolVisualizer.lod_cache import LodCache, MinMaxPyramid
+
+
+def test_pyramid_levels_match_raw_reduction():
+    samples = np.random.default_rng(0).normal(size=10_000)
+    pyramid = MinMaxPyramid.from_samples(samples, base_level=4, chunk_size=1024)
+
+    for level, (mins, maxs) in pyramid.levels.items():
+        block_size = 1 << level
+        expected_mins = [samples[i:i + block_size].min() for i in range(0, len(samples), block_size)]
+        expected_maxs = [samples[i:i + block_size].max() for i in range(0, len(samples), block_size)]
+        np.testing.assert_array_equal(mins, expected_mins)
+        np.testing.assert_array_equal(maxs, expected_maxs)
+    assert len(pyramid.levels[pyramid.max_level][0]) == 1
+
+
+def test_select_level_keeps_max_points_columns():
+    pyramid = MinMaxPyramid.from_samples(np.zeros(1 << 20), base_level=6)
+
+    assert pyramid.select_level(1 << 20, 500) == 11
+    assert pyramid.select_level(500 * 64, 500) == 6
+    assert pyramid.select_level(500 * 63, 500) is None
+
+    block_starts, mins, _ = pyramid.get_range(11, 0, 1 << 20)
+    assert len(mins) >= 500
+    assert block_starts[1] - block_starts[0] == 1 << 11
+
+
+def test_cache_rebuilds_only_when_sample_count_changes():
+    cache = LodCache(base_level=2)
+    builds = []
+
+    def chunks(samples):
+        builds.append(len(samples))
+        return [samples]
+
+    first = cache.get("id", 16, lambda: chunks(np.arange(16.0)))
+    assert cache.get("id", 16, lambda: chunks(np.arange(16.0))) is first
+    cache.get("id", 32, lambda: chunks(np.arange(32.0)))
+    assert builds == [16, 32]
+
+
+def test_build_does_not_block_cached_signals():
+    cache = LodCache(base_level=2)
+    cached = cache.get("cached", 16, lambda: [np.arange(16.0)])
+    building, release = threading.Event(), threading.Event()
+
+    def slow_chunks():
+        building.set()
+        release.wait(5)
+        return [np.arange(64.0)]
+
+    worker = threading.Thread(target=cache.get, args=("slow", 64, slow_chunks))
+    worker.start()
+    building.wait(5)
+    # Pendant la construction de "slow", la pyramide déjà en cache reste disponible
+    assert cache.get("cached", 16, lambda: [np.arange(16.0)]) is cached
+    release.set()
+    worker.join(5)
+    assert cache.pyramids["slow"].num_samples == 64
@@ -0,0 +1,160 @@
+import numpy as np
+from PySide6.QtCore import Qt
+
+
+def test_add_data_many_matches_add_data(signals, make_widget):
+    data_ids = signals(12)
+    one_by_one = make_widget()
+    for data_id in data_ids:
+        one_by_one.add_data(data_id)
+    batch = make_widget()
+    batch.add_data_many(data_ids + data_ids[:2])
+
+    assert list(batch.curves) == list(one_by_one.curves) == data_ids
+    assert batch.x_min <= 0.0 and batch.x_max >= 111.0
+    for data_id in data_ids:
+        assert batch.curves[data_id].opts['pen'].color().name() == \
+               one_by_one.curves[data_id].opts['pen'].color().name()
+        assert len(batch.curves[data_id].getData()[0]) == len(one_by_one.curves[data_id].getData()[0])
+    # Une seule recherche dans le registre pour tout le lot
+    assert batch.data_resolver.misses == 12
+
+
+def test_add_data_many_skips_displayed_data(signals, widget):
+    data_ids = signals(3)
+    widget.add_data(data_ids[0])
+
+    widget.add_data_many(data_ids)
+
+    assert len(widget.curves) == 3
+    # Teintes réparties sur les 3 courbes
+    assert [curve.opts['pen'].color().name() for curve in widget.curves.values()] == \
+           [widget.generate_color(i, 3).name() for i in range(3)]
+
+
+def test_hidden_curve_is_not_decimated(signals, widget):
+    data_ids = signals(3)
+    widget.add_data_many(data_ids)
+    widget.set_curve_visible(data_ids[1], False)
+    read = widget.signal_source.samples_read
+
+    widget.handle_zoom(None, (10.0, 60.0))
+    widget.wait_for_rendering()
+
+    assert not widget.curves[data_ids[1]].isVisible()
+    assert widget.signal_source.samples_read - read < 2 * 101  # seules les deux courbes visibles sont relues
+    assert widget.legend_model.data(widget.legend_model.index(1), Qt.CheckStateRole) == Qt.Unchecked
+
+    widget.set_curve_visible(data_ids[1], True)
+    assert widget.curves[data_ids[1]].isVisible()
+    assert widget.curves[data_ids[1]].getData()[0][0] >= 10.0 - 50.0
+
+
+def test_remove_data_updates_legend(signals, widget):
+    data_ids = signals(3)
+    widget.add_data_many(data_ids)
+
+    widget.remove_data(data_ids[1])
+    widget.change_curve_color(data_ids[2], rgb_color='#123456')
+
+    assert list(widget.curves) == [data_ids[0], data_ids[2]]
+    assert widget.legend_model.rowCount() == 2
+    assert widget.legend_model.color(data_ids[2]).name() == '#123456'
+    assert widget.curves[data_ids[2]].opts['pen'].color().name() == '#123456'
+
+
+def test_curves_share_one_viewbox_per_unit(signals, widget):
+    volts = signals(50)
+    amperes = signals(2, unit="A", name="Current")
+    widget.add_data_many(volts + amperes)
+
+    assert len(widget.extra_axes) == 2
+    assert {widget.curves[data_id].getViewBox() for data_id in volts} == {widget.unit_axes[('unit', 'V')][1]}
+    assert widget.unit_axes[('unit', 'A')][0].labelText == "A (2 curves)"
+
+    widget.remove_data(amperes[0])
+    assert widget.unit_axes[('unit', 'A')][0].labelText == "Current 1"
+    widget.remove_data(amperes[1])
+    assert list(widget.unit_axes) == [('unit', 'V')] and len(widget.extra_axes) == 1
+
+
+def test_y_axis_grouping_moves_curves_to_one_viewbox(signals, widget):
+    data_ids = signals(2)
+    other_id, = signals(1, unit="A", name="Current")
+    widget.add_data_many(data_ids + [other_id])
+    main_viewbox = widget.plot_widget.plotItem.vb
+
+    widget.toggle_y_axis_grouping()
+    assert {curve.getViewBox() for curve in widget.curves.values()} == {main_viewbox}
+    assert not any(axis.isVisible() for axis, _ in widget.extra_axes)
+
+    widget.toggle_y_axis_grouping()
+    assert widget.curves[other_id].getViewBox() is widget.unit_axes[('unit', 'A')][1]
+    assert widget.curves[data_ids[0]].getViewBox() is widget.unit_axes[('unit', 'V')][1]
+
+
+def test_scope_ticks_render_at_full_resolution(qapp, signals, widget):
+    data_ids = signals(1)
+    widget.resize(1000, 600)
+    widget.show()
+    qapp.processEvents()
+    widget.add_data(data_ids[0])
+    widget.set_scope_mode(True, window_seconds=50.0)
+    widget.scope_timer.stop()
+    widget.wait_for_rendering()
+    trace = widget.scope_traces[data_ids[0]]
+    used = []
+    arrays = trace.arrays
+    trace.arrays = lambda x_min, x_max, max_points: (used.append(max_points), arrays(x_min, x_max, max_points))[1]
+
+    data_object = widget.data_resolver.data_object(data_ids[0])
+    for _ in range(5):
+        data_object.data = np.concatenate((data_object.data, np.zeros(40)))
+        data_object.num_samples = len(data_object.data)
+        widget.update_scope()
+        qapp.processEvents()
+
+    # Aucun rendu grossier d'interaction : chaque tick est dessiné à la largeur du graphique
+    assert used == [widget.pixel_columns()] * 5
+    assert not widget.render_scheduler.pending and not widget.render_scheduler.idle_timer.isActive()
+    widget.set_scope_mode(False)
+
+
+def test_add_data_many_decimates_each_curve_once(qapp, signals, widget):
+    data_ids = signals(10)
+    widget.resize(1000, 600)
+    widget.show()
+    qapp.processEvents()
+    passes = []
+    compute = widget.compute_signal_arrays
+    widget.compute_signal_arrays = lambda *args: (passes.append(args[0].data_id), compute(*args))[1]
+
+    widget.add_data_many(data_ids)
+    widget.wait_for_rendering()
+
+    assert sorted(passes) == sorted(data_ids)
+
+
+def test_shared_axis_stays_next_to_the_unit_axes(signals, widget):
+    data_ids = signals(1)
+    other_id, = signals(1, unit="A", name="Current")
+    widget.add_data_many(data_ids + [other_id])
+    layout = widget.plot_widget.plotItem.layout
+
+    widget.toggle_y_axis_grouping()
+    assert layout.itemAt(2, 5) is widget.shared_axis
+
+    widget.remove_data(other_id)
+    assert layout.itemAt(2, 4) is widget.shared_axis and layout.itemAt(2, 5) is None
+
+
+def test_leaving_scope_mode_restores_the_x_limits(signals, widget):
+    data_ids = signals(1)
+    widget.add_data(data_ids[0])
+    limits = list(widget.plot_widget.plotItem.vb.state['limits']['xLimits'])
+
+    widget.set_scope_mode(True, window_seconds=50.0)
+    assert widget.plot_widget.plotItem.vb.state['limits']['xLimits'] == [None, None]
+    widget.set_scope_mode(False)
+
+    assert widget.plot_widget.plotItem.vb.state['limits']['xLimits'] == limits == [0.0, 100.0]
@@ -0,0 +1,66 @@
+import numpy as np
+from PyDataCore import Data_Type
+
+
+def add_frames(pool, ffts, count, num_bins=64):
+    for i in range(count):
+        frame_id = pool.register_data(Data_Type.FREQ_SIGNAL, f"frame{len(ffts.data)}", "test", freq_step=2.0,
+                                      fmin=10.0, unit="dB", timestamp=len(ffts.data) * 0.1)
+        pool.store_data(frame_id, np.full(num_bins, i, dtype=np.float32), "test")
+        ffts.add_fft_signal(pool.get_data_info(frame_id)['data_object'].iloc[0])
+
+
+def make_ffts(pool, name, frames=3):
+    ffts_id = pool.register_data(Data_Type.FFTS, name, "test", freq_step=2.0, fmin=10.0, unit="dB")
+    pool.unlock_data(ffts_id)
+    ffts = pool.get_data_info(ffts_id)['data_object'].iloc[0]
+    add_frames(pool, ffts, frames)
+    return ffts_id, ffts
+
+
+def test_waterfall_stacks_frames_as_they_arrive(pool, widget):
+    ffts_id, ffts = make_ffts(pool, "ffts")
+    widget.add_data(ffts_id)
+    widget.set_waterfall_mode(True)
+    assert widget.waterfall_timer.isActive()
+    assert widget.waterfall_image.image.shape[0] == 3
+
+    add_frames(pool, ffts, 2)
+    widget.waterfall_timer.timeout.emit()
+
+    assert widget.waterfall_image.image.shape[0] == 5
+    widget.set_waterfall_mode(False)
+    assert not widget.waterfall_timer.isActive()
+
+
+def test_removing_the_waterfall_ffts_moves_the_view_to_the_remaining_one(pool, widget):
+    first_id, _ = make_ffts(pool, "first", frames=2)
+    second_id, _ = make_ffts(pool, "second", frames=4)
+    widget.add_data_many([first_id, second_id])
+    widget.set_waterfall_mode(True)
+    assert widget.waterfall_image.image.shape[0] == 4
+
+    widget.remove_data(second_id)
+
+    assert widget.fft_data.data_id == first_id and widget.fft_curve is widget.curves[first_id]
+    assert widget.waterfall_image.getViewBox() is widget.fft_curve.getViewBox()
+    assert widget.waterfall_image.image.shape[0] == 2
+    widget.display_signal(first_id)
+
+    widget.remove_data(first_id)
+    assert widget.fft_data is None and widget.waterfall_image is None
+    assert not widget.waterfall_mode and not widget.waterfall_timer.isActive()
+    widget.set_waterfall_mode(True)
+
+
+def test_waterfall_image_follows_its_curve_through_y_axis_grouping(pool, widget):
+    ffts_id, _ = make_ffts(pool, "ffts")
+    widget.add_data(ffts_id)
+    widget.toggle_y_axis_grouping()
+    widget.set_waterfall_mode(True)
+    assert widget.waterfall_image.getViewBox() is widget.plot_widget.plotItem.vb
+
+    widget.toggle_y_axis_grouping()
+
+    assert widget.waterfall_image.getViewBox() is widget.fft_curve.getViewBox()
+    assert widget.fft_curve.getViewBox() is widget.unit_axes[('ffts', ffts_id)][1]
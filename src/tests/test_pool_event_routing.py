@@ -0,0 +1,67 @@
+import numpy as np
+from PyDataCore import Data_Type
+
+from src.DatapoolVisualizer.plot_controler import PlotController
+from src.DatapoolVisualizer.pool_events import PoolEvent
+
+
+def make_controller(pool, base_level=10):
+    controller = PlotController(pool)
+    controller.lod_cache.base_level = base_level
+    controller.add_plot()
+    plot = controller.plots[0]
+    plot.async_rendering = False
+    plot.selected = True
+    return controller, plot
+
+
+def store_again(pool, data_id, samples):
+    pool.lock_data(data_id)
+    pool.store_data(data_id, samples, "source")
+    return [PoolEvent(PoolEvent.LOCKED, data_id), PoolEvent(PoolEvent.STORED, data_id, "source")]
+
+
+def test_signal_stored_again_with_same_length_is_redrawn(pool):
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "s", "source", time_step=1.0, unit="V")
+    pool.store_data(data_id, np.zeros(1 << 16), "source")
+    controller, plot = make_controller(pool, base_level=2)
+    controller.add_data_to_selected_plot(data_id)
+    assert data_id in controller.lod_cache.pyramids
+
+    events = store_again(pool, data_id, np.full(1 << 16, 5.0))
+    controller.apply_pool_events(events)
+
+    assert np.all(plot.curves[data_id].getData()[1] == 5.0)
+
+
+def test_tiles_of_a_signal_stored_again_are_recomputed(pool):
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "s", "source", time_step=1.0, unit="V")
+    pool.store_data(data_id, np.zeros(1 << 16), "source")
+    controller, plot = make_controller(pool)
+    controller.add_data_to_selected_plot(data_id)
+    # Vue trop fine pour la pyramide : colonnes servies par le cache de tuiles
+    assert any(key[0] == data_id for key in controller.tile_cache.tiles)
+
+    events = store_again(pool, data_id, np.full(1 << 16, 5.0))
+    controller.apply_pool_events(events)
+
+    assert np.all(plot.curves[data_id].getData()[1] == 5.0)
+
+
+def test_removed_data_is_dropped_from_every_cache(pool):
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "s", "source", time_step=1.0, unit="V")
+    pool.store_data(data_id, np.zeros(1 << 16), "source")
+    controller, plot = make_controller(pool, base_level=2)
+    controller.add_data_to_selected_plot(data_id)
+    # Niveau 1, sous la pyramide : colonnes servies par le cache de tuiles
+    plot.display_signal(data_id, max_points=20_000)
+    assert data_id in controller.data_resolver.handles and data_id in controller.signal_source.views
+    assert any(key[0] == data_id for key in controller.tile_cache.tiles)
+
+    pool.delete_data(data_id)
+    controller.apply_pool_events([PoolEvent(PoolEvent.REMOVED, data_id)])
+
+    assert data_id not in controller.data_resolver.handles
+    assert data_id not in controller.signal_source.views
+    assert data_id not in controller.lod_cache.pyramids
+    assert not any(key[0] == data_id for key in controller.tile_cache.tiles)
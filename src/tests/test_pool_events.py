@@ -0,0 +1,53 @@
+from PyDataCore import Data_Type
+
+from src.DatapoolVisualizer.datapool_viewer import DataPoolNotifier
+from src.DatapoolVisualizer.pool_events import PoolEvent
+
+
+def make_notifier(pool):
+    notifier = DataPoolNotifier()
+    notifier.attach_to_pool(pool)
+    flushes = []
+    notifier.events_flushed.connect(flushes.append)
+    return notifier, flushes
+
+
+def test_burst_is_delivered_in_one_flush(pool):
+    notifier, flushes = make_notifier(pool)
+    refreshes = []
+    notifier.data_changed.connect(lambda: refreshes.append(True))
+    data_ids = [pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"s{i}", "source", time_step=1.0, unit="V")
+                for i in range(200)]
+
+    notifier.flush()
+
+    assert len(flushes) == len(refreshes) == 1
+    assert [event.data_id for event in flushes[0]] == data_ids
+    assert {event.kind for event in flushes[0]} == {PoolEvent.REGISTERED}
+    assert flushes[0][0].source_id == "source"
+
+
+def test_events_are_typed_and_deduplicated(pool):
+    notifier, flushes = make_notifier(pool)
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "s", "source", time_step=1.0, unit="V")
+    pool.add_subscriber(data_id, "sub")
+    pool.store_data(data_id, [1.0, 2.0], "source")
+    pool.lock_data(data_id)
+    pool.unlock_data(data_id)
+    pool.delete_data(data_id)
+
+    notifier.flush()
+
+    assert [event.kind for event in flushes[0]] == [
+        PoolEvent.REGISTERED, PoolEvent.SUBSCRIBED, PoolEvent.STORED, PoolEvent.LOCKED, PoolEvent.UNLOCKED,
+        PoolEvent.REMOVED]
+    assert flushes[0][1].subscriber_id == "sub"
+
+
+def test_flush_waits_for_event_loop(pool):
+    notifier, flushes = make_notifier(pool)
+    pool.register_data(Data_Type.TEMPORAL_SIGNAL, "s", "source", time_step=1.0, unit="V")
+    assert flushes == []
+
+    notifier.flush_timer.timeout.emit()
+    assert len(flushes) == 1
@@ -0,0 +1,94 @@
+from PyDataCore import Data_Type
+
+from src.DatapoolVisualizer.pool_events import PoolEvent
+from src.DatapoolVisualizer.registry_index import RegistryIndex
+
+SOURCES = ("source0", "source1")
+
+
+def assert_same(index, pool):
+    rebuilt = RegistryIndex.from_pool(pool)
+    assert index.data_rows == rebuilt.data_rows
+    assert index.source_rows == rebuilt.source_rows
+    assert index.source_data == rebuilt.source_data
+    assert index.subscribers == rebuilt.subscribers
+
+
+def test_rebuild_groups_registries(pool, signals):
+    data_ids = signals(4, num_samples=None, sources=SOURCES)
+    pool.add_subscriber(data_ids[1], "sub")
+
+    index = RegistryIndex.from_pool(pool)
+
+    assert index.data_of_source("source0") == [data_ids[0], data_ids[2]]
+    assert index.source_of(data_ids[3]) == "source1"
+    assert index.data_rows[data_ids[2]]['data_name'] == "Signal 2"
+    assert index.data_object(data_ids[0]) is pool.data_registry['data_object'].iloc[0]
+    assert index.is_locked(data_ids[0])
+    assert list(index.subscribers[data_ids[1]]) == ["sub"]
+    assert index.data_object("missing") is None
+
+
+def test_events_keep_index_in_sync(pool, signals):
+    data_ids = signals(4, num_samples=None, sources=SOURCES)
+    index = RegistryIndex.from_pool(pool)
+
+    new_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "new", "source2", time_step=1.0, unit="V")
+    pool.add_subscriber(data_ids[0], "sub")
+    pool.store_data(data_ids[1], [1.0, 2.0], "source1")
+    pool.delete_data(data_ids[2])
+    changed = index.apply_events(pool, [
+        PoolEvent(PoolEvent.REGISTERED, new_id, "source2"),
+        PoolEvent(PoolEvent.SUBSCRIBED, data_ids[0], subscriber_id="sub"),
+        PoolEvent(PoolEvent.UNLOCKED, data_ids[1]),
+        PoolEvent(PoolEvent.STORED, data_ids[1], "source1"),
+        PoolEvent(PoolEvent.REMOVED, data_ids[2]),
+    ])
+
+    assert changed == [new_id, data_ids[0], data_ids[1], data_ids[2]]
+    assert_same(index, pool)
+
+
+def test_registered_then_removed_in_same_flush(pool, signals):
+    signals(4, num_samples=None, sources=SOURCES)
+    index = RegistryIndex.from_pool(pool)
+    new_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "new", "source0", time_step=1.0, unit="V")
+    pool.delete_data(new_id)
+
+    index.apply_events(pool, [PoolEvent(PoolEvent.REGISTERED, new_id, "source0"),
+                              PoolEvent(PoolEvent.REMOVED, new_id)])
+
+    assert_same(index, pool)
+
+
+def test_duplicate_subscriptions_match_a_rebuild(pool, signals):
+    data_ids = signals(2, num_samples=1, sources=SOURCES)
+    pool.add_subscriber(data_ids[0], "sub")
+    index = RegistryIndex.from_pool(pool)
+
+    pool.add_subscriber(data_ids[0], "sub")
+    pool.acknowledge_data(data_ids[0], "sub")
+    pool.add_subscriber(data_ids[0], "sub")
+    index.apply_events(pool, [PoolEvent(PoolEvent.SUBSCRIBED, data_ids[0], subscriber_id="sub"),
+                              PoolEvent(PoolEvent.ACKNOWLEDGED, data_ids[0], subscriber_id="sub"),
+                              PoolEvent(PoolEvent.SUBSCRIBED, data_ids[0], subscriber_id="sub")])
+
+    # Comme acknowledge_data : seule la première ligne du couple est acquittée
+    assert index.subscribers[data_ids[0]]["sub"] == [True, 0, 0]
+    assert_same(index, pool)
+
+
+def test_events_on_few_data_are_applied_without_rebuild(pool, signals):
+    data_ids = signals(2, num_samples=1, sources=SOURCES)
+    index = RegistryIndex.from_pool(pool)
+    index.rebuild = None  # une reconstruction échouerait
+
+    events = []
+    for _ in range(150):
+        pool.lock_data(data_ids[0])
+        pool.store_data(data_ids[0], [1.0], "source0")
+        events += [PoolEvent(PoolEvent.LOCKED, data_ids[0]), PoolEvent(PoolEvent.STORED, data_ids[0], "source0")]
+
+    assert index.apply_events(pool, events) == [data_ids[0]]
+    del index.rebuild
+    assert_same(index, pool)
@@ -0,0 +1,50 @@
+from src.DatapoolVisualizer.render_scheduler import RenderScheduler
+
+
+class FakePlot:
+    max_points = 500
+    last_render_ms = 0.0
+
+    def __init__(self):
+        self.renders = []
+
+    def pixel_columns(self):
+        return self.max_points
+
+    def render_curves(self, max_points=None):
+        self.renders.append(max_points)
+
+
+def test_bursts_are_coalesced_into_one_frame():
+    scheduler = RenderScheduler()
+    plots = [FakePlot(), FakePlot()]
+    for _ in range(50):
+        for plot in plots:
+            scheduler.request_render(plot)
+
+    scheduler.render_frame()
+
+    assert [plot.renders for plot in plots] == [[250], [250]]
+
+
+def test_refine_renders_full_resolution_once():
+    scheduler = RenderScheduler()
+    plot = FakePlot()
+    scheduler.request_render(plot)
+    scheduler.render_frame()
+    scheduler.frame_timer.stop()
+    scheduler.refine()
+    scheduler.refine()
+
+    assert plot.renders == [250, None]
+
+
+def test_slow_frames_degrade_level_of_detail():
+    scheduler = RenderScheduler(latency_budget_ms=10)
+    plot = FakePlot()
+    plot.last_render_ms = 50.0
+    for _ in range(5):
+        scheduler.request_render(plot)
+        scheduler.render_frame()
+
+    assert plot.renders[-1] == plot.max_points >> RenderScheduler.MAX_COARSE_LEVEL
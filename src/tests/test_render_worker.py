@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.DatapoolVisualizer.render_worker import DecimationSignals, DecimationTask
+
+
+def test_stale_task_is_not_computed():
+    computed, results = [], []
+    signals = DecimationSignals()
+    signals.finished.connect(results.append)
+
+    DecimationTask("d", 1, lambda: computed.append(1), signals, lambda data_id, generation: False).run()
+
+    assert computed == [] and results == []
+
+
+def test_only_the_latest_generation_reaches_the_curve(qapp, signals, widget):
+    data_id, = signals(1, num_samples=100_000)
+    widget.async_rendering = True
+    widget.add_data(data_id)
+    widget.wait_for_rendering()
+    curve = widget.curves[data_id]
+    previous = curve.getData()[0].copy()
+
+    widget.async_rendering = False
+    widget.display_signal(data_id, curve, max_points=100)
+    expected = curve.getData()[0].copy()
+    curve.setData(previous, np.zeros(len(previous)))
+    widget.async_rendering = True
+
+    applied = []
+    set_data = curve.setData
+    curve.setData = lambda x_data, y_data, **kwargs: (applied.append(len(x_data)), set_data(x_data, y_data, **kwargs))
+    widget.display_signal(data_id, curve, max_points=50)
+    widget.display_signal(data_id, curve, max_points=100)
+    # Tant que les résultats ne sont pas appliqués, la courbe précédente reste affichée
+    np.testing.assert_array_equal(curve.getData()[0], previous)
+
+    widget.thread_pool.waitForDone()
+    qapp.processEvents()
+
+    assert applied == [len(expected)]
+    np.testing.assert_array_equal(curve.getData()[0], expected)
@@ -0,0 +1,70 @@
+import numpy as np
+
+from src.DatapoolVisualizer.scope import RingBuffer, ScopeTrace
+from src.DatapoolVisualizer.signal_source import SignalSource
+
+
+class GrowingSignal:
+    def __init__(self):
+        self.data_id = 'growing'
+        self.in_file = False
+        self.sample_type = 'float32'
+        self.data = np.empty(0, dtype=np.float32)
+        self.num_samples = 0
+
+    def append(self, samples):
+        self.data = np.concatenate((self.data, np.asarray(samples, dtype=np.float32)))
+        self.num_samples = len(self.data)
+
+
+def test_ring_buffer_keeps_last_samples_contiguous():
+    ring = RingBuffer(5)
+    ring.extend([1, 2, 3])
+    ring.extend([4, 5, 6, 7])
+
+    np.testing.assert_array_equal(ring.view(), [3, 4, 5, 6, 7])
+    assert ring.view().base is ring.buffer
+
+    ring.extend(np.arange(100, 112))
+    np.testing.assert_array_equal(ring.view(), np.arange(107, 112))
+
+
+def test_trace_ingests_only_appended_samples():
+    signal, source = GrowingSignal(), SignalSource()
+    trace = ScopeTrace(tmin=0.0, dt=1.0, window_seconds=100, columns=10)
+
+    signal.append(np.arange(30))
+    assert trace.ingest(signal, source) == 30
+    signal.append(np.arange(30, 250))
+    assert trace.ingest(signal, source) == 220
+    assert trace.ingest(signal, source) == 0
+
+    np.testing.assert_array_equal(trace.samples.view(), np.arange(150, 250))
+    assert trace.end_time == 250.0
+
+
+def test_trace_columns_match_full_reduction():
+    signal, source = GrowingSignal(), SignalSource()
+    trace = ScopeTrace(tmin=0.0, dt=1.0, window_seconds=1000, columns=100)
+    values = np.random.default_rng(0).normal(size=5000).astype(np.float32)
+    for chunk in np.array_split(values, 37):
+        signal.append(chunk)
+        trace.ingest(signal, source)
+
+    x_data, y_data = trace.arrays(4000.0, 5000.0, max_points=100)
+
+    starts = x_data[0::2].astype(int)
+    np.testing.assert_array_equal(y_data[0::2], [values[s:s + 10].min() for s in starts])
+    np.testing.assert_array_equal(y_data[1::2], [values[s:s + 10].max() for s in starts])
+
+
+def test_trace_restarts_when_signal_shrinks():
+    signal, source = GrowingSignal(), SignalSource()
+    trace = ScopeTrace(tmin=0.0, dt=1.0, window_seconds=100)
+    signal.append(np.arange(50))
+    trace.ingest(signal, source)
+
+    signal.data, signal.num_samples = np.arange(10, dtype=np.float32), 10
+    trace.ingest(signal, source)
+
+    np.testing.assert_array_equal(trace.samples.view(), np.arange(10))
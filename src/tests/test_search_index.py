@@ -0,0 +1,70 @@
+from PyDataCore import Data_Type
+
+from src.DatapoolVisualizer.datapool_viewer import DataPoolViewerWidget
+from src.DatapoolVisualizer.pool_events import PoolEvent
+from src.DatapoolVisualizer.registry_index import RegistryIndex
+from src.DatapoolVisualizer.search_index import SearchIndex
+
+
+def register(pool):
+    return [pool.register_data(Data_Type.TEMPORAL_SIGNAL, name, source, time_step=1.0, unit="V")
+            for name, source in (("Accel_X", "bench"), ("accel_y", "bench"), ("pressure", "tank"))]
+
+
+def test_substring_and_prefix_search(pool):
+    data_ids = register(pool)
+    index = SearchIndex()
+    index.rebuild(RegistryIndex.from_pool(pool))
+
+    assert index.search("ACCEL") == data_ids[:2]
+    assert index.search("cel_x") == data_ids[:1]
+    assert index.search("tank") == data_ids[2:]
+    assert index.search("temporal") == data_ids
+    assert index.search(data_ids[1][:8], prefix=True) == [data_ids[1]]
+    assert index.search("cel", prefix=True) == []
+    assert index.search("  ") == data_ids
+
+
+def test_index_follows_pool_events(pool):
+    data_ids = register(pool)
+    registry_index = RegistryIndex.from_pool(pool)
+    index = SearchIndex()
+    index.rebuild(registry_index)
+    assert index.search("accel") == data_ids[:2]
+
+    new_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "accel_z", "bench", time_step=1.0, unit="V")
+    pool.delete_data(data_ids[0])
+    changed = registry_index.apply_events(pool, [PoolEvent(PoolEvent.REGISTERED, new_id, "bench"),
+                                                 PoolEvent(PoolEvent.REMOVED, data_ids[0])])
+    index.update(registry_index, changed)
+
+    assert index.search("accel") == [data_ids[1], new_id]
+    assert index.search("accel_", prefix=True) == [data_ids[1], new_id]
+    assert len(index.tokens) == 4 * len(index)
+
+
+def test_viewer_shows_search_results(pool):
+    data_ids = register(pool)
+    widget = DataPoolViewerWidget(pool.data_registry, pool.source_to_data, pool.subscriber_to_data)
+
+    widget.search_edit.setText("press")
+    assert widget.tree_view.model() is widget.results_model
+    assert list(widget.results_model.entries) == [data_ids[2]]
+    assert widget.search_label.text() == "1 result(s)"
+
+    widget.search_edit.clear()
+    assert widget.tree_view.model() is widget.model
+
+
+def test_viewer_updates_the_search_index_when_the_tree_is_rebuilt(pool):
+    data_ids = register(pool)
+    widget = DataPoolViewerWidget(pool.data_registry, pool.source_to_data, pool.subscriber_to_data)
+    widget.search_index.rebuild = None  # une reconstruction échouerait
+    new_ids = [pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"accel_{i}", "bench", time_step=1.0, unit="V")
+               for i in range(150)]
+
+    # Plus de RegistryIndex.REBUILD_MIN données touchées : l'index des registres est reconstruit
+    widget.apply_events(pool, [PoolEvent(PoolEvent.REGISTERED, data_id, "bench") for data_id in new_ids])
+
+    assert widget.search_index.search("accel") == data_ids[:2] + new_ids
+    assert len(widget.model.entries) == 153
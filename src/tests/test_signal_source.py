@@ -0,0 +1,32 @@
+import numpy as np
+from PyDataCore import DataPool, Data_Type
+
+from src.DatapoolVisualizer.signal_source import SignalSource
+
+
+def test_file_backed_signal_is_memory_mapped(tmp_path):
+    data_pool = DataPool()
+    data_id = data_pool.register_data(Data_Type.TEMPORAL_SIGNAL, "file_signal", "source", False, True,
+                                      time_step=0.001, unit="V")
+    samples = np.arange(5000, dtype=np.float32)
+    data_pool.store_data(data_id, samples, "source", str(tmp_path))
+    data_object = data_pool.get_data_info(data_id)['data_object'].iloc[0]
+
+    source = SignalSource()
+    view = source.samples(data_object)
+
+    assert isinstance(view, np.memmap)
+    assert source.samples(data_object) is view
+    np.testing.assert_array_equal(source.read_range(data_object, 100, 110), samples[100:110])
+    np.testing.assert_array_equal(np.concatenate(list(source.iter_chunks(data_object, chunk_size=1024))), samples)
+
+
+def test_ram_signal_is_not_copied():
+    data_pool = DataPool()
+    data_id = data_pool.register_data(Data_Type.FREQ_SIGNAL, "ram_signal", "source", False, False,
+                                      freq_step=1.0, unit="dB")
+    samples = np.linspace(0, 1, 100)
+    data_pool.store_data(data_id, samples, "source")
+    data_object = data_pool.get_data_info(data_id)['data_object'].iloc[0]
+
+    assert np.shares_memory(SignalSource().read_range(data_object, 10, 20), samples)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from src.DatapoolVisualizer.decimation import reduce_min_max
+from src.DatapoolVisualizer.tile_cache import TileCache
+
+
+def make_tile_computer(samples, level, tile_columns, computed):
+    block_size = 1 << level
+
+    def compute_tile(tile_index):
+        computed.append(tile_index)
+        start = tile_index * tile_columns * block_size
+        return reduce_min_max(samples[start:start + tile_columns * block_size], block_size)
+
+    return compute_tile
+
+
+def test_pan_only_computes_new_tiles():
+    samples = np.random.default_rng(1).normal(size=100_000)
+    cache = TileCache(tile_columns=64)
+    computed = []
+    compute_tile = make_tile_computer(samples, 3, 64, computed)
+
+    mins, maxs = cache.get_columns("id", len(samples), 3, 100, 600, compute_tile)
+    expected_mins, expected_maxs = reduce_min_max(samples, 8)
+    np.testing.assert_array_equal(mins, expected_mins[100:600])
+    np.testing.assert_array_equal(maxs, expected_maxs[100:600])
+    assert computed == list(range(1, 10))
+
+    cache.get_columns("id", len(samples), 3, 150, 650, compute_tile)
+    assert computed[9:] == [10]
+    assert cache.stats()['hits'] == 8
+
+
+def test_budget_evicts_least_recently_used_tiles():
+    samples = np.zeros(1 << 16)
+    cache = TileCache(budget_bytes=3 * 2 * 16 * 8, tile_columns=16)
+    computed = []
+    compute_tile = make_tile_computer(samples, 0, 16, computed)
+
+    for tile_index in range(5):
+        cache.get_columns("id", len(samples), 0, tile_index * 16, tile_index * 16 + 16, compute_tile)
+
+    stats = cache.stats()
+    assert stats['tiles'] == 3
+    assert stats['evictions'] == 2
+    assert ("id", 0, 0) not in cache.tiles and ("id", 0, 4) in cache.tiles
+
+
+def test_growing_signal_drops_its_tiles():
+    cache = TileCache(tile_columns=4)
+    computed = []
+    compute_tile = make_tile_computer(np.arange(64.0), 1, 4, computed)
+
+    cache.get_columns("id", 64, 1, 0, 8, compute_tile)
+    cache.get_columns("id", 80, 1, 0, 8, compute_tile)
+    assert computed == [0, 1, 0, 1]
@@ -0,0 +1,22 @@
+from src.DatapoolVisualizer.viewport import map_viewport
+
+
+def test_viewport_uses_signal_offset():
+    window = map_viewport(105.0, 106.0, x0=100.0, step=0.01, num_samples=10_000)
+
+    assert (window.start_index, window.end_index) == (500, 601)
+
+
+def test_viewport_is_clipped_to_signal_extent():
+    window = map_viewport(0.0, 1000.0, x0=100.0, step=1.0, num_samples=50)
+
+    assert (window.start_index, window.end_index) == (0, 50)
+    assert window.view_samples == 1001
+
+    assert map_viewport(0.0, 10.0, x0=100.0, step=1.0, num_samples=50).is_empty
+
+
+def test_overscan_extends_read_window():
+    window = map_viewport(10.0, 20.0, x0=0.0, step=1.0, num_samples=100, overscan=0.5)
+
+    assert (window.start_index, window.end_index) == (4, 27)
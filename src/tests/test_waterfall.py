@@ -0,0 +1,31 @@
+import numpy as np
+
+from src.DatapoolVisualizer.waterfall import WaterfallBuffer
+
+
+def test_buffer_grows_by_doubling_and_keeps_rows():
+    buffer = WaterfallBuffer(num_bins=4, initial_frames=2)
+    for i in range(5):
+        buffer.append(np.full(4, i, dtype=np.float32))
+
+    assert buffer.image.shape == (5, 4)
+    assert len(buffer.frames) == 8
+    np.testing.assert_array_equal(buffer.image[:, 0], [0, 1, 2, 3, 4])
+    assert buffer.levels == (0.0, 4.0)
+
+
+def test_sync_only_loads_new_frames():
+    frames = {'a': np.arange(3.0), 'b': np.arange(3.0) + 10, 'c': np.arange(2.0)}
+    loaded = []
+
+    def load_frame(data_id):
+        loaded.append(data_id)
+        return frames[data_id]
+
+    buffer = WaterfallBuffer(num_bins=3)
+    assert buffer.sync(['a', 'b'], load_frame) == 2
+    assert buffer.sync(['a', 'b', 'c'], load_frame) == 1
+
+    assert loaded == ['a', 'b', 'c']
+    # Une frame plus courte est complétée par des NaN
+    assert np.isnan(buffer.image[2, 2])